@@ -1,6 +1,6 @@
 import os
 import logging
-from flask import Flask
+from flask import Flask, Request
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
 from werkzeug.middleware.proxy_fix import ProxyFix
@@ -13,8 +13,29 @@ class Base(DeclarativeBase):
 
 db = SQLAlchemy(model_class=Base)
 
+def begin_savepoint():
+    """db.session.begin_nested() that stays inside the session's transaction
+
+    pysqlite only emits BEGIN before DML, so a SAVEPOINT issued first starts
+    the transaction itself and releasing it commits, whatever the session
+    does afterwards. Open the transaction explicitly in that case.
+    """
+    connection = db.session.connection()
+    if connection.dialect.driver == 'pysqlite' and not connection.connection.driver_connection.in_transaction:
+        connection.exec_driver_sql('BEGIN')
+    return db.session.begin_nested()
+
+class UploadRequest(Request):
+    """Request class allowing larger bodies for archive uploads only"""
+    @property
+    def max_content_length(self):
+        if self.endpoint == 'upload_archive':
+            return app.config['MAX_ARCHIVE_CONTENT_LENGTH']
+        return super().max_content_length
+
 # Create the app
 app = Flask(__name__)
+app.request_class = UploadRequest
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key-change-in-production")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
@@ -27,7 +48,14 @@ app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
 
 # File upload configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_ARCHIVE_CONTENT_LENGTH'] = int(os.environ.get('MAX_ARCHIVE_CONTENT_LENGTH', 512 * 1024 * 1024))  # ZIP / tar.gz uploads
 app.config['UPLOAD_FOLDER'] = 'uploads'
+# Uploads are parsed in memory; keeping the original file is optional
+app.config['PERSIST_UPLOADS'] = os.environ.get('PERSIST_UPLOADS', 'true').lower() != 'false'
+
+# NLP batch processing configuration
+app.config['NLP_BATCH_SIZE'] = int(os.environ.get('NLP_BATCH_SIZE', 32))
+app.config['NLP_N_PROCESS'] = int(os.environ.get('NLP_N_PROCESS', os.cpu_count() or 1))
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -39,6 +67,11 @@ with app.app_context():
     # Import models to ensure tables are created
     import models
     db.create_all()
+    
+    # Add columns and indexes introduced since the database was created
+    if os.environ.get('SCHEMA_AUTO_UPGRADE', 'true').lower() != 'false':
+        from migrations import upgrade_schema
+        upgrade_schema()
 
 # Import routes
 import routes
@@ -0,0 +1,152 @@
+"""
+Streaming reader for ZIP / tar.gz resume archives
+Members are yielded one at a time as bytes, never extracted to disk, with
+per-member size limits and compression-ratio checks against zip bombs.
+"""
+
+import os
+import logging
+import tarfile
+import zipfile
+
+from utils import allowed_file
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar.gz', '.tgz', '.tar')
+
+_READ_CHUNK = 64 * 1024
+
+
+class ArchiveError(ValueError):
+    """Archive is unreadable or exceeds the configured safety limits"""
+
+
+def is_archive(filename):
+    """Check if the filename looks like a supported archive"""
+    return filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+class ArchiveLimits:
+    """Safety limits applied while streaming archive members"""
+
+    def __init__(self, max_member_size=16 * 1024 * 1024, max_ratio=100,
+                 max_members=5000, max_total_size=2 * 1024 * 1024 * 1024):
+        self.max_member_size = max_member_size
+        self.max_ratio = max_ratio
+        self.max_members = max_members
+        self.max_total_size = max_total_size
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_member_size=int(os.environ.get('ARCHIVE_MAX_MEMBER_SIZE', 16 * 1024 * 1024)),
+            max_ratio=int(os.environ.get('ARCHIVE_MAX_RATIO', 100)),
+            max_members=int(os.environ.get('ARCHIVE_MAX_MEMBERS', 5000)),
+            max_total_size=int(os.environ.get('ARCHIVE_MAX_TOTAL_SIZE', 2 * 1024 * 1024 * 1024))
+        )
+
+
+def _read_bounded(stream, limit):
+    """Read at most limit bytes; None if the stream holds more (headers can lie)"""
+    chunks = []
+    size = 0
+    while True:
+        chunk = stream.read(_READ_CHUNK)
+        if not chunk:
+            return b''.join(chunks)
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+
+
+def iter_archive_members(fileobj, archive_name, archive_size, limits):
+    """Yield (member_name, content, error) for each resume in the archive
+
+    ``content`` is the member's bytes, or None with ``error`` explaining why
+    the member was skipped. Raises ArchiveError when the archive as a whole
+    is unreadable or blows past the total size / ratio budget.
+    """
+    # Total decompressed budget, bounded by the archive-wide compression ratio
+    budget = min(limits.max_total_size, max(archive_size, 1) * limits.max_ratio)
+
+    if archive_name.lower().endswith('.zip'):
+        members = _iter_zip_members(fileobj, limits)
+    else:
+        members = _iter_tar_members(fileobj, archive_name, limits)
+
+    total_size = 0
+    member_count = 0
+    for name, content, error in members:
+        member_count += 1
+        if member_count > limits.max_members:
+            raise ArchiveError(f"Archive has more than {limits.max_members} resumes")
+        if content is not None:
+            total_size += len(content)
+            if total_size > budget:
+                raise ArchiveError("Archive expands beyond the allowed total size")
+        yield name, content, error
+
+
+def _iter_zip_members(fileobj, limits):
+    try:
+        archive = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(f"Invalid ZIP archive: {str(e)}")
+
+    with archive:
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or not _is_resume_member(name):
+                continue
+            if info.file_size > limits.max_member_size:
+                yield name, None, "File exceeds the per-file size limit"
+                continue
+            if info.compress_size and info.file_size / info.compress_size > limits.max_ratio:
+                yield name, None, "Suspicious compression ratio"
+                continue
+            try:
+                with archive.open(info) as member:
+                    content = _read_bounded(member, limits.max_member_size)
+            except Exception as e:
+                logging.error(f"Error reading archive member {name}: {str(e)}")
+                yield name, None, str(e)
+                continue
+            if content is None:
+                yield name, None, "File exceeds the per-file size limit"
+                continue
+            yield name, content, None
+
+
+def _iter_tar_members(fileobj, archive_name, limits):
+    # Stream mode: members are read sequentially without seeking
+    mode = 'r|' if archive_name.lower().endswith('.tar') else 'r|gz'
+    try:
+        archive = tarfile.open(fileobj=fileobj, mode=mode)
+    except tarfile.TarError as e:
+        raise ArchiveError(f"Invalid tar archive: {str(e)}")
+
+    with archive:
+        try:
+            for info in archive:
+                name = info.name
+                if not info.isfile() or not _is_resume_member(name):
+                    continue
+                if info.size > limits.max_member_size:
+                    yield name, None, "File exceeds the per-file size limit"
+                    continue
+                member = archive.extractfile(info)
+                content = _read_bounded(member, limits.max_member_size) if member else None
+                if content is None:
+                    yield name, None, "File exceeds the per-file size limit"
+                    continue
+                yield name, content, None
+        except tarfile.TarError as e:
+            raise ArchiveError(f"Corrupt tar archive: {str(e)}")
+
+
+def _is_resume_member(name):
+    basename = os.path.basename(name)
+    # Skip macOS resource forks and hidden files
+    if not basename or basename.startswith('.') or '__MACOSX/' in name:
+        return False
+    return allowed_file(basename)
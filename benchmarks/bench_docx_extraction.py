@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark: streaming DOCX extraction vs. the python-docx object model
+
+Usage: python benchmarks/bench_docx_extraction.py [resume.docx ...] [--repeat N]
+Defaults to the .docx files in uploads/.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from document_parser import DocumentParser
+
+
+def measure(func, files, repeat):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in files:
+            func(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('files', nargs='*', help='DOCX files to benchmark with')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(ROOT, 'uploads', '*.docx')))
+    if not files:
+        sys.exit("No .docx files found")
+
+    document_parser = DocumentParser()
+    paths = [
+        ('python-docx object model', document_parser._extract_from_docx_document_model),
+        ('streaming document.xml', document_parser._extract_from_docx),
+    ]
+
+    results = {}
+    for label, func in paths:
+        func(files[0])  # warm imports
+        elapsed, peak = measure(func, files, args.repeat)
+        results[label] = elapsed
+        per_doc = elapsed / (args.repeat * len(files)) * 1000
+        print(f"{label:<26} {per_doc:8.2f} ms/doc  peak {peak / 1024:8.1f} KiB")
+
+    before, after = results[paths[0][0]], results[paths[1][0]]
+    print(f"speedup: {before / after:.2f}x over {len(files)} file(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing queries before and after the ranking schema indexes
+
+Seeds a database with N match scores (one candidate each, spread over jobs)
+plus appointments, drops the secondary indexes to get the original schema,
+times the listing queries from routes.py, creates the indexes with the
+schema upgrade and times them again. Prints the ranking query plan for both
+schemas and exits non-zero if any query returns different rows afterwards.
+
+Runs on SQLite by default; pass a PostgreSQL URL to benchmark that schema.
+The database must be empty or seeded by a previous run of this script.
+
+Usage: python benchmarks/bench_schema_indexes.py [--matches N] [--jobs J]
+       [--database-url URL] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+REVISION_INDEXES = [
+    'ix_job_description_created_at',
+    'ix_candidate_job_id',
+    'ix_match_score_job_rank',
+    'uq_match_score_candidate_job',
+    'ix_appointment_scheduled_start'
+]
+
+BATCH_SIZE = 10000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--matches', type=int, default=1000000)
+    parser.add_argument('--jobs', type=int, default=200)
+    parser.add_argument('--appointments', type=int, default=20000)
+    parser.add_argument('--database-url')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=3)
+    return parser.parse_args()
+
+
+args = parse_args()
+if not args.database_url:
+    args.database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench_schema.db')
+os.environ['DATABASE_URL'] = args.database_url
+os.environ['SCHEMA_AUTO_UPGRADE'] = 'false'
+os.environ.setdefault('MODEL_LOADING', 'lazy')
+
+from sqlalchemy import insert, select, text
+
+from app import app, db
+from models import Appointment, Candidate, JobDescription, MatchScore
+from candidate_listing import candidate_page, encode_cursor
+from migrations import create_missing_indexes
+
+
+def insert_batches(model, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            db.session.execute(insert(model), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(model), batch)
+
+
+def seed(rng):
+    """Jobs, one candidate per match score, and appointments"""
+    now = datetime.utcnow()
+    insert_batches(JobDescription, ({
+        'id': job_id,
+        'title': f"Job {job_id}",
+        'description': 'Requirements: 3+ years of experience with Python.',
+        'created_at': now - timedelta(seconds=rng.randint(0, 50000000))
+    } for job_id in range(1, args.jobs + 1)))
+
+    job_of = [rng.randint(1, args.jobs) for _ in range(args.matches)]
+    insert_batches(Candidate, ({
+        'id': index + 1,
+        'name': f"Candidate {index}",
+        'filename': f"resume_{index}.pdf",
+        'file_path': '',
+        'extracted_skills': ['python'],
+        'experience_years': rng.randint(0, 15),
+        'job_id': job_of[index]
+    } for index in range(args.matches)))
+
+    insert_batches(MatchScore, ({
+        'id': index + 1,
+        'candidate_id': index + 1,
+        'job_id': job_of[index],
+        # Two decimals, like the engine, so equal scores exercise the id tiebreak
+        'overall_score': round(rng.uniform(0, 100), 2),
+        'skill_match_score': 50.0,
+        'experience_score': 50.0,
+        'education_score': 50.0
+    } for index in range(args.matches)))
+
+    insert_batches(Appointment, ({
+        'candidate_id': rng.randint(1, args.matches),
+        'job_id': rng.randint(1, args.jobs),
+        'interviewer_name': 'Interviewer',
+        'interviewer_email': 'interviewer@example.com',
+        'scheduled_start': now + timedelta(minutes=rng.randint(-100000, 100000)),
+        'scheduled_end': now
+    } for _ in range(args.appointments)))
+    db.session.commit()
+
+
+def drop_revision_indexes():
+    """Back to the original schema: primary keys only"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name in REVISION_INDEXES:
+                index.drop(bind=db.engine, checkfirst=True)
+
+
+def analyze():
+    db.session.execute(text('ANALYZE'))
+    db.session.commit()
+
+
+def ranking_statement(job_id):
+    return select(MatchScore.id, MatchScore.overall_score).join(
+        Candidate, Candidate.id == MatchScore.candidate_id
+    ).where(MatchScore.job_id == job_id).order_by(
+        MatchScore.overall_score.desc(), MatchScore.id.desc()
+    ).limit(51)
+
+
+def query_plan(statement):
+    sql = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+    prefix = 'EXPLAIN QUERY PLAN ' if db.engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    return [' '.join(str(part) for part in row) for row in db.session.execute(text(prefix + sql))]
+
+
+def build_queries(rng):
+    """Named query callables mirroring the listing routes, with fixed arguments"""
+    job_ids = [rng.randint(1, args.jobs) for _ in range(args.repeat)]
+    candidate_ids = [rng.randint(1, args.matches) for _ in range(args.repeat)]
+
+    # Cursor about halfway down each job's ranking, for a deep page
+    cursors = {}
+    for job_id in job_ids:
+        scores = db.session.execute(
+            select(MatchScore.id, MatchScore.overall_score).where(MatchScore.job_id == job_id).order_by(
+                MatchScore.overall_score.desc(), MatchScore.id.desc()
+            )
+        ).all()
+        middle = len(scores) // 2
+        cursors[job_id] = encode_cursor(SimpleNamespace(id=scores[middle].id, overall_score=scores[middle].overall_score), middle)
+
+    def page_ids(page):
+        return [match.id for _, match in page.rows]
+
+    return {
+        'ranking first page': lambda i: page_ids(candidate_page(job_ids[i])),
+        'ranking deep page': lambda i: page_ids(candidate_page(job_ids[i], after=cursors[job_ids[i]])),
+        'candidates of job': lambda i: [row.id for row in db.session.query(Candidate.id).filter_by(
+            job_id=job_ids[i]).order_by(Candidate.id)],
+        'scores of candidate': lambda i: [row.id for row in db.session.query(MatchScore.id).filter_by(
+            candidate_id=candidate_ids[i])],
+        'recent jobs': lambda i: [row.id for row in db.session.query(JobDescription.id).order_by(
+            JobDescription.created_at.desc()).limit(5)],
+        'appointments page': lambda i: [row.id for row in db.session.query(Appointment.id).order_by(
+            Appointment.scheduled_start.desc(), Appointment.id.desc()).limit(50)]
+    }
+
+
+def run_queries(queries):
+    """{name: (median seconds, results)}"""
+    measured = {}
+    for name, query in queries.items():
+        timings = []
+        results = []
+        for i in range(args.repeat):
+            start = time.perf_counter()
+            results.append(query(i))
+            timings.append(time.perf_counter() - start)
+            db.session.rollback()
+        measured[name] = (statistics.median(timings), results)
+    return measured
+
+
+def main():
+    rng = random.Random(args.seed)
+    with app.app_context():
+        drop_revision_indexes()
+        if not db.session.query(MatchScore.id).first():
+            start = time.perf_counter()
+            seed(rng)
+            print(f"seeded {args.matches} match scores in {time.perf_counter() - start:.1f}s")
+        analyze()
+
+        queries = build_queries(rng)
+        sample_job = db.session.query(MatchScore.job_id).first().job_id
+        before_plan = query_plan(ranking_statement(sample_job))
+        before = run_queries(queries)
+
+        start = time.perf_counter()
+        created = create_missing_indexes()
+        analyze()
+        print(f"created {len(created)} indexes in {time.perf_counter() - start:.1f}s")
+
+        after_plan = query_plan(ranking_statement(sample_job))
+        after = run_queries(queries)
+        dialect = db.engine.dialect.name
+
+    print(f"{dialect}, {args.matches} match scores, {args.jobs} jobs, median of {args.repeat}")
+    print(f"{'query':<22} {'before':>10} {'after':>10} {'speedup':>9}")
+    mismatched = []
+    for name in queries:
+        before_seconds, before_results = before[name]
+        after_seconds, after_results = after[name]
+        print(f"{name:<22} {before_seconds * 1000:8.2f}ms {after_seconds * 1000:8.2f}ms "
+              f"{before_seconds / max(after_seconds, 1e-9):8.1f}x")
+        if before_results != after_results:
+            mismatched.append(name)
+
+    print("ranking plan before:")
+    for line in before_plan:
+        print(f"  {line}")
+    print("ranking plan after:")
+    for line in after_plan:
+        print(f"  {line}")
+
+    if mismatched:
+        print(f"PARITY FAILED: {', '.join(mismatched)}")
+        sys.exit(1)
+    print("parity: OK")
+
+
+if __name__ == '__main__':
+    main()
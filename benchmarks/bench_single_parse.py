@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-parse resume analysis vs. the old double spaCy parse
+
+Usage: python benchmarks/bench_single_parse.py [resume.txt ...] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from nlp_processor import NLPProcessor
+
+SAMPLE_RESUME = """John Smith
+john.smith@example.com | Phone: 555-123-4567
+
+Professional Summary
+Senior software engineer with 8 years of experience in Python, Django and AWS.
+Strong leadership, communication and project management background.
+
+Professional Experience
+Acme Corp, Lead Backend Engineer (2018 - 2024)
+Designed microservice architecture, led API development and data analysis work
+using PostgreSQL, Redis, Docker and Kubernetes on AWS.
+
+Globex, Software Developer (2015 - 2018)
+Full stack web development with React, Node.js and MongoDB.
+
+Education
+Bachelor of Science in Computer Science, State University
+
+Skills
+Python, Java, SQL, Git, Jira, Terraform, Pandas, NumPy, scikit-learn
+"""
+
+
+def load_texts(paths):
+    if not paths:
+        return [SAMPLE_RESUME]
+    texts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            texts.append(f.read())
+    return texts
+
+
+def time_it(label, func, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    elapsed = time.perf_counter() - start
+    per_doc = elapsed / (repeat * len(texts)) * 1000
+    print(f"{label:<28} {elapsed:8.3f}s total  {per_doc:8.2f} ms/doc")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('files', nargs='*', help='Plain-text resumes to benchmark with')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    processor = NLPProcessor()
+    texts = load_texts(args.files)
+
+    def double_parse(text):
+        # Previous behaviour: one parse for NER, a second one inside _extract_skills
+        processor.nlp(text)
+        processor.extract_candidate_info(text)
+
+    # Warm up the pipeline so model loading is not measured
+    processor.extract_candidate_info(texts[0])
+
+    before = time_it('double parse (previous)', double_parse, texts, args.repeat)
+    after = time_it('single parse (current)', processor.extract_candidate_info, texts, args.repeat)
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Bulk persistence for ingested candidates
+Candidates of a batch are inserted in one statement that returns their IDs,
+then their compressed texts and skill postings follow in one statement each.
+A batch the database rejects is retried row by row, so one bad row fails
+alone instead of rolling back its whole batch. Match scores are computed once
+the IDs exist and inserted in one more statement.
+"""
+
+import logging
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import begin_savepoint, db
+from models import Candidate, CandidateSkill, CandidateText, MatchScore
+from skill_index import candidate_postings, normalize_skills
+from text_store import text_row
+
+
+def candidate_row(job_id, task):
+    """Candidate column values for one successfully ingested task"""
+    candidate_data = task['candidate_data']
+    return {
+        'name': candidate_data.get('name', 'Unknown'),
+        'email': candidate_data.get('email'),
+        'phone': candidate_data.get('phone'),
+        'filename': task['filename'],
+        'file_path': task['file_path'],
+        'extracted_skills': candidate_data.get('skills', []),
+        'experience_years': candidate_data.get('experience_years'),
+        'education': candidate_data.get('education', []),
+        'work_experience': candidate_data.get('work_experience', []),
+        'job_id': job_id
+    }
+
+
+def match_score_row(job_id, candidate_id, match_result):
+    """MatchScore column values for a saved candidate"""
+    return {
+        'candidate_id': candidate_id,
+        'job_id': job_id,
+        'overall_score': match_result['overall_score'],
+        'skill_match_score': match_result['skill_score'],
+        'experience_score': match_result['experience_score'],
+        'education_score': match_result['education_score'],
+        # Unrounded, like the breakdown that reweighting starts from
+        'semantic_score': match_result['breakdown'].get('semantic_score'),
+        'detailed_breakdown': match_result['breakdown'],
+        'skill_gaps': match_result['skill_gaps'],
+        'match_justification': match_result['justification']
+    }
+
+
+def insert_returning_ids(model, rows):
+    """Insert rows in one statement; returns their primary keys in row order"""
+    if db.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = db.session.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+        return list(result.scalars())
+    # Without ordered RETURNING, IDs can only be matched to rows one insert at a time
+    return [db.session.execute(insert(model).values(**row)).inserted_primary_key[0] for row in rows]
+
+
+def persist_ingested(job_id, tasks):
+    """Save candidates, texts and skill postings for ingested tasks
+
+    Runs inside the caller's transaction; the caller commits. Tasks that
+    already carry an ``error`` are skipped. Saved tasks get a
+    ``candidate_id``; tasks the database rejects get an ``error`` instead.
+    Returns the number of candidates saved.
+    """
+    pending = [task for task in tasks if 'error' not in task]
+    if not pending:
+        return 0
+
+    try:
+        with begin_savepoint():
+            _insert_tasks(job_id, pending)
+        return len(pending)
+    except SQLAlchemyError as e:
+        logging.error(f"Bulk insert of {len(pending)} candidates failed, retrying one by one: {str(e)}")
+
+    saved = 0
+    for task in pending:
+        try:
+            with begin_savepoint():
+                _insert_tasks(job_id, [task])
+            saved += 1
+        except SQLAlchemyError as e:
+            logging.error(f"Error saving candidate from {task['filename']}: {str(e)}")
+            task['error'] = f"Could not save candidate: {str(e)}"
+    return saved
+
+
+def persist_match_scores(job_id, tasks):
+    """Insert the MatchScore of every saved and scored task; the caller commits"""
+    rows = [
+        match_score_row(job_id, task['candidate_id'], task['match_result'])
+        for task in tasks if 'candidate_id' in task and 'match_result' in task
+    ]
+    if rows:
+        db.session.execute(insert(MatchScore), rows)
+    return len(rows)
+
+
+def _insert_tasks(job_id, tasks):
+    candidate_ids = insert_returning_ids(Candidate, [candidate_row(job_id, task) for task in tasks])
+
+    texts = [
+        text_row(candidate_id, task['raw_text'])
+        for task, candidate_id in zip(tasks, candidate_ids) if task['raw_text'] is not None
+    ]
+    if texts:
+        db.session.execute(insert(CandidateText), texts)
+
+    # Keep the skill inverted index current for cross-job discovery
+    postings = candidate_postings([
+        (candidate_id, normalize_skills(task['candidate_data'].get('skills', [])))
+        for task, candidate_id in zip(tasks, candidate_ids)
+    ])
+    if postings:
+        db.session.execute(insert(CandidateSkill), postings)
+
+    # Only once every statement succeeded, so a retried batch starts clean
+    for task, candidate_id in zip(tasks, candidate_ids):
+        task['candidate_id'] = candidate_id
@@ -0,0 +1,101 @@
+"""
+Keyset-paginated candidate listing for a job
+Pages are ordered by (overall_score, match id) descending and continue from
+an opaque cursor, so every page is one indexed range read regardless of how
+deep into the ranking it is. Large JSON columns are deferred.
+"""
+
+import json
+import base64
+import binascii
+
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import defer
+
+from app import db
+from models import Candidate, CandidateSkill, MatchScore
+from skill_index import normalize_skills, skill_ids
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Pagination cursor is malformed"""
+
+
+class CandidatePage:
+    """One page of (Candidate, MatchScore) rows"""
+
+    def __init__(self, rows, next_cursor, offset):
+        self.rows = rows
+        self.next_cursor = next_cursor
+        self.offset = offset  # Rank of the first row minus one
+
+
+def encode_cursor(match_score, position):
+    """Opaque cursor pointing just after a listed MatchScore at rank ``position``"""
+    raw = json.dumps([match_score.overall_score, match_score.id, position]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(overall_score, match_score_id, position) from an encoded cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        score, match_id, position = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return float(score), int(match_id), int(position)
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidCursor(f"Invalid cursor: {str(e)}")
+
+
+def candidate_page(job_id, after=None, limit=DEFAULT_PAGE_SIZE, min_score=None, max_score=None, skills=None):
+    """One page of (Candidate, MatchScore) pairs for a job, best first
+
+    ``skills`` keeps only candidates holding every listed skill (via the
+    skill inverted index). The page's next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+    query = db.session.query(Candidate, MatchScore).join(
+        MatchScore, Candidate.id == MatchScore.candidate_id
+    ).options(
+        defer(Candidate.work_experience),
+        defer(MatchScore.detailed_breakdown)
+    ).filter(
+        Candidate.job_id == job_id,
+        MatchScore.job_id == job_id
+    )
+
+    if min_score is not None:
+        query = query.filter(MatchScore.overall_score >= min_score)
+    if max_score is not None:
+        query = query.filter(MatchScore.overall_score <= max_score)
+
+    required_skills = normalize_skills(skills)
+    if required_skills:
+        # A skill missing from the dictionary is held by nobody
+        required_ids = skill_ids(required_skills, create=False)
+        if len(required_ids) < len(required_skills):
+            return CandidatePage([], None, 0)
+        holders = db.session.query(CandidateSkill.candidate_id).filter(
+            CandidateSkill.skill_id.in_(list(required_ids.values()))
+        ).group_by(CandidateSkill.candidate_id).having(
+            func.count(CandidateSkill.skill_id) == len(required_ids)
+        )
+        query = query.filter(Candidate.id.in_(holders))
+
+    offset = 0
+    if after:
+        score, match_id, offset = decode_cursor(after)
+        query = query.filter(or_(
+            MatchScore.overall_score < score,
+            and_(MatchScore.overall_score == score, MatchScore.id < match_id)
+        ))
+
+    # One extra row tells whether another page follows
+    rows = query.order_by(MatchScore.overall_score.desc(), MatchScore.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return CandidatePage(rows, encode_cursor(rows[-1][1], offset + limit), offset)
+    return CandidatePage(rows, None, offset)
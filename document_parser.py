@@ -1,102 +1,376 @@
 import os
 import logging
+import zipfile
+import multiprocessing
+from collections import deque
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import PyPDF2
 import docx
 from io import BytesIO
 
+
+def _open_binary(source):
+    """Open a path or in-memory bytes as a binary file object"""
+    if isinstance(source, (bytes, bytearray)):
+        return BytesIO(source)
+    return open(source, 'rb')
+
+
+def _describe(source):
+    """Name of a document source for log messages"""
+    if isinstance(source, (bytes, bytearray)):
+        return f"<in-memory document, {len(source)} bytes>"
+    return source
+
+
+def _extract_pdf_pages(pdf_reader, start, end, source):
+    """Yield the text of pages [start, end) of an open PdfReader; failed pages yield None"""
+    for page_number in range(start, end):
+        try:
+            yield pdf_reader.pages[page_number].extract_text() or ""
+        except Exception as e:
+            logging.warning(f"PyPDF2 failed on page {page_number + 1} of {_describe(source)}: {str(e)}")
+            yield None
+
+
+def _extract_pdf_page_range(source, start, end):
+    """Extract pages [start, end) in a page worker, which has to parse its own copy"""
+    with _open_binary(source) as file:
+        return list(_extract_pdf_pages(PyPDF2.PdfReader(file), start, end, source))
+
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+
+def _iter_docx_xml_blocks(document_xml):
+    """Incrementally parse document.xml, yielding body paragraphs and table rows"""
+    paragraphs = []   # text buffers of open paragraphs (text boxes nest them)
+    cells = []        # paragraph lists of open table cells
+    rows = []         # cell-text lists of open table rows
+    fallback_depth = 0
+    body = None
+    depth = 0
+    
+    for event, elem in ET.iterparse(document_xml, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            depth += 1
+            if tag == _W + 'body':
+                body = elem
+            elif tag == _MC_FALLBACK:
+                # Legacy copy of content already present in mc:Choice
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _W + 'p':
+                paragraphs.append([])
+            elif tag == _W + 'tc':
+                cells.append([])
+            elif tag == _W + 'tr':
+                rows.append([])
+            continue
+        
+        depth -= 1
+        if tag == _MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == _W + 't':
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _W + 'tab':
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in (_W + 'br', _W + 'cr'):
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == _W + 'p':
+            text = ''.join(paragraphs.pop())
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+            elem.clear()
+        elif tag == _W + 'tc':
+            cell_text = '\n'.join(cells.pop()).strip()
+            if rows:
+                rows[-1].append(cell_text)
+            elem.clear()
+        elif tag == _W + 'tr':
+            row_cells = []
+            for cell_text in rows.pop():
+                # Merged cells repeat their text; keep each distinct value once
+                if cell_text and cell_text not in row_cells:
+                    row_cells.append(cell_text)
+            if row_cells:
+                row_text = ' '.join(row_cells)
+                if cells:
+                    cells[-1].append(row_text)
+                else:
+                    yield row_text
+            elem.clear()
+        
+        # Drop finished top-level blocks so memory stays bounded
+        if event == 'end' and depth == 2 and body is not None:
+            body.clear()
+
+
+class _PdfplumberFallback:
+    """Opens the PDF with pdfplumber only if a page actually needs it"""
+    
+    def __init__(self, source):
+        self.source = source
+        self._pdf = None
+        self._unavailable = False
+    
+    def extract_page(self, page_number):
+        if self._unavailable:
+            return None
+        try:
+            if self._pdf is None:
+                import pdfplumber
+                self._pdf = pdfplumber.open(
+                    BytesIO(self.source) if isinstance(self.source, (bytes, bytearray)) else self.source
+                )
+            if page_number >= len(self._pdf.pages):
+                return None
+            return self._pdf.pages[page_number].extract_text() or ""
+        except ImportError:
+            logging.warning("pdfplumber not available, skipping unreadable PDF page")
+            self._unavailable = True
+        except Exception as e:
+            logging.error(f"Error with pdfplumber fallback on page {page_number + 1} of {_describe(self.source)}: {str(e)}")
+        return None
+    
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+
 class DocumentParser:
     """Parser for different document formats"""
     
-    def __init__(self):
+    def __init__(self, max_pages=None, max_chars=None, pdf_workers=None, pdf_chunk_pages=8):
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        # Bounds so an 80-page portfolio PDF can't blow up memory or latency
+        self.max_pages = max_pages or int(os.environ.get('PDF_MAX_PAGES', 30))
+        self.max_chars = max_chars or int(os.environ.get('RESUME_MAX_CHARS', 200000))
+        self.pdf_workers = pdf_workers or int(os.environ.get('PDF_PAGE_WORKERS', 1))
+        self.pdf_chunk_pages = pdf_chunk_pages
+        self._pdf_pool = None
     
-    def extract_text(self, file_path):
-        """Extract text from a document file"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Shut down the PDF page workers, if any were started"""
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown()
+            self._pdf_pool = None
+    
+    def _page_pool(self):
+        # Started on first use and shared by every PDF this parser reads
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        return self._pdf_pool
+    
+    def extract_text(self, source, filename=None):
+        """Extract text from a document
+        
+        ``source`` is a file path, the file's bytes, or a binary file-like
+        object (e.g. a werkzeug FileStorage stream). For bytes and streams
+        ``filename`` supplies the extension.
+        """
         try:
-            file_extension = os.path.splitext(file_path)[1].lower()
+            if hasattr(source, 'read'):
+                source = source.read()
+            file_extension = os.path.splitext(filename or source)[1].lower() \
+                if filename or not isinstance(source, (bytes, bytearray)) else ''
             
             if file_extension == '.pdf':
-                return self._extract_from_pdf(file_path)
+                return self._extract_from_pdf(source)
             elif file_extension == '.docx':
-                return self._extract_from_docx(file_path)
+                return self._extract_from_docx(source)
             elif file_extension == '.txt':
-                return self._extract_from_txt(file_path)
+                return self._extract_from_txt(source)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
                 
         except Exception as e:
-            logging.error(f"Error extracting text from {file_path}: {str(e)}")
+            logging.error(f"Error extracting text from {filename or _describe(source)}: {str(e)}")
             raise
     
-    def _extract_from_pdf(self, file_path):
+    def _extract_from_pdf(self, source):
         """Extract text from PDF file"""
-        text = ""
+        return "\n".join(self.iter_pdf_pages(source)).strip()
+    
+    def iter_pdf_pages(self, source):
+        """Yield the text of each PDF page, bounded by max_pages and max_chars
+        
+        Pages PyPDF2 cannot read are retried individually with pdfplumber
+        instead of reparsing the whole file.
+        """
+        file = _open_binary(source)
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n"
-                    
+            pdf_reader = PyPDF2.PdfReader(file)
+            page_count = len(pdf_reader.pages)
         except Exception as e:
-            logging.error(f"Error reading PDF file {file_path}: {str(e)}")
-            # Fallback: try with pdfplumber if available
+            logging.error(f"Error reading PDF file {_describe(source)}: {str(e)}")
+            # PyPDF2 cannot open the document at all: let pdfplumber read every page
+            pdf_reader = page_count = None
+        
+        remaining_chars = self.max_chars
+        fallback = _PdfplumberFallback(source)
+        try:
+            for page_number, page_text in self._iter_pypdf2_pages(source, pdf_reader, page_count):
+                if page_text is None:
+                    page_text = fallback.extract_page(page_number)
+                    if page_text is None:
+                        continue
+                
+                if len(page_text) >= remaining_chars:
+                    yield page_text[:remaining_chars]
+                    logging.warning(f"PDF {_describe(source)} truncated at {self.max_chars} characters")
+                    return
+                remaining_chars -= len(page_text)
+                yield page_text
+        finally:
+            fallback.close()
+            file.close()
+    
+    def _iter_pypdf2_pages(self, source, pdf_reader, page_count):
+        """Yield (page_number, text or None) with PyPDF2, optionally in parallel"""
+        if page_count is None:
+            # Unknown page count: let the fallback decide how many pages exist
+            for page_number in range(self.max_pages):
+                yield page_number, None
+            return
+        
+        if page_count > self.max_pages:
+            logging.warning(f"PDF {_describe(source)} has {page_count} pages, extracting the first {self.max_pages}")
+        page_count = min(page_count, self.max_pages)
+        
+        if self.pdf_workers > 1 and page_count > self.pdf_chunk_pages:
+            ranges = [
+                (start, min(start + self.pdf_chunk_pages, page_count))
+                for start in range(0, page_count, self.pdf_chunk_pages)
+            ]
+            # Only one chunk per worker is in flight, so stopping at the
+            # character cap leaves little work behind, and that is cancelled
+            executor = self._page_pool()
+            remaining = iter(ranges)
+            in_flight = deque()
+            broken = False
+            
+            def submit_next():
+                page_range = next(remaining, None)
+                if page_range is not None:
+                    in_flight.append((page_range, executor.submit(_extract_pdf_page_range, source, *page_range)))
+            
+            for _ in range(self.pdf_workers):
+                submit_next()
             try:
-                import pdfplumber
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            except ImportError:
-                logging.warning("pdfplumber not available, using PyPDF2 result")
-            except Exception as e2:
-                logging.error(f"Error with pdfplumber fallback: {str(e2)}")
-                raise e
+                while in_flight:
+                    (start, end), future = in_flight.popleft()
+                    try:
+                        texts = future.result()
+                    except Exception as e:
+                        logging.error(f"Error extracting PDF pages {start}-{end} of {_describe(source)}: {str(e)}")
+                        texts = [None] * (end - start)
+                        if isinstance(e, BrokenProcessPool):
+                            # A crashed worker breaks the pool; the next PDF starts a new one
+                            self.close()
+                            broken = True
+                    if not broken:
+                        submit_next()
+                    for offset, page_text in enumerate(texts):
+                        yield start + offset, page_text
+            finally:
+                for _, future in in_flight:
+                    future.cancel()
+            
+            # Chunks never submitted because the pool broke are read here
+            for start, end in remaining:
+                for offset, page_text in enumerate(_extract_pdf_pages(pdf_reader, start, end, source)):
+                    yield start + offset, page_text
+            return
         
-        return text.strip()
+        for page_number, page_text in enumerate(_extract_pdf_pages(pdf_reader, 0, page_count, source)):
+            yield page_number, page_text
     
-    def _extract_from_docx(self, file_path):
+    def _extract_from_docx(self, source):
         """Extract text from DOCX file"""
         try:
-            doc = docx.Document(file_path)
-            text = ""
+            return "\n".join(self.iter_docx_blocks(source)).strip()
             
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+            logging.warning(f"Streaming DOCX extraction failed for {_describe(source)}, using python-docx: {str(e)}")
+            return self._extract_from_docx_document_model(source)
+        except Exception as e:
+            logging.error(f"Error reading DOCX file {_describe(source)}: {str(e)}")
+            raise
+    
+    def iter_docx_blocks(self, source):
+        """Yield paragraphs and table rows of a DOCX in document order
+        
+        Reads word/document.xml straight from the zip with an incremental
+        parser instead of building the python-docx object model. Each table
+        row is yielded once with duplicate (merged) cell text removed.
+        """
+        remaining_chars = self.max_chars
+        with _open_binary(source) as file, zipfile.ZipFile(file) as archive:
+            with archive.open('word/document.xml') as document_xml:
+                for block in _iter_docx_xml_blocks(document_xml):
+                    if len(block) >= remaining_chars:
+                        yield block[:remaining_chars]
+                        logging.warning(f"DOCX {_describe(source)} truncated at {self.max_chars} characters")
+                        return
+                    remaining_chars -= len(block) + 1
+                    yield block
+    
+    def _extract_from_docx_document_model(self, source):
+        """Extract text from DOCX file via the python-docx object model"""
+        try:
+            with _open_binary(source) as file:
+                doc = docx.Document(file)
+            parts = [paragraph.text for paragraph in doc.paragraphs]
             
             # Also extract text from tables
             for table in doc.tables:
                 for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+                    parts.append(" ".join(cell.text for cell in row.cells))
             
-            return text.strip()
+            return "\n".join(parts).strip()
             
         except Exception as e:
-            logging.error(f"Error reading DOCX file {file_path}: {str(e)}")
+            logging.error(f"Error reading DOCX file {_describe(source)}: {str(e)}")
             raise
     
-    def _extract_from_txt(self, file_path):
+    def _extract_from_txt(self, source):
         """Extract text from TXT file"""
         try:
             encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
             
+            with _open_binary(source) as file:
+                data = file.read()
+            
             for encoding in encodings:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        return file.read().strip()
+                    return data.decode(encoding).strip()
                 except UnicodeDecodeError:
                     continue
             
             # If all encodings fail, try with error handling
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                return file.read().strip()
+            return data.decode('utf-8', errors='replace').strip()
                 
         except Exception as e:
-            logging.error(f"Error reading TXT file {file_path}: {str(e)}")
+            logging.error(f"Error reading TXT file {_describe(source)}: {str(e)}")
             raise
     
     def is_supported_format(self, filename):
@@ -0,0 +1,149 @@
+"""
+Content-addressed cache for parsed resume text and NLP extraction results
+Entries are keyed by the SHA-256 of the uploaded file plus the extractor
+version, so a re-uploaded resume skips parsing and NLP entirely.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def content_hash(data):
+    """SHA-256 hex digest of file content"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskCacheBackend:
+    """One JSON file per entry, sharded by key prefix"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class RedisCacheBackend:
+    """Shared cache on any Redis-protocol server (Redis, Memorystore, Valkey)"""
+
+    def __init__(self, url, ttl_seconds=7 * 24 * 3600, prefix='extraction:'):
+        try:
+            import redis
+        except ImportError:
+            logging.error("redis package not available. Please install it with: pip install redis")
+            raise
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, json.dumps(value), ex=self.ttl_seconds)
+
+
+class ExtractionCache:
+    """Cache of {'raw_text', 'candidate_data'} keyed by content hash and extractor version"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @classmethod
+    def from_env(cls):
+        """Build a cache from EXTRACTION_CACHE_* environment variables
+
+        EXTRACTION_CACHE_BACKEND is one of ``memory`` (default), ``disk``,
+        ``redis`` or ``none``.
+        """
+        backend_name = os.environ.get('EXTRACTION_CACHE_BACKEND', 'memory').lower()
+        try:
+            if backend_name == 'none':
+                return None
+            if backend_name == 'disk':
+                directory = os.environ.get('EXTRACTION_CACHE_DIR', os.path.join('instance', 'extraction_cache'))
+                backend = DiskCacheBackend(directory)
+            elif backend_name == 'redis':
+                url = os.environ.get('EXTRACTION_CACHE_REDIS_URL') or os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+                backend = RedisCacheBackend(url)
+            else:
+                backend = MemoryCacheBackend(int(os.environ.get('EXTRACTION_CACHE_SIZE', 1024)))
+        except Exception as e:
+            logging.error(f"Error creating '{backend_name}' extraction cache, falling back to memory: {str(e)}")
+            backend = MemoryCacheBackend()
+
+        logging.info(f"Extraction cache backend: {type(backend).__name__}")
+        return cls(backend)
+
+    @staticmethod
+    def make_key(file_hash, extractor_version):
+        return f"{extractor_version}:{file_hash}"
+
+    def get(self, file_hash, extractor_version):
+        """Return the cached entry or None; backend errors count as a miss"""
+        try:
+            return self.backend.get(self.make_key(file_hash, extractor_version))
+        except Exception as e:
+            logging.warning(f"Extraction cache read failed: {str(e)}")
+            return None
+
+    def set(self, file_hash, extractor_version, raw_text, candidate_data):
+        try:
+            self.backend.set(self.make_key(file_hash, extractor_version), {
+                'raw_text': raw_text,
+                'candidate_data': candidate_data
+            })
+        except Exception as e:
+            logging.warning(f"Extraction cache write failed: {str(e)}")
@@ -0,0 +1,11 @@
+"""Gunicorn server hooks, see the Dockerfile command"""
+
+import sys
+
+
+def post_fork(server, worker):
+    # With --preload the app, and a model loader thread, were started in the
+    # master; threads do not survive fork, so each worker restarts loading
+    routes = sys.modules.get('routes')
+    if routes is not None:
+        routes.nlp_models.after_fork()
@@ -0,0 +1,202 @@
+"""
+Resume ingestion pipeline: parse, extract and score uploaded resumes
+Large batches are fanned out to a process pool whose workers each load the
+spaCy model once; results come back to the web process, which saves and
+scores them.
+"""
+
+import os
+import atexit
+import logging
+import threading
+import multiprocessing
+from types import SimpleNamespace
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from document_parser import DocumentParser
+
+# Per-worker-process model, set by _init_worker
+_worker_nlp_processor = None
+_worker_document_parser = None
+
+
+def _candidate_view(candidate_id, raw_text, candidate_data):
+    """Stand-in for a saved Candidate row, as the matching engine sees it"""
+    return SimpleNamespace(
+        id=candidate_id,
+        raw_text=raw_text,
+        extracted_skills=candidate_data.get('skills', []),
+        experience_years=candidate_data.get('experience_years'),
+        education=candidate_data.get('education', [])
+    )
+
+
+def score_saved(tasks, job, matching_engine):
+    """Fill ``match_result`` for tasks whose candidate has been saved
+
+    Scoring waits for the candidate ID so each resume is registered with the
+    job's semantic index under it. The stored semantic score is what
+    /jobs/<id>/top and discovery reuse for the candidate afterwards.
+
+    The candidates are already saved, so a scoring error must not fail the
+    chunk: a failed batch is scored one candidate at a time instead, and
+    ``calculate_match_score`` reports its own errors as a zero score.
+    """
+    saved = [task for task in tasks if 'error' not in task and 'candidate_id' in task]
+    if not saved:
+        return tasks
+    views = [_candidate_view(task['candidate_id'], task['raw_text'], task['candidate_data']) for task in saved]
+    try:
+        match_results = matching_engine.score_batch(views, job)
+    except Exception as e:
+        logging.error(f"Error scoring {len(views)} ingested candidates, scoring them one by one: {str(e)}")
+        match_results = [matching_engine.calculate_match_score(view, job) for view in views]
+    for task, match_result in zip(saved, match_results):
+        task['match_result'] = match_result
+    return tasks
+
+
+def _init_worker():
+    global _worker_nlp_processor, _worker_document_parser
+    from nlp_processor import NLPProcessor
+
+    _worker_nlp_processor = NLPProcessor()
+    _worker_document_parser = DocumentParser()
+    logging.info(f"Ingest worker {os.getpid()} ready")
+
+
+def _process_task(task):
+    """Parse and extract one resume inside a pool worker"""
+    try:
+        raw_text = task.get('raw_text')
+        if raw_text is None:
+            raw_text = _worker_document_parser.extract_text(task.get('content') or task['file_path'], filename=task['filename'])
+
+        candidate_data = task.get('candidate_data')
+        if candidate_data is None:
+            candidate_data = _worker_nlp_processor.extract_candidate_info(raw_text)
+
+        return {
+            'raw_text': raw_text,
+            'candidate_data': candidate_data
+        }
+    except Exception as e:
+        logging.error(f"Error processing file {task.get('filename')}: {str(e)}")
+        return {'error': str(e)}
+
+
+class IngestPool:
+    """Lazily started process pool for resume ingestion"""
+
+    def __init__(self, max_workers=None, min_batch=4):
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.min_batch = min_batch
+        self._executor = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    @classmethod
+    def from_env(cls):
+        """INGEST_WORKERS (0 disables the pool) and INGEST_POOL_MIN_FILES"""
+        workers = os.environ.get('INGEST_WORKERS')
+        return cls(
+            max_workers=int(workers) if workers else None,
+            min_batch=int(os.environ.get('INGEST_POOL_MIN_FILES', 4))
+        )
+
+    @property
+    def enabled(self):
+        return self.max_workers > 1
+
+    def should_use(self, task_count):
+        return self.enabled and task_count >= self.min_batch
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a threaded gunicorn worker is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def _reset(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def process(self, tasks):
+        """Run tasks through the pool; returns one result dict per task, in order"""
+        executor = self._get_executor()
+        futures = [executor.submit(_process_task, task) for task in tasks]
+
+        results = []
+        broken = False
+        for task, future in zip(tasks, futures):
+            try:
+                results.append(future.result())
+            except BrokenProcessPool as e:
+                # A worker died (e.g. out of memory); fail this task and rebuild the pool
+                broken = True
+                logging.error(f"Ingest worker crashed while processing {task.get('filename')}: {str(e)}")
+                results.append({'error': 'Ingest worker crashed'})
+            except Exception as e:
+                logging.error(f"Error processing file {task.get('filename')}: {str(e)}")
+                results.append({'error': str(e)})
+
+        if broken:
+            self._reset()
+        return results
+
+    def shutdown(self):
+        self._reset()
+
+
+def run_ingest(tasks, nlp_processor, pool=None,
+               batch_size=32, n_process=1, extraction_cache=None, extractor_version=None):
+    """Fill each task with raw_text and candidate_data (or error)
+
+    Tasks are dicts with ``filename``, ``file_path``, optionally the file's
+    ``content`` bytes (parsed in memory instead of reading file_path) and,
+    for extraction cache hits, ``raw_text`` and ``candidate_data``. Scoring
+    happens once the candidates are saved, see ``score_saved``.
+    """
+    pending = [task for task in tasks if task.get('candidate_data') is None]
+
+    if pool is not None and pool.should_use(len(pending)):
+        for task, result in zip(pending, pool.process(pending)):
+            task.update(result)
+    else:
+        parsed = []
+        # One parser for the batch, so its PDF page workers are shared
+        with DocumentParser() as parser:
+            for task in pending:
+                try:
+                    if task.get('raw_text') is None:
+                        task['raw_text'] = parser.extract_text(task.get('content') or task['file_path'], filename=task['filename'])
+                    parsed.append(task)
+                except Exception as e:
+                    logging.error(f"Error processing file {task['filename']}: {str(e)}")
+                    task['error'] = str(e)
+
+        extraction_results = nlp_processor.extract_candidates_batch(
+            [task['raw_text'] for task in parsed],
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for task, candidate_data in zip(parsed, extraction_results):
+            if 'error' in candidate_data:
+                task['error'] = candidate_data['error']
+            else:
+                task['candidate_data'] = candidate_data
+
+    if extraction_cache is not None:
+        for task in pending:
+            if 'error' not in task and task.get('file_hash'):
+                extraction_cache.set(task['file_hash'], extractor_version, task['raw_text'], task['candidate_data'])
+
+    return tasks
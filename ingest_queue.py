@@ -0,0 +1,352 @@
+"""
+Durable background queue for resume ingestion
+Uploads are recorded as IngestJob/IngestItem rows and processed by worker
+threads, so the upload request returns immediately and progress survives
+restarts.
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.orm import undefer
+from app import app, db
+from models import IngestJob, IngestItem
+from ingest import run_ingest, score_saved
+from bulk_persist import persist_ingested, persist_match_scores
+from skill_index import normalize_skills
+from job_stats import apply_stats_delta
+
+
+class IngestQueue:
+    """DB-backed ingest queue with in-process worker threads"""
+
+    def __init__(self, nlp_models, extraction_cache=None, pool=None,
+                 worker_count=1, chunk_size=16, commit_size=500, poll_interval=1.0, stale_after=timedelta(minutes=15),
+                 max_attempts=3, sweep_interval=60.0):
+        self.nlp_models = nlp_models
+        self.extraction_cache = extraction_cache
+        self.pool = pool
+        self.worker_count = worker_count
+        self.chunk_size = chunk_size
+        self.commit_size = commit_size  # Items saved per transaction within a chunk
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts  # Claims before an item that keeps failing is given up
+        self.sweep_interval = sweep_interval  # Seconds between checks for stale claims
+        self._next_sweep = 0.0
+        self._threads = []
+        self._pid = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    @classmethod
+    def from_env(cls, nlp_models, extraction_cache=None, pool=None):
+        return cls(
+            nlp_models,
+            extraction_cache=extraction_cache,
+            pool=pool,
+            worker_count=int(os.environ.get('INGEST_QUEUE_WORKERS', 1)),
+            chunk_size=int(os.environ.get('INGEST_QUEUE_CHUNK', 16)),
+            commit_size=int(os.environ.get('INGEST_COMMIT_SIZE', 500)),
+            max_attempts=int(os.environ.get('INGEST_MAX_ATTEMPTS', 3))
+        )
+
+    def enqueue(self, job, uploads):
+        """Record uploads as a new IngestJob
+
+        ``uploads`` holds (filename, file_path, file_hash, content) tuples;
+        the bytes are queued in the database so any instance can process them.
+        """
+        ingest_job = self.open_job(job)
+        self.add_uploads(ingest_job, uploads)
+        self.close_job(ingest_job)
+        return ingest_job
+
+    def open_job(self, job):
+        """Start an IngestJob that will receive uploads incrementally"""
+        ingest_job = IngestJob(job_id=job.id, status='receiving', total_files=0)
+        db.session.add(ingest_job)
+        db.session.commit()
+        return ingest_job
+
+    def add_uploads(self, ingest_job, uploads, failures=()):
+        """Append uploads (and (filename, error) failures) to an open IngestJob
+
+        Workers start on these items right away, while the caller keeps
+        streaming the rest of the batch.
+        """
+        for filename, file_path, file_hash, content in uploads:
+            db.session.add(IngestItem(
+                ingest_job_id=ingest_job.id,
+                filename=filename,
+                file_path=file_path,
+                file_hash=file_hash,
+                content=content
+            ))
+        for filename, error in failures:
+            db.session.add(IngestItem(
+                ingest_job_id=ingest_job.id,
+                filename=filename,
+                file_path='',
+                status='failed',
+                error=error
+            ))
+        IngestJob.query.filter_by(id=ingest_job.id).update({
+            'total_files': IngestJob.total_files + len(uploads) + len(failures),
+            'failed_count': IngestJob.failed_count + len(failures)
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if uploads:
+            self.ensure_workers()
+            self._wakeup.set()
+
+    def close_job(self, ingest_job):
+        """Mark an IngestJob as fully received"""
+        db.session.refresh(ingest_job)
+        if ingest_job.processed_count + ingest_job.failed_count >= ingest_job.total_files:
+            ingest_job.status = 'completed'
+            ingest_job.finished_at = datetime.utcnow()
+        else:
+            ingest_job.status = 'running' if ingest_job.started_at else 'queued'
+        db.session.commit()
+
+    def ensure_workers(self):
+        """Start worker threads in this process if they are not running yet"""
+        with self._lock:
+            if self._pid == os.getpid() and all(thread.is_alive() for thread in self._threads):
+                return
+            self._pid = os.getpid()
+            self._threads = []
+            for index in range(self.worker_count):
+                thread = threading.Thread(target=self._run, name=f'ingest-worker-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self):
+        while True:
+            try:
+                with app.app_context():
+                    worked = self.process_next_chunk()
+            except Exception as e:
+                logging.error(f"Ingest worker error: {str(e)}")
+                worked = False
+            if not worked:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _requeue_stale(self):
+        """Give items left 'processing' by a crashed worker back to the queue"""
+        # Idle workers poll every second; the sweep only needs to run now and then
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+
+        stale = IngestItem.query.filter(
+            IngestItem.status == 'processing',
+            IngestItem.claimed_at < datetime.utcnow() - self.stale_after
+        )
+        if db.session.query(stale.exists()).scalar():
+            self._release(stale, func.coalesce(IngestItem.error, 'Processing was interrupted'))
+
+    def _claim(self):
+        """Atomically claim up to chunk_size queued items of the oldest ingest job"""
+        self._requeue_stale()
+
+        next_item = IngestItem.query.filter_by(status='queued').order_by(IngestItem.id).first()
+        if next_item is None:
+            return None, []
+
+        candidate_ids = [item_id for (item_id,) in db.session.query(IngestItem.id).filter_by(
+            ingest_job_id=next_item.ingest_job_id, status='queued'
+        ).order_by(IngestItem.id).limit(self.chunk_size)]
+
+        claim_token = uuid.uuid4().hex
+        claimed = IngestItem.query.filter(
+            IngestItem.id.in_(candidate_ids),
+            IngestItem.status == 'queued'
+        ).update({
+            'status': 'processing',
+            'claimed_at': datetime.utcnow(),
+            'claim_token': claim_token,
+            'attempts': func.coalesce(IngestItem.attempts, 0) + 1
+        }, synchronize_session=False)
+        db.session.commit()
+        if not claimed:
+            return None, []
+
+        items = IngestItem.query.options(undefer(IngestItem.content)).filter_by(
+            claim_token=claim_token
+        ).order_by(IngestItem.id).all()
+        return db.session.get(IngestJob, next_item.ingest_job_id), items
+
+    def _release(self, items_query, error):
+        """Requeue interrupted items, failing those that are out of attempts
+
+        ``items_query`` selects the items still 'processing'; ``error`` is
+        recorded on them as the reason.
+        """
+        exhausted = items_query.filter(IngestItem.attempts >= self.max_attempts)
+        failed_jobs = Counter(job_id for (job_id,) in exhausted.with_entities(IngestItem.ingest_job_id))
+        exhausted.update({'status': 'failed', 'error': error, 'content': None}, synchronize_session=False)
+        items_query.update({'status': 'queued', 'error': error}, synchronize_session=False)
+        for job_id, failed in failed_jobs.items():
+            logging.error(f"Ingest job {job_id}: {failed} files failed after {self.max_attempts} attempts")
+            IngestJob.query.filter_by(id=job_id).update({
+                'failed_count': IngestJob.failed_count + failed
+            }, synchronize_session=False)
+        db.session.commit()
+
+        for job_id in failed_jobs:
+            self._complete_if_done(db.session.get(IngestJob, job_id))
+
+    def _complete_if_done(self, ingest_job):
+        # A job still receiving uploads is completed by close_job instead
+        db.session.refresh(ingest_job)
+        if ingest_job.status in ('queued', 'running') and \
+                ingest_job.processed_count + ingest_job.failed_count >= ingest_job.total_files:
+            ingest_job.status = 'completed'
+            ingest_job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+    def process_next_chunk(self):
+        """Process one claimed chunk; returns False when the queue is empty"""
+        ingest_job, items = self._claim()
+        if not items:
+            return False
+
+        claim_token = items[0].claim_token
+        try:
+            self._process(ingest_job, items)
+        except Exception as e:
+            # Give the chunk's unsaved items back to the queue, or up on them
+            db.session.rollback()
+            self._release(IngestItem.query.filter(
+                IngestItem.claim_token == claim_token,
+                IngestItem.status == 'processing'
+            ), str(e))
+            raise
+        return True
+
+    def _process(self, ingest_job, items):
+        """Parse, save and score the items of one claimed chunk"""
+
+        if ingest_job.started_at is None:
+            ingest_job.started_at = datetime.utcnow()
+            if ingest_job.status == 'queued':
+                ingest_job.status = 'running'
+            db.session.commit()
+
+        job = ingest_job.job
+        nlp_processor = self.nlp_models.nlp_processor
+        extractor_version = nlp_processor.extractor_version
+
+        tasks = []
+        for item in items:
+            task = {
+                'filename': item.filename,
+                'file_path': item.file_path,
+                'file_hash': item.file_hash,
+                'content': item.content
+            }
+            cached = self.extraction_cache.get(item.file_hash, extractor_version) if self.extraction_cache and item.file_hash else None
+            if cached:
+                task['raw_text'] = cached['raw_text']
+                task['candidate_data'] = cached['candidate_data']
+            tasks.append(task)
+
+        run_ingest(
+            tasks, nlp_processor,
+            pool=self.pool,
+            batch_size=app.config['NLP_BATCH_SIZE'],
+            n_process=app.config['NLP_N_PROCESS'],
+            extraction_cache=self.extraction_cache,
+            extractor_version=extractor_version
+        )
+
+        processed = failed = 0
+        for start in range(0, len(items), self.commit_size):
+            chunk_processed, chunk_failed = self._save(
+                ingest_job, job, items[start:start + self.commit_size], tasks[start:start + self.commit_size]
+            )
+            processed += chunk_processed
+            failed += chunk_failed
+
+        self._complete_if_done(ingest_job)
+        logging.info(f"Ingest job {ingest_job.id}: {processed} processed, {failed} failed in this chunk")
+
+    def _save(self, ingest_job, job, items, tasks):
+        """Persist results for claimed items and commit; returns (processed, failed)"""
+        persist_ingested(job.id, tasks)
+        score_saved(tasks, job, self.nlp_models.matching_engine)
+        persist_match_scores(job.id, tasks)
+
+        processed = failed = 0
+        scores_added = []
+        skills_added = []
+        for item, task in zip(items, tasks):
+            # The queue no longer needs the upload bytes
+            item.content = None
+            if 'error' in task:
+                item.status = 'failed'
+                item.error = task['error']
+                failed += 1
+                continue
+            item.candidate_id = task['candidate_id']
+            item.status = 'processed'
+            processed += 1
+            scores_added.append(task['match_result']['overall_score'])
+            skills_added.append(normalize_skills(task['candidate_data'].get('skills', [])))
+
+        if processed:
+            db.session.flush()
+            apply_stats_delta(job.id, candidates=processed, scores_added=scores_added, skills_added=skills_added)
+
+        # Counter updates as SQL expressions so concurrent workers don't overwrite each other
+        IngestJob.query.filter_by(id=ingest_job.id).update({
+            'processed_count': IngestJob.processed_count + processed,
+            'failed_count': IngestJob.failed_count + failed
+        }, synchronize_session=False)
+        db.session.commit()
+        return processed, failed
+
+
+def stream_progress(ingest_id, poll_interval=1.0, max_seconds=30, retry_ms=1000):
+    """Yield Server-Sent Events with live IngestJob counts until it completes
+
+    Each stream ends after max_seconds so it does not tie up a sync/gthread worker
+    thread for a whole ingest; EventSource reconnects after retry_ms and resumes.
+    """
+    yield f"retry: {retry_ms}\n\n"
+    deadline = time.monotonic() + max_seconds
+    last_payload = None
+    while time.monotonic() < deadline:
+        ingest_job = db.session.get(IngestJob, ingest_id)
+        progress = ingest_job.to_dict() if ingest_job is not None else None
+        # End the read transaction and hand the connection back before waiting;
+        # the next poll then sees other workers' commits
+        db.session.rollback()
+        if progress is None:
+            yield "event: error\ndata: {}\n\n"
+            return
+
+        payload = json.dumps(progress)
+        if payload != last_payload:
+            last_payload = payload
+            yield f"data: {payload}\n\n"
+        else:
+            # Comment line keeps proxies from closing an idle stream
+            yield ": keep-alive\n\n"
+
+        if progress['status'] == 'completed':
+            yield f"event: done\ndata: {payload}\n\n"
+            return
+        time.sleep(poll_interval)
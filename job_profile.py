@@ -0,0 +1,94 @@
+"""
+Compiled job requirement profile
+Everything scoring needs from a job description is extracted once, when the
+job is analyzed, so per-candidate scoring never rescans the description.
+"""
+
+import re
+
+PROFILE_VERSION = 1
+
+# Education keywords and their scores
+EDUCATION_LEVELS = {
+    'phd': 100,
+    'doctorate': 100,
+    'master': 80,
+    'bachelor': 60,
+    'associate': 40,
+    'diploma': 30,
+    'certificate': 20
+}
+
+# Patterns for experience requirements
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:relevant\s+)?(?:professional\s+)?experience'),
+    re.compile(r'minimum\s+(\d+)\s+years?'),
+    re.compile(r'at\s+least\s+(\d+)\s+years?')
+]
+
+
+def extract_required_experience(job_description):
+    """Extract required years of experience from job description"""
+    job_text = job_description.lower()
+
+    for pattern in EXPERIENCE_PATTERNS:
+        matches = pattern.findall(job_text)
+        if matches:
+            return max([int(match) for match in matches])
+
+    return 0
+
+
+def education_level(texts):
+    """Highest EDUCATION_LEVELS score mentioned in any of the texts"""
+    level = 0
+    for text in texts:
+        text_lower = text.lower()
+        for keyword, score in EDUCATION_LEVELS.items():
+            if keyword in text_lower:
+                level = max(level, score)
+    return level
+
+
+def flatten_skills(skills_required):
+    """Job skills from all categories, in category order"""
+    job_skills = []
+    if skills_required:
+        for category, skills in skills_required.items():
+            job_skills.extend(skills)
+    return job_skills
+
+
+def compile_job_profile(description, skills_required, skill_weights):
+    """Build the profile stored on JobDescription.profile"""
+    skills = flatten_skills(skills_required)
+    return {
+        'version': PROFILE_VERSION,
+        'required_experience': extract_required_experience(description or ''),
+        'required_education': education_level([description or '']),
+        'skills': skills,
+        'skills_lower': [skill.lower() for skill in skills],
+        'weights': skill_weight_vector(skills, skill_weights)
+    }
+
+
+def skill_weight_vector(skills, skill_weights):
+    """Weight of each job skill, aligned with the profile's skill list"""
+    skill_weights = skill_weights or {}
+    return [float(skill_weights.get(skill, 1.0)) for skill in skills]
+
+
+def with_weights(profile, skill_weights):
+    """Copy of a profile with a new weight vector"""
+    profile = dict(profile)
+    profile['weights'] = skill_weight_vector(profile['skills'], skill_weights)
+    return profile
+
+
+def job_profile(job):
+    """The job's stored profile, compiled on the fly for jobs saved without one"""
+    profile = getattr(job, 'profile', None)
+    if profile and profile.get('version') == PROFILE_VERSION:
+        return profile
+    return compile_job_profile(job.description, job.skills_required, job.skill_weights)
@@ -0,0 +1,119 @@
+"""
+Materialized per-job statistics for the dashboard
+JobStats rows are updated with deltas whenever candidates are ingested,
+re-scored or deleted, so the dashboard reads one row per job instead of
+aggregating candidates and match scores on every request.
+"""
+
+import logging
+from collections import Counter, defaultdict
+
+from app import db
+from models import Candidate, CandidateSkill, JobDescription, JobStats, MatchScore, Skill
+
+HISTOGRAM_BUCKETS = 10
+
+
+def score_bucket(score):
+    """Histogram bucket (0-9) of an overall score on the 0-100 scale"""
+    return min(HISTOGRAM_BUCKETS - 1, max(0, int((score or 0) // (100 / HISTOGRAM_BUCKETS))))
+
+
+def new_job_stats(job):
+    """Empty stats row for a newly created job"""
+    return JobStats(
+        job=job,
+        candidate_count=0,
+        score_count=0,
+        score_sum=0.0,
+        score_histogram=[0] * HISTOGRAM_BUCKETS,
+        skill_counts={}
+    )
+
+
+def apply_stats_delta(job_id, candidates=0, scores_added=(), scores_removed=(),
+                      skills_added=(), skills_removed=()):
+    """Fold a change into a job's stats row, inside the caller's transaction
+
+    ``skills_added`` / ``skills_removed`` hold one normalized skill list per
+    candidate. Call after the change itself has been flushed: a job without
+    a stats row is rebuilt from the database instead.
+    """
+    # Row lock so concurrent ingest workers don't lose each other's JSON updates
+    stats = JobStats.query.filter_by(job_id=job_id).with_for_update().first()
+    if stats is None:
+        db.session.flush()
+        rebuild_job_stats([job_id])
+        return
+
+    histogram = list(stats.score_histogram or [0] * HISTOGRAM_BUCKETS)
+    for score in scores_added:
+        histogram[score_bucket(score)] += 1
+    for score in scores_removed:
+        bucket = score_bucket(score)
+        histogram[bucket] = max(0, histogram[bucket] - 1)
+
+    skill_counts = Counter(stats.skill_counts or {})
+    for skills in skills_added:
+        skill_counts.update(skills)
+    for skills in skills_removed:
+        skill_counts.subtract(skills)
+
+    stats.candidate_count = max(0, stats.candidate_count + candidates)
+    stats.score_count = max(0, stats.score_count + len(scores_added) - len(scores_removed))
+    # Once the last score is gone, reset the sum so float drift does not linger
+    if stats.score_count:
+        stats.score_sum = stats.score_sum + sum(scores_added) - sum(scores_removed)
+    else:
+        stats.score_sum = 0.0
+    stats.score_histogram = histogram
+    stats.skill_counts = {skill: count for skill, count in skill_counts.items() if count > 0}
+
+
+def rebuild_job_stats(job_ids=None):
+    """Recompute stats from scratch for the given jobs (all jobs if None)
+
+    Used to backfill jobs created before stats were materialized and to
+    correct any drift; the caller commits.
+    """
+    if job_ids is None:
+        job_ids = [job_id for (job_id,) in db.session.query(JobDescription.id)]
+    job_ids = list(job_ids)
+    if not job_ids:
+        return 0
+
+    candidate_counts = dict(db.session.query(
+        Candidate.job_id, db.func.count(Candidate.id)
+    ).filter(Candidate.job_id.in_(job_ids)).group_by(Candidate.job_id))
+
+    score_totals = {job_id: (count, total) for job_id, count, total in db.session.query(
+        MatchScore.job_id, db.func.count(MatchScore.id), db.func.sum(MatchScore.overall_score)
+    ).filter(MatchScore.job_id.in_(job_ids)).group_by(MatchScore.job_id)}
+
+    histograms = defaultdict(lambda: [0] * HISTOGRAM_BUCKETS)
+    scores = db.session.query(MatchScore.job_id, MatchScore.overall_score).filter(MatchScore.job_id.in_(job_ids))
+    for job_id, score in scores.yield_per(5000):
+        histograms[job_id][score_bucket(score)] += 1
+
+    skill_counts = defaultdict(dict)
+    for job_id, skill, count in db.session.query(
+        Candidate.job_id, Skill.name, db.func.count(CandidateSkill.candidate_id)
+    ).join(CandidateSkill, CandidateSkill.candidate_id == Candidate.id).join(
+        Skill, Skill.id == CandidateSkill.skill_id
+    ).filter(
+        Candidate.job_id.in_(job_ids)
+    ).group_by(Candidate.job_id, Skill.name):
+        skill_counts[job_id][skill] = count
+
+    for job_id in job_ids:
+        score_count, score_sum = score_totals.get(job_id, (0, 0.0))
+        stats = db.session.get(JobStats, job_id) or JobStats(job_id=job_id)
+        stats.candidate_count = candidate_counts.get(job_id, 0)
+        stats.score_count = score_count
+        stats.score_sum = float(score_sum or 0.0)
+        stats.score_histogram = histograms[job_id]
+        stats.skill_counts = skill_counts[job_id]
+        db.session.add(stats)
+
+    logging.info(f"Rebuilt stats for {len(job_ids)} jobs")
+    return len(job_ids)
@@ -1,42 +1,52 @@
 import logging
 import json
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import heapq
 import numpy as np
+from scipy.sparse import csr_matrix
+from skill_vectors import SkillContainmentCache, SkillVectorStore
+from semantic_index import SemanticIndex
+from job_profile import education_level, job_profile
+
+# Weights of the component scores in the overall score
+SCORE_WEIGHTS = {
+    'skills': 0.4,
+    'experience': 0.3,
+    'education': 0.2,
+    'semantic': 0.1
+}
 
 class MatchingEngine:
     def __init__(self, nlp_processor):
         """Initialize matching engine with NLP processor"""
         self.nlp_processor = nlp_processor
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        self.semantic_index = SemanticIndex()
+        self.skill_vectors = SkillVectorStore(nlp_processor.nlp)
+        self.skill_containment = SkillContainmentCache()
+
+    def calculate_match_score(self, candidate, job, semantic_score=None):
+        """Calculate comprehensive match score between candidate and job
 
-    def calculate_match_score(self, candidate, job):
-        """Calculate comprehensive match score between candidate and job"""
+        ``semantic_score`` may be passed in when the caller already ranked the
+        job's pool with ``semantic_scores``.
+        """
         try:
-            # Get candidate and job data
+            # Get candidate data and the compiled job profile
             candidate_skills = candidate.extracted_skills or []
-            job_skills = []
-            
-            # Flatten job skills from all categories
-            if job.skills_required:
-                for category, skills in job.skills_required.items():
-                    job_skills.extend(skills)
+            profile = job_profile(job)
+            job_skills = profile['skills']
             
             # Calculate individual scores
-            skill_score = self._calculate_skill_match_score(candidate_skills, job_skills, job.skill_weights or {})
-            experience_score = self._calculate_experience_score(candidate, job)
-            education_score = self._calculate_education_score(candidate, job)
+            skill_credits = self._skill_credits(candidate_skills, profile['skills_lower'])
+            skill_score = float(self._weighted_skill_scores(np.array([skill_credits]), profile['weights'])[0])
+            experience_score = self._calculate_experience_score(candidate, profile)
+            education_score = self._calculate_education_score(candidate, profile)
             
             # Calculate semantic similarity
-            semantic_score = self._calculate_semantic_similarity(candidate.raw_text or "", job.description)
+            if semantic_score is None:
+                semantic_score = self._calculate_semantic_similarity(candidate, job)
             
             # Weight the scores
-            weights = {
-                'skills': 0.4,
-                'experience': 0.3,
-                'education': 0.2,
-                'semantic': 0.1
-            }
+            weights = dict(SCORE_WEIGHTS)
             
             overall_score = (
                 skill_score * weights['skills'] +
@@ -61,8 +71,9 @@ class MatchingEngine:
                 'education_score': float(education_score),
                 'semantic_score': float(semantic_score),
                 'weights_used': weights,
-                'matched_skills': list(set(candidate_skills) & set(job_skills)),
-                'missing_skills': skill_gaps
+                'matched_skills': self._matched_skills(candidate_skills, job_skills),
+                'missing_skills': skill_gaps,
+                'skill_credits': skill_credits
             }
             
             return {
@@ -89,48 +100,370 @@ class MatchingEngine:
                 'justification': "Error calculating match score"
             }
 
-    def _calculate_skill_match_score(self, candidate_skills, job_skills, skill_weights):
-        """Calculate skill matching score with weights"""
-        if not job_skills:
-            return 0
+    def score_batch(self, candidates, job, semantic_scores=None):
+        """Score a whole candidate pool against one job with array operations
+
+        Returns one result dict per candidate, in order, with the same shape
+        as ``calculate_match_score``. Skill membership, experience and
+        education are laid out as NumPy arrays so each component score is
+        computed for every candidate at once; skill gaps and matched skills
+        come out of the same membership pass. ``semantic_scores`` is an
+        optional {candidate_id: score} mapping from ``semantic_scores``.
+        """
+        candidates = list(candidates)
+        if not candidates:
+            return []
+        try:
+            profile = job_profile(job)
+            components = self._batch_components(candidates, profile)
+            semantic = self._batch_semantic_scores(candidates, job, semantic_scores)
+            overall_scores = components['partial_overall'] + semantic * SCORE_WEIGHTS['semantic']
+            
+            return [
+                self._batch_result(profile, components, row, float(semantic[row]), float(overall_scores[row]))
+                for row in range(len(candidates))
+            ]
+            
+        except Exception as e:
+            logging.error(f"Error batch scoring candidates, falling back to single scoring: {str(e)}")
+            return [
+                self.calculate_match_score(
+                    candidate, job,
+                    semantic_score=semantic_scores.get(candidate.id) if semantic_scores else None
+                )
+                for candidate in candidates
+            ]
+
+    def top_k(self, candidates, job, k, text_loader=None, chunk_size=64, semantic_scores=None):
+        """Best k candidates for a job, scoring semantics only where it can matter
+
+        Skill, experience and education scores are cheap and computed for the
+        whole pool; together with the largest possible semantic score they
+        give an upper bound on each candidate's overall score. Candidates are
+        visited in bound order and semantically scored only while their bound
+        can still beat the current k-th best score, so the expensive part
+        stops after roughly k candidates on a well-separated pool.
+
+        ``text_loader`` maps a list of candidate ids to {id: raw_text}, so
+        callers can leave resume text unloaded until it is needed.
+        ``semantic_scores`` is an optional {candidate_id: score} mapping of
+        stored semantic scores, used instead of scoring those candidates
+        again so the ranking agrees with the stored one. Returns
+        (candidate, match_result) pairs, best first.
+        """
+        candidates = list(candidates)
+        if not candidates or k <= 0:
+            return []
         
-        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
-        job_skills_lower = [skill.lower() for skill in job_skills]
+        profile = job_profile(job)
+        components = self._batch_components(candidates, profile)
+        partial_overall = components['partial_overall']
+        bounds = partial_overall + 100 * SCORE_WEIGHTS['semantic']
+        order = np.argsort(-bounds, kind='stable')
         
-        matched_skills = []
-        total_weight = 0
-        matched_weight = 0
+        # Min-heap of (overall, -row) holding the k best candidates so far
+        heap = []
+        semantic = {}
+        stored = semantic_scores or {}
+        position = 0
+        while position < len(order):
+            threshold = heap[0][0] if len(heap) >= k else -np.inf
+            if bounds[order[position]] <= threshold:
+                # Bounds only decrease from here, nobody left can enter the top k
+                break
+            rows = [int(row) for row in order[position:position + chunk_size] if bounds[row] > threshold]
+            position += chunk_size
+            
+            unscored = [row for row in rows if candidates[row].id not in stored]
+            chunk_semantic = dict(zip(
+                unscored, self._chunk_semantic_scores([candidates[row] for row in unscored], job, text_loader)
+            )) if unscored else {}
+            for row in rows:
+                semantic[row] = chunk_semantic[row] if row in chunk_semantic else stored[candidates[row].id]
+                entry = (float(partial_overall[row]) + semantic[row] * SCORE_WEIGHTS['semantic'], -row)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
         
-        for job_skill in job_skills:
-            job_skill_lower = job_skill.lower()
-            weight = skill_weights.get(job_skill, 1.0)
-            total_weight += weight
+        logging.info(f"Top-{k} ranking scored semantics for {len(semantic)} of {len(candidates)} candidates")
+        
+        return [
+            (candidates[-row], self._batch_result(profile, components, -row, semantic[-row], overall))
+            for overall, row in sorted(heap, reverse=True)
+        ]
+
+    def _chunk_semantic_scores(self, candidates, job, text_loader=None):
+        """Semantic scores (0-100) for a few candidates of a larger pool
+
+        Only candidates the job's semantic index has not seen yet need their
+        text, which ``text_loader`` fetches in one call.
+        """
+        try:
+            if job.id is None or not job.description or \
+                    any(candidate.id is None for candidate in candidates):
+                return [float(self._calculate_semantic_similarity(candidate, job)) for candidate in candidates]
             
-            # Check for exact matches or similar skills
-            if job_skill_lower in candidate_skills_lower:
-                matched_skills.append(job_skill)
-                matched_weight += weight
+            candidate_ids = [candidate.id for candidate in candidates]
+            missing = self.semantic_index.missing_candidates(job.id, job.description, candidate_ids)
+            if missing and text_loader:
+                texts = text_loader(missing)
             else:
-                # Check for partial matches or similar skills
-                for candidate_skill in candidate_skills_lower:
-                    if (job_skill_lower in candidate_skill or 
-                        candidate_skill in job_skill_lower or
-                        self._calculate_skill_similarity(job_skill_lower, candidate_skill) > 0.8):
-                        matched_skills.append(job_skill)
-                        matched_weight += weight * 0.8  # Partial match gets 80% credit
-                        break
+                missing_ids = set(missing)
+                texts = {candidate.id: candidate.raw_text for candidate in candidates if candidate.id in missing_ids}
+            new_candidates = [(candidate_id, texts.get(candidate_id)) for candidate_id in missing]
+            
+            scores = self.semantic_index.scores(job.id, job.description, candidate_ids, new_candidates)
+            return [scores.get(candidate_id, 0.0) * 100 for candidate_id in candidate_ids]
+            
+        except Exception as e:
+            logging.error(f"Error calculating semantic similarity: {str(e)}")
+            return [0.0] * len(candidates)
+
+    def _batch_components(self, candidates, profile):
+        """Skill, experience and education arrays for a pool, plus their weighted sum"""
+        credits, exact, partial = self._batch_skill_match(
+            [candidate.extracted_skills or [] for candidate in candidates],
+            profile['skills_lower']
+        )
+        skill_scores = self._weighted_skill_scores(credits, profile['weights'])
+        experience_scores = self._batch_experience_scores(candidates, profile)
+        education_scores = self._batch_education_scores(candidates, profile)
+        return {
+            'credits': credits,
+            'exact': exact,
+            # Gaps ignore embedding similarity, matching _identify_skill_gaps
+            'gaps': ~(exact | partial),
+            'skill': skill_scores,
+            'experience': experience_scores,
+            'education': education_scores,
+            'partial_overall': (
+                skill_scores * SCORE_WEIGHTS['skills'] +
+                experience_scores * SCORE_WEIGHTS['experience'] +
+                education_scores * SCORE_WEIGHTS['education']
+            )
+        }
+
+    def _batch_result(self, profile, components, row, semantic_score, overall_score):
+        """Result dict for one row of _batch_components, as calculate_match_score returns"""
+        job_skills = profile['skills']
+        skill_score = float(components['skill'][row])
+        experience_score = float(components['experience'][row])
+        education_score = float(components['education'][row])
+        skill_gaps = [job_skill for job_skill, gap in zip(job_skills, components['gaps'][row]) if gap]
+        matched_skills = list(dict.fromkeys(
+            job_skill for job_skill, hit in zip(job_skills, components['exact'][row]) if hit
+        ))
+        
+        justification = self._generate_match_justification(
+            skill_score, experience_score, education_score,
+            semantic_score, skill_gaps
+        )
+        
+        return {
+            'overall_score': float(round(overall_score, 2)),
+            'skill_score': float(round(skill_score, 2)),
+            'experience_score': float(round(experience_score, 2)),
+            'education_score': float(round(education_score, 2)),
+            'semantic_score': float(round(semantic_score, 2)),
+            'breakdown': {
+                'skill_score': skill_score,
+                'experience_score': experience_score,
+                'education_score': education_score,
+                'semantic_score': semantic_score,
+                'weights_used': dict(SCORE_WEIGHTS),
+                'matched_skills': matched_skills,
+                'missing_skills': skill_gaps,
+                'skill_credits': components['credits'][row].tolist()
+            },
+            'skill_gaps': skill_gaps,
+            'justification': justification
+        }
+
+    def _batch_skill_match(self, candidate_skill_lists, job_skills_lower):
+        """(candidates x job skills) credit matrix plus exact and substring masks"""
+        n_candidates = len(candidate_skill_lists)
+        if not job_skills_lower:
+            empty = np.zeros((n_candidates, 0), dtype=bool)
+            return np.zeros((n_candidates, 0)), empty, empty
+        
+        # Distinct candidate skills across the pool, and a sparse membership matrix
+        vocabulary = {}
+        rows, cols = [], []
+        for row, skills in enumerate(candidate_skill_lists):
+            for skill in {skill.lower() for skill in skills}:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(skill, len(vocabulary)))
+        vocabulary_skills = list(vocabulary)
+        membership = csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(n_candidates, len(vocabulary_skills))
+        )
+        
+        # Job skill x vocabulary relations are computed once for the whole pool;
+        # substring containment is also cached across batches of the same job
+        exact_pairs = np.zeros((len(job_skills_lower), len(vocabulary_skills)), dtype=np.float32)
+        for index, job_skill_lower in enumerate(job_skills_lower):
+            column = vocabulary.get(job_skill_lower)
+            if column is not None:
+                exact_pairs[index, column] = 1
+        substring_pairs = self.skill_containment.mask(job_skills_lower, vocabulary_skills).astype(np.float32)
+        similar_pairs = self.skill_vectors.similar_mask(
+            job_skills_lower, vocabulary_skills, 0.8
+        ).astype(np.float32)
+        
+        exact = np.asarray(membership @ exact_pairs.T) > 0
+        partial = np.asarray(membership @ substring_pairs.T) > 0
+        similar = np.asarray(membership @ similar_pairs.T) > 0
+        
+        # Exact matches get full credit, partial or similar skills 80%
+        credits = np.where(exact, 1.0, np.where(partial | similar, 0.8, 0.0))
+        return credits, exact, partial
+
+    def _weighted_skill_scores(self, credits, skill_weights):
+        """Skill scores (0-100) from a (candidates x job skills) credit matrix
+
+        ``skill_weights`` is the profile's weight vector, aligned with its skills.
+        """
+        if not len(skill_weights):
+            return np.zeros(len(credits))
         
+        weights = np.asarray(skill_weights, dtype=np.float64)
+        total_weight = weights.sum()
         if total_weight == 0:
-            return 0
+            return np.zeros(len(credits))
+        
+        return (credits @ weights) / total_weight * 100
+
+    def reweight_scores(self, job, breakdowns):
+        """Recompute skill and overall scores after a skill weight change
+
+        ``breakdowns`` are stored ``detailed_breakdown`` dicts. Only the skill
+        component depends on the weights, so it is recomputed from the stored
+        per-skill credits in one pass and the other components are reused.
+        Returns one {'overall_score', 'skill_score', 'breakdown',
+        'justification'} dict per breakdown, or None where the breakdown
+        predates stored credits and the candidate needs a full rescore.
+        """
+        profile = job_profile(job)
+        job_skills = profile['skills']
+        
+        usable = [
+            row for row, breakdown in enumerate(breakdowns)
+            if breakdown and len(breakdown.get('skill_credits') or ()) == len(job_skills)
+            and 'semantic_score' in breakdown
+        ]
+        results = [None] * len(breakdowns)
+        if not usable:
+            return results
+        
+        stored = [breakdowns[row] for row in usable]
+        credits = np.array([breakdown['skill_credits'] for breakdown in stored], dtype=np.float64).reshape(len(stored), len(job_skills))
+        experience_scores = np.array([breakdown['experience_score'] for breakdown in stored], dtype=np.float64)
+        education_scores = np.array([breakdown['education_score'] for breakdown in stored], dtype=np.float64)
+        semantic = np.array([breakdown['semantic_score'] for breakdown in stored], dtype=np.float64)
+        
+        skill_scores = self._weighted_skill_scores(credits, profile['weights'])
+        overall_scores = (
+            skill_scores * SCORE_WEIGHTS['skills'] +
+            experience_scores * SCORE_WEIGHTS['experience'] +
+            education_scores * SCORE_WEIGHTS['education'] +
+            semantic * SCORE_WEIGHTS['semantic']
+        )
+        
+        for index, row in enumerate(usable):
+            breakdown = dict(stored[index])
+            skill_score = float(skill_scores[index])
+            breakdown['skill_score'] = skill_score
+            results[row] = {
+                'overall_score': float(round(float(overall_scores[index]), 2)),
+                'skill_score': float(round(skill_score, 2)),
+                'breakdown': breakdown,
+                'justification': self._generate_match_justification(
+                    skill_score, breakdown['experience_score'], breakdown['education_score'],
+                    breakdown['semantic_score'], breakdown.get('missing_skills') or []
+                )
+            }
+        return results
+
+    def _batch_experience_scores(self, candidates, profile):
+        """Experience scores for the pool, see _calculate_experience_score"""
+        candidate_exp = np.array([candidate.experience_years or 0 for candidate in candidates], dtype=np.float64)
+        required_exp = profile['required_experience']
+        
+        if required_exp == 0:
+            return np.full(len(candidates), 50.0)
+        
+        bonus = np.minimum((candidate_exp - required_exp) * 5, 30)
+        penalty = (required_exp - candidate_exp) * 15
+        return np.where(
+            candidate_exp >= required_exp,
+            np.minimum(100, 80 + bonus),
+            np.maximum(0, 80 - penalty)
+        )
+
+    def _batch_education_scores(self, candidates, profile):
+        """Education scores for the pool, see _calculate_education_score"""
+        required_level = profile['required_education']
+        if required_level == 0:
+            return np.full(len(candidates), 50.0)
+        
+        candidate_levels = np.array(
+            [education_level(candidate.education or []) for candidate in candidates],
+            dtype=np.float64
+        )
+        return np.where(
+            candidate_levels >= required_level,
+            100.0,
+            np.where(candidate_levels > 0, candidate_levels / required_level * 100, 20.0)
+        )
+
+    def _batch_semantic_scores(self, candidates, job, semantic_scores=None):
+        """Semantic scores for the pool, ranking it in one pass when possible"""
+        if semantic_scores is None and job.id is not None and \
+                all(candidate.id is not None for candidate in candidates):
+            semantic_scores = self.semantic_scores(job, candidates)
+        
+        if semantic_scores is not None:
+            return np.array([semantic_scores.get(candidate.id, 0) for candidate in candidates], dtype=np.float64)
         
-        return (matched_weight / total_weight) * 100
+        return np.array([self._calculate_semantic_similarity(candidate, job) for candidate in candidates], dtype=np.float64)
 
-    def _calculate_experience_score(self, candidate, job):
+    def _skill_credits(self, candidate_skills, job_skills_lower):
+        """Credit (1, 0.8 or 0) the candidate earns for each job skill"""
+        if not job_skills_lower:
+            return []
+        
+        candidate_skills_lower = [skill.lower() for skill in candidate_skills]
+        candidate_skill_set = set(candidate_skills_lower)
+        
+        # All pairwise embedding similarities in one matrix multiply
+        similar_rows = self.skill_vectors.similar_mask(
+            job_skills_lower, candidate_skills_lower, 0.8
+        ).any(axis=1) if candidate_skills_lower else np.zeros(len(job_skills_lower), dtype=bool)
+        
+        credits = []
+        for index, job_skill_lower in enumerate(job_skills_lower):
+            # Check for exact matches or similar skills
+            if job_skill_lower in candidate_skill_set:
+                credits.append(1.0)
+            elif similar_rows[index] or any(
+                job_skill_lower in candidate_skill or candidate_skill in job_skill_lower
+                for candidate_skill in candidate_skills_lower
+            ):
+                # Partial match or similar skill gets 80% credit
+                credits.append(0.8)
+            else:
+                credits.append(0.0)
+        
+        return credits
+
+    def _calculate_experience_score(self, candidate, profile):
         """Calculate experience matching score"""
         candidate_exp = candidate.experience_years or 0
         
-        # Extract required experience from job description
-        required_exp = self._extract_required_experience(job.description)
+        # Required experience was extracted once into the job profile
+        required_exp = profile['required_experience']
         
         if required_exp == 0:
             return 50  # Neutral score if no experience requirement specified
@@ -146,35 +479,15 @@ class MatchingEngine:
             penalty = deficit * 15  # 15% penalty per year deficit
             return max(0, 80 - penalty)
 
-    def _calculate_education_score(self, candidate, job):
+    def _calculate_education_score(self, candidate, profile):
         """Calculate education matching score"""
         candidate_education = candidate.education or []
-        job_description = job.description.lower()
-        
-        # Education keywords and their scores
-        education_levels = {
-            'phd': 100,
-            'doctorate': 100,
-            'master': 80,
-            'bachelor': 60,
-            'associate': 40,
-            'diploma': 30,
-            'certificate': 20
-        }
         
-        # Check what education is required
-        required_level = 0
-        for level, score in education_levels.items():
-            if level in job_description:
-                required_level = max(required_level, score)
+        # Required education level was extracted once into the job profile
+        required_level = profile['required_education']
         
         # Check candidate's education level
-        candidate_level = 0
-        for edu in candidate_education:
-            edu_lower = edu.lower()
-            for level, score in education_levels.items():
-                if level in edu_lower:
-                    candidate_level = max(candidate_level, score)
+        candidate_level = education_level(candidate_education)
         
         if required_level == 0:
             return 50  # Neutral if no education requirement
@@ -186,18 +499,35 @@ class MatchingEngine:
         else:
             return 20  # Some credit for any education mentioned
 
-    def _calculate_semantic_similarity(self, candidate_text, job_text):
-        """Calculate semantic similarity using TF-IDF and cosine similarity"""
+    def semantic_scores(self, job, candidates):
+        """Semantic similarity (0-100) for a job's whole candidate pool
+
+        Uses the job's cached sparse candidate matrix, so the pool is ranked
+        with a single sparse matrix-vector product.
+        """
+        try:
+            if not job.description:
+                return {}
+            scores = self.semantic_index.rank(
+                job.id,
+                job.description,
+                [(candidate.id, candidate.raw_text) for candidate in candidates]
+            )
+            return {candidate_id: score * 100 for candidate_id, score in scores.items()}
+            
+        except Exception as e:
+            logging.error(f"Error ranking semantic similarity: {str(e)}")
+            return {}
+
+    def _calculate_semantic_similarity(self, candidate, job):
+        """Calculate semantic similarity using corpus TF-IDF and cosine similarity"""
         try:
+            candidate_text = candidate.raw_text or ""
+            job_text = job.description
             if not candidate_text or not job_text:
                 return 0
             
-            # Create TF-IDF vectors
-            documents = [candidate_text, job_text]
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            similarity = self.semantic_index.similarity(job.id, job_text, candidate.id, candidate_text)
             
             return similarity * 100
             
@@ -205,6 +535,13 @@ class MatchingEngine:
             logging.error(f"Error calculating semantic similarity: {str(e)}")
             return 0
 
+    def _matched_skills(self, candidate_skills, job_skills):
+        """Job skills the candidate holds exactly, ignoring case, in job order"""
+        candidate_skills_lower = {skill.lower() for skill in candidate_skills}
+        return list(dict.fromkeys(
+            job_skill for job_skill in job_skills if job_skill.lower() in candidate_skills_lower
+        ))
+
     def _identify_skill_gaps(self, candidate_skills, job_skills):
         """Identify skills that are required but missing from candidate"""
         candidate_skills_lower = [skill.lower() for skill in candidate_skills]
@@ -267,30 +604,9 @@ class MatchingEngine:
         
         return ". ".join(justifications)
 
-    def _extract_required_experience(self, job_description):
-        """Extract required years of experience from job description"""
-        import re
-        
-        # Patterns for experience requirements
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?(?:relevant\s+)?(?:professional\s+)?experience',
-            r'minimum\s+(\d+)\s+years?',
-            r'at\s+least\s+(\d+)\s+years?'
-        ]
-        
-        job_text = job_description.lower()
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, job_text)
-            if matches:
-                return max([int(match) for match in matches])
-        
-        return 0
-
     def _calculate_skill_similarity(self, skill1, skill2):
-        """Calculate similarity between two skills using spaCy"""
+        """Calculate similarity between two skills using cached skill vectors"""
         try:
-            return self.nlp_processor.nlp(skill1).similarity(self.nlp_processor.nlp(skill2))
+            return self.skill_vectors.similarity(skill1, skill2)
         except:
             return 0
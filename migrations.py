@@ -0,0 +1,220 @@
+"""
+Schema upgrades for databases created by older versions
+db.create_all() only creates missing tables, so columns and indexes added to
+existing tables since a database was created are applied here. Every step
+checks the live schema first, which makes the upgrade safe to run on every
+start-up and on both SQLite and PostgreSQL.
+"""
+
+import logging
+from sqlalchemy import func, insert, inspect, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from models import Candidate, CandidateSkill, CandidateText, JobDescription, JobSkill, MatchScore
+from job_stats import rebuild_job_stats
+from skill_index import insert_postings, normalize_skills, rebuild_skill_index, sync_job_skills
+from text_store import text_row
+
+BATCH_SIZE = 1000
+
+
+def upgrade_schema():
+    """Bring the connected database up to the current models; returns the applied steps"""
+    applied = []
+    semantic_column_missing = 'semantic_score' not in {
+        column['name'] for column in inspect(db.engine).get_columns(MatchScore.__tablename__)
+    }
+    applied.extend(convert_skill_postings())
+    applied.extend(add_missing_columns())
+    if semantic_column_missing:
+        applied.extend(backfill_semantic_scores())
+    applied.extend(backfill_candidate_skills())
+    applied.extend(move_raw_text())
+    applied.extend(deduplicate_match_scores())
+    applied.extend(create_missing_indexes())
+    applied.extend(backfill_job_skills())
+
+    for step in applied:
+        logging.info(f"Schema upgrade: {step}")
+    return applied
+
+
+def convert_skill_postings():
+    """Replace the name-keyed candidate_skill table with skill ID postings"""
+    inspector = inspect(db.engine)
+    if 'skill' not in {column['name'] for column in inspector.get_columns(CandidateSkill.__tablename__)}:
+        return []
+
+    # Postings are derived data: rebuild them from Candidate.extracted_skills
+    with db.engine.begin() as connection:
+        connection.execute(text(f'DROP TABLE {CandidateSkill.__tablename__}'))
+    CandidateSkill.__table__.create(bind=db.engine)
+    postings = rebuild_skill_index()
+    return [f"rebuilt candidate_skill with {postings} skill ID postings"]
+
+
+def backfill_candidate_skills():
+    """Skill postings for candidates saved before the skill index existed"""
+    unindexed = db.session.query(Candidate.id, Candidate.extracted_skills, Candidate.job_id).filter(
+        ~Candidate.id.in_(db.session.query(CandidateSkill.candidate_id))
+    ).order_by(Candidate.id)
+
+    postings = 0
+    job_ids = set()
+    batch = []
+    for candidate_id, skills, job_id in unindexed.yield_per(BATCH_SIZE):
+        skills = normalize_skills(skills)
+        if not skills:
+            continue
+        batch.append((candidate_id, skills))
+        if job_id is not None:
+            job_ids.add(job_id)
+        if len(batch) >= BATCH_SIZE:
+            postings += insert_postings(batch)
+            batch = []
+    if batch:
+        postings += insert_postings(batch)
+    if not postings:
+        # Candidates without skills are checked again on every start; only report real work
+        return []
+
+    # The dashboard's skill counts are aggregated from the postings
+    rebuild_job_stats(job_ids)
+    db.session.commit()
+    return [f"added {postings} skill postings for candidates of {len(job_ids)} jobs"]
+
+
+def add_missing_columns():
+    """ALTER TABLE ... ADD COLUMN for nullable model columns missing from existing tables"""
+    applied = []
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    preparer = db.engine.dialect.identifier_preparer
+
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable and column.server_default is None:
+                logging.error(f"Cannot add required column {table.name}.{column.name} to an existing table")
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as connection:
+                connection.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}"
+                ))
+            applied.append(f"added column {table.name}.{column.name}")
+    return applied
+
+
+def backfill_semantic_scores():
+    """Copy semantic scores out of stored breakdowns into the new column"""
+    filled = 0
+    last_id = 0
+    while True:
+        # Keyset batches, so the rows being read are never the ones being updated
+        rows = db.session.query(MatchScore.id, MatchScore.detailed_breakdown).filter(
+            MatchScore.id > last_id
+        ).order_by(MatchScore.id).limit(BATCH_SIZE).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        updates = [
+            {'id': score_id, 'semantic_score': breakdown['semantic_score']}
+            for score_id, breakdown in rows if breakdown and breakdown.get('semantic_score') is not None
+        ]
+        if updates:
+            db.session.execute(update(MatchScore), updates)
+            filled += len(updates)
+    db.session.commit()
+    return [f"copied {filled} semantic scores to match_score.semantic_score"] if filled else []
+
+
+def move_raw_text():
+    """Compress candidate.raw_text into the candidate_text side table and drop the column"""
+    inspector = inspect(db.engine)
+    if 'raw_text' not in {column['name'] for column in inspector.get_columns('candidate')}:
+        return []
+
+    moved = 0
+    rows = []
+    query = text(
+        'SELECT id, raw_text FROM candidate WHERE raw_text IS NOT NULL '
+        'AND id NOT IN (SELECT candidate_id FROM candidate_text)'
+    )
+    with db.engine.connect() as source:
+        for candidate_id, raw_text in source.execution_options(yield_per=BATCH_SIZE).execute(query):
+            rows.append(text_row(candidate_id, raw_text))
+            if len(rows) >= BATCH_SIZE:
+                db.session.execute(insert(CandidateText), rows)
+                moved += len(rows)
+                rows = []
+    if rows:
+        db.session.execute(insert(CandidateText), rows)
+        moved += len(rows)
+    db.session.commit()
+
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(text('ALTER TABLE candidate DROP COLUMN raw_text'))
+    except SQLAlchemyError as e:
+        # Databases without DROP COLUMN keep the column, emptied
+        logging.error(f"Could not drop candidate.raw_text, clearing it instead: {str(e)}")
+        with db.engine.begin() as connection:
+            connection.execute(text('UPDATE candidate SET raw_text = NULL'))
+    return [f"moved {moved} resume texts to candidate_text"]
+
+
+def deduplicate_match_scores():
+    """Keep only the newest score per (candidate, job) before the unique index is created"""
+    inspector = inspect(db.engine)
+    index_names = {index['name'] for index in inspector.get_indexes(MatchScore.__tablename__)}
+    if 'uq_match_score_candidate_job' in index_names:
+        return []
+
+    duplicated_jobs = [job_id for (job_id,) in db.session.query(MatchScore.job_id).group_by(
+        MatchScore.candidate_id, MatchScore.job_id
+    ).having(func.count(MatchScore.id) > 1).distinct()]
+    if not duplicated_jobs:
+        return []
+
+    newest = select(func.max(MatchScore.id)).group_by(MatchScore.candidate_id, MatchScore.job_id)
+    removed = db.session.execute(
+        MatchScore.__table__.delete().where(MatchScore.id.not_in(newest.scalar_subquery()))
+    ).rowcount
+    rebuild_job_stats(duplicated_jobs)
+    db.session.commit()
+    return [f"removed {removed} duplicate match scores"]
+
+
+def backfill_job_skills():
+    """JobSkill rows for jobs saved before the skill dictionary existed"""
+    job_ids = [job_id for (job_id,) in db.session.query(JobDescription.id).filter(
+        ~JobDescription.id.in_(db.session.query(JobSkill.job_id))
+    )]
+    if not job_ids:
+        return []
+
+    skills = 0
+    for job in JobDescription.query.filter(JobDescription.id.in_(job_ids)).all():
+        skills += sync_job_skills(job)
+    db.session.commit()
+    # Jobs without skills are checked again on every start; only report real work
+    return [f"added {skills} job skills for {len(job_ids)} jobs"] if skills else []
+
+
+def create_missing_indexes():
+    """CREATE INDEX for model indexes missing from existing tables"""
+    applied = []
+    inspector = inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(bind=db.engine)
+                applied.append(f"created index {index.name}")
+    return applied
@@ -0,0 +1,182 @@
+"""
+Lazy / background loading of the NLP models
+Keeps spaCy out of the import path so the process can answer health checks
+while models load, and runs a warm-up pass before reporting ready.
+"""
+
+import os
+import time
+import logging
+import threading
+from types import SimpleNamespace
+
+WARM_UP_RESUME = """Jane Doe
+jane.doe@example.com | Phone: 555-010-0199
+
+Summary
+Software engineer with 5 years of experience in Python, SQL and AWS.
+
+Professional Experience
+Example Corp, Backend Engineer (2019 - 2024)
+API development, data analysis and project management with Docker and Kubernetes.
+
+Education
+Bachelor of Science in Computer Science, Example University
+"""
+
+WARM_UP_JOB = """Backend Engineer
+Requirements: 3+ years of experience with Python, Django and PostgreSQL.
+Bachelor degree required. Strong communication and teamwork skills.
+"""
+
+
+class ModelLoader:
+    """Owns the NLPProcessor / MatchingEngine pair for this process
+
+    ``mode`` is ``background`` (start loading immediately on a thread),
+    ``lazy`` (load on first use) or ``eager`` (load before returning).
+    A failed load is retried on the next access once ``retry_delay`` seconds
+    have passed, doubling per failure up to ``max_retry_delay``.
+    """
+
+    def __init__(self, warm_up=True, retry_delay=5.0, max_retry_delay=300.0):
+        self.warm_up_enabled = warm_up
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.mode = 'lazy'
+        self.state = 'idle'  # idle, loading, ready, failed
+        self.error = None
+        self.failures = 0
+        self.timings = {}
+        self._created_at = time.monotonic()
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._nlp_processor = None
+        self._matching_engine = None
+
+    def start(self, mode='background'):
+        """Begin loading according to mode"""
+        self.mode = mode
+        if mode == 'eager':
+            self._load()
+        elif mode == 'background':
+            self._start_thread()
+
+    def _start_thread(self):
+        with self._lock:
+            if self.state != 'idle':
+                return
+            self.state = 'loading'
+        threading.Thread(target=self._load, name='model-loader', daemon=True).start()
+
+    def after_fork(self):
+        """Restart loading in a forked worker, see post_fork in gunicorn.conf.py"""
+        # A loader thread from the parent (e.g. gunicorn --preload) does not survive fork
+        self._lock = threading.Lock()
+        self._created_at = time.monotonic()
+        if not self._ready.is_set():
+            self._ready = threading.Event()
+            self.state = 'idle'
+            self.error = None
+            if self.mode == 'background':
+                self._start_thread()
+
+    def _load(self):
+        with self._lock:
+            if self._ready.is_set():
+                return
+            self.state = 'loading'
+            try:
+                from nlp_processor import NLPProcessor
+                from matching_engine import MatchingEngine
+
+                start = time.monotonic()
+                nlp_processor = NLPProcessor()
+                matching_engine = MatchingEngine(nlp_processor)
+                self.timings['model_load_seconds'] = round(time.monotonic() - start, 3)
+
+                if self.warm_up_enabled:
+                    start = time.monotonic()
+                    self._warm_up(nlp_processor, matching_engine)
+                    self.timings['warm_up_seconds'] = round(time.monotonic() - start, 3)
+
+                self._nlp_processor = nlp_processor
+                self._matching_engine = matching_engine
+                self.timings['ready_after_seconds'] = round(time.monotonic() - self._created_at, 3)
+                self.state = 'ready'
+                self.failures = 0
+                logging.info(f"NLP models ready (pid {os.getpid()}): {self.timings}")
+            except Exception as e:
+                self.state = 'failed'
+                self.error = str(e)
+                self.failures += 1
+                self._retry_at = time.monotonic() + min(
+                    self.retry_delay * 2 ** (self.failures - 1), self.max_retry_delay
+                )
+                logging.error(f"Error loading NLP models (attempt {self.failures}): {str(e)}")
+            finally:
+                self._ready.set()
+
+    def _warm_up(self, nlp_processor, matching_engine):
+        """Run the full extraction and scoring path once on synthetic input"""
+        job_analysis = nlp_processor.analyze_job_description(WARM_UP_JOB)
+        candidate_data = nlp_processor.extract_candidate_info(WARM_UP_RESUME)
+        # Unsaved ids keep the warm-up out of the per-job semantic caches
+        job = SimpleNamespace(
+            id=None,
+            description=WARM_UP_JOB,
+            skills_required=job_analysis['skills'],
+            skill_weights=job_analysis['skill_weights'],
+            profile=job_analysis['profile']
+        )
+        candidate = SimpleNamespace(
+            id=None,
+            raw_text=WARM_UP_RESUME,
+            extracted_skills=candidate_data['skills'],
+            experience_years=candidate_data['experience_years'],
+            education=candidate_data['education']
+        )
+        matching_engine.calculate_match_score(candidate, job)
+
+    def retry_due(self):
+        """Put a failed load back to idle once its backoff has passed"""
+        if self.state != 'failed' or time.monotonic() < self._retry_at:
+            return False
+        with self._lock:
+            if self.state != 'failed':
+                return False
+            self.state = 'idle'
+            self._ready.clear()
+            return True
+
+    def is_ready(self):
+        return self.state == 'ready'
+
+    def wait(self, timeout=None):
+        """Block until models are loaded, loading them here if nobody has started"""
+        self.retry_due()
+        if self.state == 'idle':
+            self._load()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("NLP models are still loading")
+        if self.state != 'ready':
+            raise RuntimeError(f"NLP models failed to load: {self.error}")
+
+    @property
+    def nlp_processor(self):
+        self.wait()
+        return self._nlp_processor
+
+    @property
+    def matching_engine(self):
+        self.wait()
+        return self._matching_engine
+
+    def status(self):
+        return {
+            'state': self.state,
+            'error': self.error,
+            'failures': self.failures,
+            'timings': self.timings
+        }
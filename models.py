@@ -1,6 +1,8 @@
 from app import db
 from datetime import datetime
 from sqlalchemy import Text, JSON
+from sqlalchemy.orm import deferred
+from text_store import compress_text, decompress_text
 
 class JobDescription(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -9,7 +11,8 @@ class JobDescription(db.Model):
     requirements = db.Column(JSON)  # Extracted requirements
     skills_required = db.Column(JSON)  # Categorized skills
     skill_weights = db.Column(JSON)  # Configurable weights
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    profile = db.Column(JSON)  # Compiled scoring profile, see job_profile.py
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)  # Recent jobs listing
     
     # Relationship to candidates
     candidates = db.relationship('Candidate', backref='job', lazy=True)
@@ -21,7 +24,6 @@ class Candidate(db.Model):
     phone = db.Column(db.String(20))
     filename = db.Column(db.String(255), nullable=False)
     file_path = db.Column(db.String(500), nullable=False)
-    raw_text = db.Column(Text)
     extracted_skills = db.Column(JSON)
     experience_years = db.Column(db.Integer)
     education = db.Column(JSON)
@@ -29,7 +31,34 @@ class Candidate(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Foreign key
-    job_id = db.Column(db.Integer, db.ForeignKey('job_description.id'), nullable=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_description.id'), nullable=True, index=True)
+    
+    # Resume text lives compressed in a side table and loads on first access
+    text_record = db.relationship('CandidateText', uselist=False, cascade='all, delete-orphan', backref='candidate')
+    
+    @property
+    def raw_text(self):
+        return self.text_record.text if self.text_record else None
+    
+    @raw_text.setter
+    def raw_text(self, text):
+        if text is None:
+            self.text_record = None
+        else:
+            codec, content = compress_text(text)
+            self.text_record = CandidateText(codec=codec, content=content)
+
+
+class CandidateText(db.Model):
+    """Compressed resume text of one candidate, see text_store.py"""
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidate.id'), primary_key=True)
+    codec = db.Column(db.String(10), nullable=False)
+    content = db.Column(db.LargeBinary, nullable=False)
+    
+    @property
+    def text(self):
+        return decompress_text(self.codec, self.content)
+
 
 class MatchScore(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -39,6 +68,7 @@ class MatchScore(db.Model):
     skill_match_score = db.Column(db.Float)
     experience_score = db.Column(db.Float)
     education_score = db.Column(db.Float)
+    semantic_score = db.Column(db.Float)  # Reused by live rankings, so they agree with the stored one
     detailed_breakdown = db.Column(JSON)
     skill_gaps = db.Column(JSON)
     match_justification = db.Column(Text)
@@ -47,6 +77,75 @@ class MatchScore(db.Model):
     # Relationships
     candidate = db.relationship('Candidate', backref='match_scores')
     job = db.relationship('JobDescription', backref='match_scores')
+    
+    # The rank index serves the keyset-paginated ranking (job_id = ? ORDER BY
+    # overall_score DESC, id DESC); the unique index keeps one score per
+    # candidate and job and serves lookups by candidate
+    __table_args__ = (
+        db.Index('ix_match_score_job_rank', 'job_id', 'overall_score', 'id'),
+        db.Index('uq_match_score_candidate_job', 'candidate_id', 'job_id', unique=True),
+    )
+
+
+class Skill(db.Model):
+    """Skill dictionary: one row per normalized (lowercased) skill name"""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False, unique=True)
+
+
+class CandidateSkill(db.Model):
+    """Inverted index posting: one dictionary skill held by one candidate"""
+    skill_id = db.Column(db.Integer, db.ForeignKey('skill.id'), primary_key=True)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidate.id'), primary_key=True, index=True)
+    
+    # Postings live and die with their candidate
+    candidate = db.relationship('Candidate', backref=db.backref('skill_postings', cascade='all, delete-orphan'))
+    skill = db.relationship('Skill')
+
+
+class JobSkill(db.Model):
+    """A dictionary skill required by a job, with its summed weight"""
+    job_id = db.Column(db.Integer, db.ForeignKey('job_description.id'), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skill.id'), primary_key=True, index=True)
+    weight = db.Column(db.Float, nullable=False, default=1.0)
+    
+    # Relationships
+    job = db.relationship('JobDescription', backref=db.backref('skill_requirements', cascade='all, delete-orphan'))
+    skill = db.relationship('Skill')
+
+
+class JobStats(db.Model):
+    """Materialized per-job dashboard statistics, maintained incrementally"""
+    job_id = db.Column(db.Integer, db.ForeignKey('job_description.id'), primary_key=True)
+    candidate_count = db.Column(db.Integer, default=0, nullable=False)
+    score_count = db.Column(db.Integer, default=0, nullable=False)
+    score_sum = db.Column(db.Float, default=0.0, nullable=False)
+    score_histogram = db.Column(JSON)  # Match counts per 10-point overall score bucket
+    skill_counts = db.Column(JSON)  # Normalized skill -> candidates holding it
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Relationships
+    job = db.relationship('JobDescription', backref=db.backref('stats', uselist=False))
+    
+    @property
+    def avg_score(self):
+        return round(self.score_sum / self.score_count, 2) if self.score_count else 0
+    
+    def top_skills(self, limit=5):
+        """Most common candidate skills as (skill, count) pairs"""
+        counts = self.skill_counts or {}
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    
+    def to_dict(self):
+        """Convert job statistics to dictionary for JSON serialization"""
+        return {
+            'job_id': self.job_id,
+            'candidate_count': self.candidate_count,
+            'avg_score': self.avg_score,
+            'score_histogram': self.score_histogram or [],
+            'top_skills': [{'skill': skill, 'count': count} for skill, count in self.top_skills(10)],
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
 
 
 class Appointment(db.Model):
@@ -57,7 +156,7 @@ class Appointment(db.Model):
     interviewer_name = db.Column(db.String(100), nullable=False)
     interviewer_email = db.Column(db.String(120), nullable=False)
     appointment_type = db.Column(db.String(50), default='Interview')  # Interview, Phone Screen, Technical Review
-    scheduled_start = db.Column(db.DateTime, nullable=False)
+    scheduled_start = db.Column(db.DateTime, nullable=False, index=True)  # Appointments listing
     scheduled_end = db.Column(db.DateTime, nullable=False)
     status = db.Column(db.String(20), default='scheduled')  # scheduled, completed, cancelled, rescheduled
     google_event_id = db.Column(db.String(255))  # Google Calendar event ID
@@ -89,3 +188,58 @@ class Appointment(db.Model):
             'notes': self.notes,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+
+class IngestJob(db.Model):
+    """Background resume ingestion request (one multi-file upload)"""
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_description.id'), nullable=False)
+    status = db.Column(db.String(20), default='queued')  # receiving, queued, running, completed
+    total_files = db.Column(db.Integer, default=0)
+    processed_count = db.Column(db.Integer, default=0)
+    failed_count = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    # Relationships
+    job = db.relationship('JobDescription', backref='ingest_jobs')
+    items = db.relationship('IngestItem', backref='ingest_job', lazy=True)
+    
+    def to_dict(self):
+        """Convert ingest progress to dictionary for JSON serialization"""
+        total = self.total_files or 0
+        processed = self.processed_count or 0
+        failed = self.failed_count or 0
+        return {
+            'id': self.id,
+            'job_id': self.job_id,
+            'status': self.status,
+            'total': total,
+            'processed': processed,
+            'failed': failed,
+            'queued': max(0, total - processed - failed),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class IngestItem(db.Model):
+    """One uploaded file waiting in, or finished by, the ingest queue"""
+    id = db.Column(db.Integer, primary_key=True)
+    ingest_job_id = db.Column(db.Integer, db.ForeignKey('ingest_job.id'), nullable=False, index=True)
+    filename = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)
+    file_hash = db.Column(db.String(64))
+    content = deferred(db.Column(db.LargeBinary))  # Uploaded bytes, cleared once processed
+    status = db.Column(db.String(20), default='queued', index=True)  # queued, processing, processed, failed
+    claimed_at = db.Column(db.DateTime)
+    claim_token = db.Column(db.String(32), index=True)
+    attempts = db.Column(db.Integer, default=0)  # Claims so far; the item fails after max_attempts
+    error = db.Column(Text)
+    candidate_id = db.Column(db.Integer, db.ForeignKey('candidate.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    candidate = db.relationship('Candidate')
@@ -1,10 +1,30 @@
+import os
 import spacy
 import re
 import logging
 from collections import Counter
 import json
+from skill_matcher import SkillTaxonomy
+from job_profile import compile_job_profile
+
+
+class AnalyzedDocument:
+    """Text parsed once by spaCy, shared by every extraction helper"""
+
+    __slots__ = ('doc', 'text', 'text_lower', 'lines', 'noun_chunks')
+
+    def __init__(self, doc, text):
+        self.doc = doc
+        self.text = text
+        self.text_lower = text.lower()
+        self.lines = text.split('\n')
+        self.noun_chunks = [chunk.text.strip() for chunk in doc.noun_chunks]
+
 
 class NLPProcessor:
+    # Bump whenever extraction logic changes so cached results are invalidated
+    EXTRACTOR_VERSION = '2'
+
     def __init__(self):
         """Initialize spaCy NLP processor"""
         try:
@@ -14,45 +34,110 @@ class NLPProcessor:
             logging.error("spaCy model 'en_core_web_sm' not found. Please install it with: python -m spacy download en_core_web_sm")
             raise
         
-        # Define skill categories and common skills
-        self.technical_skills = {
-            'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'swift'],
-            'web_dev': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'express'],
-            'databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'jenkins'],
-            'data_science': ['pandas', 'numpy', 'scikit-learn', 'tensorflow', 'pytorch', 'tableau', 'power bi'],
-            'tools': ['git', 'jira', 'confluence', 'slack', 'trello', 'figma', 'photoshop']
-        }
-        
-        self.soft_skills = [
-            'leadership', 'communication', 'teamwork', 'problem solving', 'analytical thinking',
-            'creativity', 'adaptability', 'time management', 'project management', 'collaboration',
-            'critical thinking', 'decision making', 'negotiation', 'presentation', 'mentoring'
-        ]
-        
-        # Create flat list of all technical skills
-        self.all_technical_skills = []
-        for category in self.technical_skills.values():
-            self.all_technical_skills.extend(category)
+        # Skill taxonomy is loaded from a versioned data file and can be hot swapped
+        self.skill_taxonomy = SkillTaxonomy.load()
+
+    @property
+    def technical_skills(self):
+        return self.skill_taxonomy.technical_skills
+
+    @property
+    def soft_skills(self):
+        return self.skill_taxonomy.soft_skills
+
+    @property
+    def all_technical_skills(self):
+        return self.skill_taxonomy.all_technical_skills
+
+    @property
+    def extractor_version(self):
+        """Version string covering extraction code, spaCy model and skill taxonomy"""
+        meta = getattr(self.nlp, 'meta', {}) or {}
+        return f"{self.EXTRACTOR_VERSION}-{meta.get('name', 'nlp')}-{meta.get('version', '0')}-{self.skill_taxonomy.version}"
+
+    def reload_skill_taxonomy(self, path=None):
+        """Load a new skill taxonomy and swap it in without restarting"""
+        taxonomy = SkillTaxonomy.load(path or self.skill_taxonomy.source_path)
+        # Single attribute assignment, so in-flight extractions keep a consistent taxonomy
+        self.skill_taxonomy = taxonomy
+        return taxonomy
+
+    def analyze(self, text):
+        """Parse text once and return an AnalyzedDocument"""
+        return AnalyzedDocument(self.nlp(text), text)
 
     def extract_candidate_info(self, text):
         """Extract structured information from resume text"""
-        doc = self.nlp(text)
-        
+        return self._build_candidate_info(self.analyze(text))
+
+    def extract_candidates_batch(self, texts, batch_size=32, n_process=1):
+        """Extract candidate information for many resume texts at once.
+
+        Documents are streamed through ``self.nlp.pipe`` so spaCy can batch
+        them (and fan out over ``n_process`` worker processes). Results are
+        returned in input order; a document that fails yields
+        ``{'error': message}`` instead of aborting the whole batch.
+        """
+        texts = list(texts)
+        results = [None] * len(texts)
+
+        valid_indices = []
+        for index, text in enumerate(texts):
+            if isinstance(text, str) and text.strip():
+                valid_indices.append(index)
+            else:
+                results[index] = {'error': 'No text to process'}
+
+        if not valid_indices:
+            return results
+
+        # Extra processes only pay off when there are batches to hand them
+        if n_process == -1:
+            n_process = os.cpu_count() or 1
+        n_process = max(1, min(n_process, -(-len(valid_indices) // batch_size)))
+
+        try:
+            docs = self.nlp.pipe(
+                (texts[index] for index in valid_indices),
+                batch_size=batch_size,
+                n_process=n_process
+            )
+            for index, doc in zip(valid_indices, docs):
+                try:
+                    results[index] = self._build_candidate_info(AnalyzedDocument(doc, texts[index]))
+                except Exception as e:
+                    logging.error(f"Error extracting candidate info for document {index}: {str(e)}")
+                    results[index] = {'error': str(e)}
+        except Exception as e:
+            # The pipe itself failed; finish the remaining documents one by one
+            logging.error(f"Batch NLP pipeline failed, falling back to per-document processing: {str(e)}")
+            for index in valid_indices:
+                if results[index] is not None:
+                    continue
+                try:
+                    results[index] = self.extract_candidate_info(texts[index])
+                except Exception as doc_error:
+                    logging.error(f"Error extracting candidate info for document {index}: {str(doc_error)}")
+                    results[index] = {'error': str(doc_error)}
+
+        return results
+
+    def _build_candidate_info(self, analyzed):
+        """Build the candidate info dict from an AnalyzedDocument"""
         # Extract basic information
-        name = self._extract_name(doc, text)
-        email = self._extract_email(text)
-        phone = self._extract_phone(text)
+        name = self._extract_name(analyzed)
+        email = self._extract_email(analyzed)
+        phone = self._extract_phone(analyzed)
         
         # Extract skills
-        skills = self._extract_skills(text)
+        skills = self._extract_skills(analyzed)
         
         # Extract experience
-        experience_years = self._extract_experience_years(text)
-        work_experience = self._extract_work_experience(text)
+        experience_years = self._extract_experience_years(analyzed)
+        work_experience = self._extract_work_experience(analyzed)
         
         # Extract education
-        education = self._extract_education(text)
+        education = self._extract_education(analyzed)
         
         return {
             'name': name,
@@ -66,16 +151,16 @@ class NLPProcessor:
 
     def analyze_job_description(self, text):
         """Analyze job description to extract requirements and skills"""
-        doc = self.nlp(text)
+        analyzed = self.analyze(text)
         
         # Extract required skills
-        required_skills = self._extract_skills(text)
+        required_skills = self._extract_skills(analyzed)
         
         # Categorize skills
         categorized_skills = self._categorize_skills(required_skills)
         
         # Extract requirements sections
-        requirements = self._extract_requirements(text)
+        requirements = self._extract_requirements(analyzed)
         
         # Generate default skill weights
         skill_weights = self._generate_skill_weights(categorized_skills)
@@ -83,14 +168,16 @@ class NLPProcessor:
         return {
             'skills': categorized_skills,
             'requirements': requirements,
-            'skill_weights': skill_weights
+            'skill_weights': skill_weights,
+            'profile': compile_job_profile(text, categorized_skills, skill_weights)
         }
 
-    def _extract_name(self, doc, text):
+    def _extract_name(self, analyzed):
         """Extract candidate name from resume using multiple strategies"""
+        text = analyzed.text
         
         # Strategy 1: Look for name near email address
-        email = self._extract_email(text)
+        email = self._extract_email(analyzed)
         if email:
             # Extract name from email (before @)
             email_name = email.split('@')[0]
@@ -122,14 +209,13 @@ class NLPProcessor:
             'exception', 'cloud', 'software', 'technical', 'development', 'backend'
         ]
         
-        for ent in doc.ents:
+        for ent in analyzed.doc.ents:
             if ent.label_ == "PERSON" and len(ent.text.split()) >= 2:
                 if self._is_valid_name(ent.text) and not any(keyword in ent.text.lower() for keyword in job_keywords):
                     return ent.text.strip()
         
         # Strategy 4: Look at first few lines for capitalized names
-        lines = text.split('\n')[:10]
-        for line in lines:
+        for line in analyzed.lines[:10]:
             line = line.strip()
             if len(line) > 0 and not any(char in line for char in '@#$%&*+=|\\/<>()[]{}'):
                 words = line.split()
@@ -173,14 +259,15 @@ class NLPProcessor:
         
         return True
 
-    def _extract_email(self, text):
+    def _extract_email(self, analyzed):
         """Extract email address from text"""
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
+        matches = re.findall(email_pattern, analyzed.text)
         return matches[0] if matches else None
 
-    def _extract_phone(self, text):
+    def _extract_phone(self, analyzed):
         """Extract phone number from text - prioritize 10-digit numbers"""
+        text = analyzed.text
         
         # Strategy 1: Look for explicit mobile number patterns
         mobile_patterns = [
@@ -228,30 +315,19 @@ class NLPProcessor:
         
         return None
 
-    def _extract_skills(self, text):
+    def _extract_skills(self, analyzed):
         """Extract skills from text using pattern matching and NLP"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Check for technical skills
-        for skill in self.all_technical_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        # Check for soft skills
-        for skill in self.soft_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        # Technical and soft skills (including aliases) in a single pass
+        found_skills = self.skill_taxonomy.find_skills(analyzed.text_lower)
         
         # Use spaCy to find additional skills (noun phrases that might be skills)
-        doc = self.nlp(text)
-        for chunk in doc.noun_chunks:
-            chunk_text = chunk.text.lower().strip()
+        for chunk in analyzed.noun_chunks:
+            chunk_text = chunk.lower()
             # Skip very short or very long phrases
             if 2 <= len(chunk_text.split()) <= 3:
                 # Check if it contains skill-like keywords
                 if any(keyword in chunk_text for keyword in ['development', 'management', 'analysis', 'design']):
-                    found_skills.append(chunk.text.strip())
+                    found_skills.append(chunk)
         
         # Remove duplicates and return
         return list(set(found_skills))
@@ -264,16 +340,16 @@ class NLPProcessor:
             'domain_specific': []
         }
         
-        skills_lower = [skill.lower() for skill in skills]
+        taxonomy = self.skill_taxonomy
         
         for skill in skills:
-            skill_lower = skill.lower()
+            category = taxonomy.category_of(skill)
             
             # Check if it's a technical skill
-            if skill_lower in self.all_technical_skills:
+            if category == 'technical':
                 categorized['technical'].append(skill)
             # Check if it's a soft skill
-            elif skill_lower in [s.lower() for s in self.soft_skills]:
+            elif category == 'soft':
                 categorized['soft'].append(skill)
             else:
                 # Everything else is domain-specific
@@ -281,18 +357,18 @@ class NLPProcessor:
         
         return categorized
 
-    def _extract_experience_years(self, text):
+    def _extract_experience_years(self, analyzed):
         """Extract years of experience from text"""
         # Pattern for "X years of experience"
         pattern = r'(\d+)[\s\-\+]*(?:years?|yrs?)[\s]*(?:of\s+)?(?:experience|exp)'
-        matches = re.findall(pattern, text.lower())
+        matches = re.findall(pattern, analyzed.text_lower)
         
         if matches:
             return max([int(match) for match in matches])
         
         # Look for date ranges to calculate experience
         date_pattern = r'(19|20)\d{2}'
-        years = re.findall(date_pattern, text)
+        years = re.findall(date_pattern, analyzed.text)
         if len(years) >= 2:
             years = [int(year + decade) for year, decade in years]
             years.sort()
@@ -300,10 +376,10 @@ class NLPProcessor:
         
         return 0
 
-    def _extract_work_experience(self, text):
+    def _extract_work_experience(self, analyzed):
         """Extract work experience entries"""
         # This is a simplified extraction - in practice, you'd want more sophisticated parsing
-        lines = text.split('\n')
+        lines = analyzed.lines
         work_sections = []
         
         current_section = []
@@ -337,10 +413,10 @@ class NLPProcessor:
         
         return work_sections
 
-    def _extract_education(self, text):
+    def _extract_education(self, analyzed):
         """Extract education information"""
         education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college', 'institute']
-        lines = text.split('\n')
+        lines = analyzed.lines
         education_entries = []
         
         for line in lines:
@@ -350,10 +426,10 @@ class NLPProcessor:
         
         return education_entries
 
-    def _extract_requirements(self, text):
+    def _extract_requirements(self, analyzed):
         """Extract requirement sections from job description"""
         requirements = []
-        lines = text.split('\n')
+        lines = analyzed.lines
         
         requirement_keywords = ['requirements', 'qualifications', 'must have', 'required', 'responsibilities']
         
@@ -1,21 +1,38 @@
 import os
 import json
+import importlib.util
 import logging
 from datetime import datetime, timedelta
-from flask import render_template, request, redirect, url_for, flash, jsonify, send_file
+from flask import render_template, request, redirect, url_for, flash, jsonify, Response, stream_with_context
 from werkzeug.utils import secure_filename
+from sqlalchemy import update
+from sqlalchemy.orm import selectinload
 from app import app, db
-from models import JobDescription, Candidate, MatchScore, Appointment
-from document_parser import DocumentParser
-from nlp_processor import NLPProcessor
-from matching_engine import MatchingEngine
-from utils import allowed_file, export_candidates_csv
+from models import JobDescription, JobStats, JobSkill, Skill, Candidate, CandidateSkill, CandidateText, MatchScore, Appointment, IngestJob, IngestItem
+from model_loader import ModelLoader
+from extraction_cache import ExtractionCache, content_hash
+from ingest import IngestPool
+from job_profile import job_profile, with_weights
+from skill_index import discover_candidates, load_raw_texts, ranking_candidates, stored_semantic_scores, rebuild_skill_index, sync_job_skills
+from job_stats import apply_stats_delta, new_job_stats, rebuild_job_stats
+from candidate_listing import DEFAULT_PAGE_SIZE, InvalidCursor, candidate_page
+from ingest_queue import IngestQueue, stream_progress
+from archive_ingest import ArchiveError, ArchiveLimits, is_archive, iter_archive_members
+from utils import EXPORT_FORMATS, allowed_file, attachment_disposition, save_upload_async, upload_path, stream_candidates_export
 from google_calendar_service import GoogleCalendarService
 import pandas as pd
 
-# Initialize processors
-nlp_processor = NLPProcessor()
-matching_engine = MatchingEngine(nlp_processor)
+# Initialize processors; NLP models load in the background (MODEL_LOADING=background|lazy|eager)
+nlp_models = ModelLoader(warm_up=os.environ.get('MODEL_WARM_UP', 'true').lower() != 'false')
+nlp_models.start(os.environ.get('MODEL_LOADING', 'background'))
+extraction_cache = ExtractionCache.from_env()
+ingest_pool = IngestPool.from_env()
+ingest_queue = IngestQueue.from_env(nlp_models, extraction_cache=extraction_cache, pool=ingest_pool)
+
+@app.before_request
+def start_ingest_workers():
+    """Make sure this process drains its ingest queue (also resumes work after a restart)"""
+    ingest_queue.ensure_workers()
 
 @app.route('/')
 def index():
@@ -33,7 +50,11 @@ def index():
 def upload():
     """Upload page for job descriptions and resumes"""
     jobs = JobDescription.query.all()
-    return render_template('upload.html', jobs=jobs)
+    ingest_job = None
+    ingest_id = request.args.get('ingest_id', type=int)
+    if ingest_id:
+        ingest_job = db.session.get(IngestJob, ingest_id)
+    return render_template('upload.html', jobs=jobs, ingest_job=ingest_job)
 
 @app.route('/upload_job', methods=['POST'])
 def upload_job():
@@ -47,7 +68,7 @@ def upload_job():
             return redirect(url_for('upload'))
         
         # Process job description with NLP
-        job_analysis = nlp_processor.analyze_job_description(description)
+        job_analysis = nlp_models.nlp_processor.analyze_job_description(description)
         
         # Create job record
         job = JobDescription(
@@ -55,10 +76,14 @@ def upload_job():
             description=description,
             requirements=job_analysis['requirements'],
             skills_required=job_analysis['skills'],
-            skill_weights=job_analysis['skill_weights']
+            skill_weights=job_analysis['skill_weights'],
+            profile=job_analysis['profile']
         )
         
         db.session.add(job)
+        db.session.add(new_job_stats(job))
+        db.session.flush()
+        sync_job_skills(job)
         db.session.commit()
         
         flash(f'Job description "{title}" uploaded successfully!', 'success')
@@ -85,91 +110,159 @@ def upload_resumes():
             flash('No files selected', 'error')
             return redirect(url_for('upload'))
         
-        uploaded_count = 0
+        # Read every file into memory, then hand the batch to the background ingest queue
+        uploads = []
         for file in files:
             if file and allowed_file(file.filename):
                 try:
-                    # Save file
+                    content = file.read()
                     filename = secure_filename(file.filename)
-                    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                    file.save(file_path)
-                    
-                    # Parse document
-                    parser = DocumentParser()
-                    raw_text = parser.extract_text(file_path)
-                    
-                    # Process with NLP
-                    candidate_data = nlp_processor.extract_candidate_info(raw_text)
-                    
-                    # Create candidate record
-                    candidate = Candidate(
-                        name=candidate_data.get('name', 'Unknown'),
-                        email=candidate_data.get('email'),
-                        phone=candidate_data.get('phone'),
-                        filename=filename,
-                        file_path=file_path,
-                        raw_text=raw_text,
-                        extracted_skills=candidate_data.get('skills', []),
-                        experience_years=candidate_data.get('experience_years'),
-                        education=candidate_data.get('education', []),
-                        work_experience=candidate_data.get('work_experience', []),
-                        job_id=job.id
-                    )
+                    file_path = ''
                     
-                    db.session.add(candidate)
-                    db.session.flush()  # Get the ID
+                    # Keeping the original is optional and happens off the request path
+                    if app.config['PERSIST_UPLOADS']:
+                        file_path = upload_path(app.config['UPLOAD_FOLDER'], filename)
+                        save_upload_async(file_path, content)
                     
-                    # Calculate match score
-                    match_result = matching_engine.calculate_match_score(candidate, job)
-                    
-                    # Create match score record
-                    match_score = MatchScore(
-                        candidate_id=candidate.id,
-                        job_id=job.id,
-                        overall_score=match_result['overall_score'],
-                        skill_match_score=match_result['skill_score'],
-                        experience_score=match_result['experience_score'],
-                        education_score=match_result['education_score'],
-                        detailed_breakdown=match_result['breakdown'],
-                        skill_gaps=match_result['skill_gaps'],
-                        match_justification=match_result['justification']
-                    )
-                    
-                    db.session.add(match_score)
-                    uploaded_count += 1
+                    uploads.append((filename, file_path, content_hash(content), content))
                     
                 except Exception as e:
-                    logging.error(f"Error processing file {filename}: {str(e)}")
+                    logging.error(f"Error reading file {file.filename}: {str(e)}")
                     continue
         
-        db.session.commit()
-        flash(f'Successfully processed {uploaded_count} resumes!', 'success')
-        return redirect(url_for('candidates', job_id=job_id))
+        if not uploads:
+            flash('No supported files were uploaded', 'error')
+            return redirect(url_for('upload'))
+        
+        ingest_job = ingest_queue.enqueue(job, uploads)
+        
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify({
+                'ingest_id': ingest_job.id,
+                'status_url': url_for('ingest_status', ingest_id=ingest_job.id),
+                'stream_url': url_for('ingest_stream', ingest_id=ingest_job.id)
+            }), 202
+        
+        flash(f'{len(uploads)} resumes queued for processing.', 'info')
+        return redirect(url_for('upload', ingest_id=ingest_job.id))
         
     except Exception as e:
         logging.error(f"Error uploading resumes: {str(e)}")
         flash('Error processing resumes. Please try again.', 'error')
         return redirect(url_for('upload'))
 
+@app.route('/upload_archive', methods=['POST'])
+def upload_archive():
+    """Handle a ZIP / tar.gz archive of resumes, streaming members into the ingest queue"""
+    try:
+        job_id = request.form.get('job_id')
+        if not job_id:
+            flash('Please select a job to match candidates against', 'error')
+            return redirect(url_for('upload'))
+        
+        job = JobDescription.query.get_or_404(job_id)
+        archive = request.files.get('archive')
+        
+        if not archive or not archive.filename or not is_archive(archive.filename):
+            flash('Please select a ZIP or tar.gz archive', 'error')
+            return redirect(url_for('upload'))
+        
+        # Werkzeug has already spooled the upload; find its size for the ratio budget
+        archive.stream.seek(0, os.SEEK_END)
+        archive_size = archive.stream.tell()
+        archive.stream.seek(0)
+        
+        ingest_job = ingest_queue.open_job(job)
+        chunk_size = ingest_queue.chunk_size
+        uploads = []
+        failures = []
+        queued_count = 0
+        skipped_count = 0
+        try:
+            for member_name, content, error in iter_archive_members(
+                    archive.stream, archive.filename, archive_size, ArchiveLimits.from_env()):
+                filename = secure_filename(os.path.basename(member_name))
+                if content is None:
+                    logging.warning(f"Skipping archive member {member_name}: {error}")
+                    failures.append((filename, error))
+                    skipped_count += 1
+                    continue
+                queued_count += 1
+                
+                file_path = ''
+                if app.config['PERSIST_UPLOADS']:
+                    file_path = upload_path(app.config['UPLOAD_FOLDER'], filename)
+                    save_upload_async(file_path, content)
+                uploads.append((filename, file_path, content_hash(content), content))
+                
+                # Hand members to the workers in chunks so memory stays bounded
+                if len(uploads) >= chunk_size:
+                    ingest_queue.add_uploads(ingest_job, uploads, failures)
+                    uploads, failures = [], []
+        except ArchiveError as e:
+            logging.error(f"Archive {archive.filename} rejected: {str(e)}")
+            flash(f'Archive stopped early: {str(e)}', 'error')
+        finally:
+            if uploads or failures:
+                ingest_queue.add_uploads(ingest_job, uploads, failures)
+            ingest_queue.close_job(ingest_job)
+        
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify({
+                'ingest_id': ingest_job.id,
+                'status_url': url_for('ingest_status', ingest_id=ingest_job.id),
+                'stream_url': url_for('ingest_stream', ingest_id=ingest_job.id)
+            }), 202
+        
+        skipped = f', {skipped_count} skipped' if skipped_count else ''
+        flash(f'{queued_count} resumes from {archive.filename} queued for processing{skipped}.', 'info')
+        return redirect(url_for('upload', ingest_id=ingest_job.id))
+        
+    except Exception as e:
+        logging.error(f"Error uploading archive: {str(e)}")
+        flash('Error processing archive. Please try again.', 'error')
+        return redirect(url_for('upload'))
+
+@app.route('/ingest/<int:ingest_id>')
+def ingest_status(ingest_id):
+    """Progress of a background resume ingest"""
+    ingest_job = IngestJob.query.get_or_404(ingest_id)
+    return jsonify(ingest_job.to_dict())
+
+@app.route('/ingest/<int:ingest_id>/stream')
+def ingest_stream(ingest_id):
+    """Server-Sent Events stream of ingest progress"""
+    IngestJob.query.get_or_404(ingest_id)
+    return Response(
+        stream_with_context(stream_progress(ingest_id)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/dashboard')
 def dashboard():
     """Main dashboard with job and candidate overview"""
-    jobs = JobDescription.query.order_by(JobDescription.created_at.desc()).all()
+    # Jobs with their materialized statistics in one query
+    rows = db.session.query(JobDescription, JobStats).outerjoin(
+        JobStats, JobStats.job_id == JobDescription.id
+    ).order_by(JobDescription.created_at.desc()).all()
+    
+    # Jobs created before stats were materialized are backfilled once
+    missing = [job.id for job, stats in rows if stats is None]
+    if missing:
+        rebuild_job_stats(missing)
+        db.session.commit()
+        stats_by_job = {stats.job_id: stats for stats in JobStats.query.filter(JobStats.job_id.in_(missing))}
+        rows = [(job, stats or stats_by_job.get(job.id)) for job, stats in rows]
     
-    # Calculate statistics for each job
     job_stats = []
-    for job in jobs:
-        candidate_count = Candidate.query.filter_by(job_id=job.id).count()
-        if candidate_count > 0:
-            avg_score = db.session.query(db.func.avg(MatchScore.overall_score)).filter_by(job_id=job.id).scalar()
-            avg_score = round(avg_score, 2) if avg_score else 0
-        else:
-            avg_score = 0
-            
+    for job, stats in rows:
         job_stats.append({
             'job': job,
-            'candidate_count': candidate_count,
-            'avg_score': avg_score
+            'candidate_count': stats.candidate_count,
+            'avg_score': stats.avg_score,
+            'score_histogram': stats.score_histogram or [],
+            'top_skills': stats.top_skills()
         })
     
     return render_template('dashboard.html', job_stats=job_stats)
@@ -180,27 +273,74 @@ def job_detail(job_id):
     job = JobDescription.query.get_or_404(job_id)
     return render_template('job_detail.html', job=job)
 
+def candidate_page_args():
+    """Pagination and filter arguments shared by the HTML and JSON listings"""
+    skills = request.args.getlist('skills')
+    return {
+        'after': request.args.get('after') or None,
+        'limit': request.args.get('limit', DEFAULT_PAGE_SIZE, type=int),
+        'min_score': request.args.get('min_score', type=float),
+        'max_score': request.args.get('max_score', type=float),
+        'skills': [skill for value in skills for skill in value.split(',') if skill.strip()]
+    }
+
 @app.route('/candidates/<int:job_id>')
 def candidates(job_id):
-    """View ranked candidates for a specific job"""
+    """View ranked candidates for a specific job, one keyset page at a time"""
     job = JobDescription.query.get_or_404(job_id)
+    filters = candidate_page_args()
     
-    # Get candidates with their match scores, ordered by score
-    candidates_with_scores = db.session.query(Candidate, MatchScore).join(
-        MatchScore, Candidate.id == MatchScore.candidate_id
-    ).filter(
-        Candidate.job_id == job_id
-    ).order_by(MatchScore.overall_score.desc()).all()
+    try:
+        page = candidate_page(job_id, **filters)
+    except InvalidCursor:
+        flash('That page link is no longer valid, showing the first page.', 'warning')
+        return redirect(url_for('candidates', job_id=job_id))
     
-    # Debug logging
-    logging.info(f"Found {len(candidates_with_scores)} candidates for job {job_id}")
-    if candidates_with_scores:
-        first_candidate = candidates_with_scores[0][0]
-        logging.info(f"First candidate: name={first_candidate.name}, skills={first_candidate.extracted_skills}")
+    logging.info(f"Listing {len(page.rows)} candidates for job {job_id} from rank {page.offset + 1}")
     
     return render_template('candidates.html', 
                          job=job, 
-                         candidates_with_scores=candidates_with_scores)
+                         candidates_with_scores=page.rows,
+                         page=page,
+                         filters=filters,
+                         next_url=next_page_url('candidates', job_id, page))
+
+@app.route('/jobs/<int:job_id>/candidates')
+def candidates_api(job_id):
+    """JSON listing of a job's ranked candidates, keyset paginated"""
+    job = JobDescription.query.get_or_404(job_id)
+    try:
+        page = candidate_page(job_id, **candidate_page_args())
+    except InvalidCursor as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({
+        'job_id': job.id,
+        'candidates': [{
+            'rank': page.offset + index + 1,
+            'candidate_id': candidate.id,
+            'name': candidate.name,
+            'email': candidate.email,
+            'phone': candidate.phone,
+            'experience_years': candidate.experience_years,
+            'skills': candidate.extracted_skills or [],
+            'overall_score': match_score.overall_score,
+            'skill_score': match_score.skill_match_score,
+            'experience_score': match_score.experience_score,
+            'education_score': match_score.education_score,
+            'skill_gaps': match_score.skill_gaps or []
+        } for index, (candidate, match_score) in enumerate(page.rows)],
+        'next_cursor': page.next_cursor,
+        'next_url': next_page_url('candidates_api', job.id, page)
+    })
+
+def next_page_url(endpoint, job_id, page):
+    """URL of the page after ``page``, keeping the current filters"""
+    if not page.next_cursor:
+        return None
+    args = request.args.to_dict(flat=False)
+    args.pop('after', None)
+    return url_for(endpoint, job_id=job_id, after=page.next_cursor, **args)
 
 @app.route('/update_weights/<int:job_id>', methods=['POST'])
 def update_weights(job_id):
@@ -210,27 +350,67 @@ def update_weights(job_id):
         weights = request.get_json()
         
         job.skill_weights = weights
-        db.session.commit()
-        
-        # Recalculate all match scores for this job
-        candidates = Candidate.query.filter_by(job_id=job_id).all()
-        for candidate in candidates:
-            match_result = matching_engine.calculate_match_score(candidate, job)
-            
-            # Update existing match score
-            match_score = MatchScore.query.filter_by(
-                candidate_id=candidate.id, 
-                job_id=job_id
-            ).first()
+        job.profile = with_weights(job_profile(job), weights)
+        sync_job_skills(job)
+        
+        # Only the skill component depends on the weights: reweight the stored
+        # per-skill credits instead of rescoring every candidate
+        rows = db.session.query(
+            MatchScore.id, MatchScore.candidate_id, MatchScore.overall_score, MatchScore.detailed_breakdown
+        ).filter_by(job_id=job_id).all()
+        matching_engine = nlp_models.matching_engine
+        reweighted = matching_engine.reweight_scores(job, [row.detailed_breakdown for row in rows])
+        
+        updates = []
+        stale_rows = []
+        for row, result in zip(rows, reweighted):
+            if result is None:
+                stale_rows.append(row)
+                continue
+            updates.append({
+                'id': row.id,
+                'overall_score': result['overall_score'],
+                'skill_match_score': result['skill_score'],
+                'detailed_breakdown': result['breakdown'],
+                'match_justification': result['justification']
+            })
+        
+        # Scores saved before skill credits were stored get a full rescore
+        if stale_rows:
+            candidates = Candidate.query.options(selectinload(Candidate.text_record)).filter(
+                Candidate.id.in_({row.candidate_id for row in stale_rows})
+            ).all()
+            match_results = dict(zip(
+                [candidate.id for candidate in candidates],
+                matching_engine.score_batch(candidates, job)
+            ))
+            for row in stale_rows:
+                match_result = match_results.get(row.candidate_id)
+                if match_result is None:
+                    continue
+                updates.append({
+                    'id': row.id,
+                    'overall_score': match_result['overall_score'],
+                    'skill_match_score': match_result['skill_score'],
+                    'experience_score': match_result['experience_score'],
+                    'education_score': match_result['education_score'],
+                    'semantic_score': match_result['breakdown'].get('semantic_score'),
+                    'detailed_breakdown': match_result['breakdown'],
+                    'skill_gaps': match_result['skill_gaps'],
+                    'match_justification': match_result['justification']
+                })
+        
+        # One bulk UPDATE by primary key
+        if updates:
+            db.session.execute(update(MatchScore), updates)
             
-            if match_score:
-                match_score.overall_score = match_result['overall_score']
-                match_score.skill_match_score = match_result['skill_score']
-                match_score.experience_score = match_result['experience_score']
-                match_score.education_score = match_result['education_score']
-                match_score.detailed_breakdown = match_result['breakdown']
-                match_score.skill_gaps = match_result['skill_gaps']
-                match_score.match_justification = match_result['justification']
+            # Move the job's score stats from the old scores to the new ones
+            old_scores = {row.id: row.overall_score for row in rows}
+            apply_stats_delta(
+                job_id,
+                scores_added=[change['overall_score'] for change in updates],
+                scores_removed=[old_scores[change['id']] for change in updates]
+            )
         
         db.session.commit()
         return jsonify({'success': True})
@@ -239,31 +419,159 @@ def update_weights(job_id):
         logging.error(f"Error updating weights: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/skills/reload', methods=['POST'])
+def reload_skill_taxonomy():
+    """Hot swap the skill taxonomy from its data file"""
+    try:
+        taxonomy = nlp_models.nlp_processor.reload_skill_taxonomy()
+        return jsonify({'success': True, 'version': taxonomy.version})
+        
+    except Exception as e:
+        logging.error(f"Error reloading skill taxonomy: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/jobs/<int:job_id>/stats')
+def job_statistics(job_id):
+    """Materialized statistics for one job"""
+    job = JobDescription.query.get_or_404(job_id)
+    if job.stats is None:
+        rebuild_job_stats([job.id])
+        db.session.commit()
+    return jsonify(job.stats.to_dict())
+
+@app.route('/stats/rebuild', methods=['POST'])
+def rebuild_stats():
+    """Recompute the materialized dashboard statistics for every job"""
+    try:
+        jobs = rebuild_job_stats()
+        db.session.commit()
+        return jsonify({'success': True, 'jobs': jobs})
+        
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error rebuilding job stats: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/skills/reindex', methods=['POST'])
+def reindex_skills():
+    """Rebuild the skill inverted index from stored candidates"""
+    try:
+        postings = rebuild_skill_index()
+        return jsonify({'success': True, 'postings': postings})
+        
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Error rebuilding skill index: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/jobs/<int:job_id>/discover')
+def discover(job_id):
+    """Rank existing candidates from any job against this job"""
+    job = JobDescription.query.get_or_404(job_id)
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 200)
+        depth = max(limit, min(request.args.get('depth', 200, type=int), 2000))
+        include_current = request.args.get('include_current', 'false').lower() in ('1', 'true', 'yes')
+        
+        ranked = discover_candidates(
+            job, nlp_models.matching_engine,
+            limit=limit, depth=depth, include_current=include_current
+        )
+        
+        return jsonify({
+            'job_id': job.id,
+            'candidates': [ranked_candidate_dict(candidate, match_result) for candidate, match_result in ranked]
+        })
+        
+    except Exception as e:
+        logging.error(f"Error discovering candidates: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/jobs/<int:job_id>/top')
+def top_candidates(job_id):
+    """Live top-K ranking of a job's candidates"""
+    job = JobDescription.query.get_or_404(job_id)
+    try:
+        k = min(request.args.get('k', 50, type=int), 1000)
+        
+        # Only the scoring columns are read; resume text is loaded only for
+        # candidates that reach semantic scoring
+        candidates = ranking_candidates(Candidate.job_id == job_id)
+        ranked = nlp_models.matching_engine.top_k(
+            candidates, job, k,
+            text_loader=load_raw_texts,
+            semantic_scores=stored_semantic_scores(job_id)
+        )
+        
+        return jsonify({
+            'job_id': job.id,
+            'candidates': [ranked_candidate_dict(candidate, match_result) for candidate, match_result in ranked]
+        })
+        
+    except Exception as e:
+        logging.error(f"Error ranking candidates: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def ranked_candidate_dict(candidate, match_result):
+    """JSON entry for a candidate in a live ranking"""
+    return {
+        'candidate_id': candidate.id,
+        'name': candidate.name,
+        'email': candidate.email,
+        'job_id': candidate.job_id,
+        'overall_score': match_result['overall_score'],
+        'skill_score': match_result['skill_score'],
+        'experience_score': match_result['experience_score'],
+        'education_score': match_result['education_score'],
+        'semantic_score': match_result['semantic_score'],
+        'matched_skills': match_result['breakdown'].get('matched_skills', []),
+        'skill_gaps': match_result['skill_gaps']
+    }
+
 @app.route('/export_candidates/<int:job_id>')
 def export_candidates(job_id):
-    """Export shortlisted candidates to CSV"""
+    """Stream shortlisted candidates as CSV, JSON Lines or Parquet"""
     try:
         job = JobDescription.query.get_or_404(job_id)
         
         # Get candidates with scores above threshold (default: all candidates)
         threshold = request.args.get('threshold', 0, type=float)
+        export_format = request.args.get('format', 'csv').lower()
+        if export_format not in EXPORT_FORMATS:
+            flash(f'Unsupported export format: {export_format}', 'error')
+            return redirect(url_for('candidates', job_id=job_id))
         
-        candidates_data = db.session.query(Candidate, MatchScore).join(
+        # Plain columns only: no ORM identity map, no raw text, read in batches
+        query = db.session.query(
+            Candidate.id.label('candidate_id'), Candidate.name, Candidate.email, Candidate.phone,
+            Candidate.filename, Candidate.experience_years, Candidate.extracted_skills,
+            MatchScore.overall_score, MatchScore.skill_match_score, MatchScore.experience_score,
+            MatchScore.education_score, MatchScore.skill_gaps, MatchScore.match_justification
+        ).join(
             MatchScore, Candidate.id == MatchScore.candidate_id
         ).filter(
-            Candidate.job_id == job_id,
+            MatchScore.job_id == job_id,
             MatchScore.overall_score >= threshold
-        ).order_by(MatchScore.overall_score.desc()).all()
+        )
         
-        if not candidates_data:
+        if not db.session.query(query.exists()).scalar():
             flash('No candidates meet the specified threshold', 'warning')
             return redirect(url_for('candidates', job_id=job_id))
         
-        # Create CSV file
-        csv_path = export_candidates_csv(candidates_data, job.title)
+        if export_format == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+            flash('Parquet export requires pyarrow. Please install it with: pip install pyarrow', 'error')
+            return redirect(url_for('candidates', job_id=job_id))
+        
+        rows = query.order_by(
+            MatchScore.overall_score.desc(), MatchScore.id.desc()
+        ).execution_options(yield_per=1000)
         
-        return send_file(csv_path, as_attachment=True, 
-                        download_name=f"{job.title}_candidates.csv")
+        mimetype, extension = EXPORT_FORMATS[export_format]
+        return Response(
+            stream_with_context(stream_candidates_export(rows, export_format)),
+            mimetype=mimetype,
+            headers={'Content-Disposition': attachment_disposition(f"{job.title}_candidates.{extension}")}
+        )
         
     except Exception as e:
         logging.error(f"Error exporting candidates: {str(e)}")
@@ -274,8 +582,15 @@ def export_candidates(job_id):
 def clear_all_data():
     """Clear all data from the database"""
     try:
-        # Delete all match scores first (due to foreign key constraints)
+        # Delete ingest records and match scores first (due to foreign key constraints)
+        IngestItem.query.delete()
+        IngestJob.query.delete()
         MatchScore.query.delete()
+        CandidateSkill.query.delete()
+        JobSkill.query.delete()
+        Skill.query.delete()
+        JobStats.query.delete()
+        CandidateText.query.delete()
         
         # Delete all candidates
         Candidate.query.delete()
@@ -294,6 +609,21 @@ def clear_all_data():
     
     return redirect(url_for('dashboard'))
 
+@app.route('/healthz')
+def healthz():
+    """Liveness: the process is up and serving requests"""
+    return jsonify({'status': 'ok'})
+
+@app.route('/readyz')
+def readyz():
+    """Readiness: NLP models are loaded and warmed up"""
+    if nlp_models.retry_due() or nlp_models.state == 'idle':
+        # e.g. MODEL_LOADING=lazy: the first readiness probe kicks off loading,
+        # and after a failed load the probes retry it with backoff
+        nlp_models.start('background')
+    status = nlp_models.status()
+    return jsonify(status), (200 if status['state'] == 'ready' else 503)
+
 @app.errorhandler(404)
 def not_found(error):
     return render_template('404.html'), 404
@@ -304,13 +634,20 @@ def internal_error(error):
 
 
 # Google Calendar Integration Routes
-calendar_service = GoogleCalendarService()
+_calendar_service = None
+
+def get_calendar_service():
+    """Create the calendar service on first use; raises ValueError if OAuth is not configured"""
+    global _calendar_service
+    if _calendar_service is None:
+        _calendar_service = GoogleCalendarService()
+    return _calendar_service
 
 @app.route('/calendar/auth')
 def calendar_auth():
     """Initialize Google Calendar OAuth flow"""
     try:
-        auth_url = calendar_service.get_auth_url()
+        auth_url = get_calendar_service().get_auth_url()
         return redirect(auth_url)
     except ValueError as e:
         flash(f'Google Calendar setup error: {str(e)}', 'error')
@@ -320,7 +657,7 @@ def calendar_auth():
 def oauth2callback():
     """Handle Google Calendar OAuth callback"""
     try:
-        success = calendar_service.handle_oauth_callback(request.url)
+        success = get_calendar_service().handle_oauth_callback(request.url)
         if success:
             flash('Successfully connected to Google Calendar!', 'success')
             return redirect(url_for('dashboard'))
@@ -336,6 +673,12 @@ def schedule_appointment(candidate_id):
     """Show appointment scheduling form"""
     candidate = Candidate.query.get_or_404(candidate_id)
     
+    try:
+        calendar_service = get_calendar_service()
+    except ValueError as e:
+        flash(f'Google Calendar setup error: {str(e)}', 'error')
+        return redirect(url_for('dashboard'))
+    
     # Check if Google Calendar is authenticated
     if not calendar_service.is_authenticated():
         flash('Please connect to Google Calendar first to schedule appointments.', 'warning')
@@ -378,7 +721,7 @@ def create_appointment():
         end_time = start_time + timedelta(minutes=duration)
         
         # Create Google Calendar event
-        calendar_result = calendar_service.create_appointment(
+        calendar_result = get_calendar_service().create_appointment(
             candidate_name=candidate.name,
             candidate_email=candidate.email,
             interviewer_name=interviewer_name,
@@ -438,7 +781,7 @@ def cancel_appointment(appointment_id):
         
         # Cancel in Google Calendar
         if appointment.google_event_id:
-            success = calendar_service.cancel_appointment(appointment.google_event_id)
+            success = get_calendar_service().cancel_appointment(appointment.google_event_id)
             if success:
                 appointment.status = 'cancelled'
                 db.session.commit()
@@ -469,7 +812,7 @@ def reschedule_appointment(appointment_id):
         
         # Update in Google Calendar
         if appointment.google_event_id:
-            result = calendar_service.update_appointment(
+            result = get_calendar_service().update_appointment(
                 appointment.google_event_id,
                 start_time=new_start_time,
                 end_time=new_end_time
@@ -0,0 +1,199 @@
+"""
+Corpus-level TF-IDF model with per-job candidate matrices
+Term counts are hashed so the vocabulary never needs refitting; document
+frequencies cover the documents of the cached jobs, and each job keeps a
+sparse matrix of its candidates so a whole pool is ranked with one product.
+The model lives in each process, so scores it gives drift with the cache;
+stored semantic scores are reused wherever a candidate already has one.
+"""
+
+import threading
+from collections import OrderedDict
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+class CorpusTfidf:
+    """Hashing TF-IDF whose IDF is maintained incrementally over the corpus"""
+
+    def __init__(self, n_features=2 ** 18):
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            alternate_sign=False,
+            norm=None
+        )
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self._lock = threading.Lock()
+
+    def counts(self, texts):
+        """Raw hashed term counts for texts (CSR, one row per text)"""
+        return self.hasher.transform(texts)
+
+    def add_counts(self, counts, sign=1):
+        """Fold already-hashed documents into the document frequencies
+
+        ``sign=-1`` takes documents back out again.
+        """
+        present = np.asarray((counts > 0).sum(axis=0)).ravel()
+        with self._lock:
+            self.doc_freq += sign * present
+            self.n_docs += sign * counts.shape[0]
+
+    def remove_counts(self, counts):
+        """Take documents added with add_counts out of the document frequencies"""
+        self.add_counts(counts, sign=-1)
+
+    def idf(self):
+        """Smoothed IDF vector, same formula as TfidfVectorizer(smooth_idf=True)"""
+        with self._lock:
+            return np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1
+
+    def weight(self, counts, idf=None):
+        """Apply IDF to raw counts and L2-normalise each row"""
+        idf = self.idf() if idf is None else idf
+        return normalize(sp.csr_matrix(counts.multiply(idf)), norm='l2', copy=False)
+
+
+class JobSemanticIndex:
+    """Sparse term-count matrix of one job's candidate pool"""
+
+    def __init__(self, job_counts):
+        self.job_counts = job_counts
+        self.candidate_rows = {}
+        self._row_counts = []
+        self._matrix = None
+
+    def add(self, candidate_id, counts):
+        self.candidate_rows[candidate_id] = len(self._row_counts)
+        self._row_counts.append(counts)
+        self._matrix = None
+
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = sp.vstack(self._row_counts, format='csr')
+        return self._matrix
+
+
+class SemanticIndex:
+    """Corpus TF-IDF plus an LRU of per-job candidate matrices"""
+
+    def __init__(self, max_jobs=64):
+        self.corpus = CorpusTfidf()
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        # Cached jobs holding each candidate: the corpus counts a candidate
+        # once while any job holds it, and only documents still cached
+        self._candidate_refs = {}
+        self._lock = threading.RLock()
+
+    def _job_index(self, job_id, job_text):
+        with self._lock:
+            index = self._jobs.get(job_id)
+            if index is None:
+                job_counts = self.corpus.counts([job_text])
+                self.corpus.add_counts(job_counts)
+                index = JobSemanticIndex(job_counts)
+                self._jobs[job_id] = index
+                while len(self._jobs) > self.max_jobs:
+                    self._release(self._jobs.popitem(last=False)[1])
+            self._jobs.move_to_end(job_id)
+            return index
+
+    def _release(self, index):
+        """Take an evicted job and the candidates only it held out of the corpus"""
+        self.corpus.remove_counts(index.job_counts)
+        released = []
+        for candidate_id, row in index.candidate_rows.items():
+            self._candidate_refs[candidate_id] -= 1
+            if not self._candidate_refs[candidate_id]:
+                del self._candidate_refs[candidate_id]
+                released.append(row)
+        if released:
+            self.corpus.remove_counts(index.matrix()[released])
+
+    def add_candidates(self, job_id, job_text, candidates):
+        """Register (candidate_id, text) pairs with a job, skipping known ones"""
+        with self._lock:
+            index = self._job_index(job_id, job_text)
+            # A dict keeps each candidate once even if listed twice
+            new = list({candidate_id: text for candidate_id, text in candidates
+                        if candidate_id not in index.candidate_rows and text}.items())
+            if not new:
+                return index
+            counts = self.corpus.counts([text for _, text in new])
+            uncounted = [row for row, (candidate_id, _) in enumerate(new)
+                         if candidate_id not in self._candidate_refs]
+            if uncounted:
+                self.corpus.add_counts(counts[uncounted])
+            for row, (candidate_id, _) in enumerate(new):
+                index.add(candidate_id, counts[row])
+                self._candidate_refs[candidate_id] = self._candidate_refs.get(candidate_id, 0) + 1
+            return index
+
+    def similarity(self, job_id, job_text, candidate_id, candidate_text):
+        """Cosine similarity (0-1) between one candidate and a job"""
+        if job_id is None or candidate_id is None:
+            # Unsaved records: score against the corpus IDF without caching
+            counts = self.corpus.counts([candidate_text, job_text])
+            weighted = self.corpus.weight(counts)
+            return float(weighted[0].multiply(weighted[1]).sum())
+
+        with self._lock:
+            index = self.add_candidates(job_id, job_text, [(candidate_id, candidate_text)])
+            row = index.candidate_rows.get(candidate_id)
+            if row is None:
+                return 0.0
+            candidate_counts = index.matrix()[row]
+            job_counts = index.job_counts
+        idf = self.corpus.idf()
+        candidate_vector = self.corpus.weight(candidate_counts, idf)
+        job_vector = self.corpus.weight(job_counts, idf)
+        return float(candidate_vector.multiply(job_vector).sum())
+
+    def rank(self, job_id, job_text, candidates=()):
+        """Similarity of every candidate in a job's pool, as {candidate_id: 0-1}"""
+        with self._lock:
+            index = self.add_candidates(job_id, job_text, candidates)
+            if not index.candidate_rows:
+                return {}
+            matrix = index.matrix()
+            candidate_rows = dict(index.candidate_rows)
+            job_counts = index.job_counts
+        idf = self.corpus.idf()
+        job_vector = self.corpus.weight(job_counts, idf)
+        scores = np.asarray((self.corpus.weight(matrix, idf) @ job_vector.T).todense()).ravel()
+        return {candidate_id: float(scores[row]) for candidate_id, row in candidate_rows.items()}
+
+    def missing_candidates(self, job_id, job_text, candidate_ids):
+        """Candidate ids not yet registered with the job's index"""
+        with self._lock:
+            index = self._job_index(job_id, job_text)
+            return [candidate_id for candidate_id in candidate_ids if candidate_id not in index.candidate_rows]
+
+    def scores(self, job_id, job_text, candidate_ids, new_candidates=()):
+        """Similarity of just the given candidates, as {candidate_id: 0-1}
+
+        ``new_candidates`` are (candidate_id, text) pairs to register first,
+        typically those reported by ``missing_candidates``.
+        """
+        with self._lock:
+            index = self.add_candidates(job_id, job_text, new_candidates)
+            present = [candidate_id for candidate_id in candidate_ids if candidate_id in index.candidate_rows]
+            if not present:
+                return {}
+            matrix = index.matrix()[[index.candidate_rows[candidate_id] for candidate_id in present]]
+            job_counts = index.job_counts
+        idf = self.corpus.idf()
+        job_vector = self.corpus.weight(job_counts, idf)
+        scores = np.asarray((self.corpus.weight(matrix, idf) @ job_vector.T).todense()).ravel()
+        return {candidate_id: float(scores[row]) for row, candidate_id in enumerate(present)}
+
+    def forget_job(self, job_id):
+        with self._lock:
+            index = self._jobs.pop(job_id, None)
+            if index is not None:
+                self._release(index)
@@ -0,0 +1,189 @@
+"""
+Skill dictionary and inverted index for cross-job candidate discovery
+Skill rows give every normalized skill name an integer ID. CandidateSkill
+maps a skill to the candidates holding it and JobSkill to the jobs requiring
+it, so skill filters and matching run as indexed joins on integer keys.
+"""
+
+import logging
+from sqlalchemy import delete, func, insert
+from sqlalchemy.exc import IntegrityError
+
+from app import begin_savepoint, db
+from models import Candidate, CandidateSkill, CandidateText, JobDescription, JobSkill, MatchScore, Skill
+from text_store import decompress_text
+from job_profile import job_profile
+
+MAX_SKILL_LENGTH = 100
+
+
+def normalize_skills(skills):
+    """Distinct lowercased skills that fit in a posting"""
+    normalized = []
+    for skill in skills or []:
+        skill = skill.strip().lower()
+        if skill and len(skill) <= MAX_SKILL_LENGTH and skill not in normalized:
+            normalized.append(skill)
+    return normalized
+
+
+def skill_ids(names, create=True):
+    """{normalized name: skill id} for skill names, adding new ones to the dictionary
+
+    With ``create=False``, names not in the dictionary are left out.
+    """
+    names = normalize_skills(names)
+    if not names:
+        return {}
+
+    ids = dict(db.session.query(Skill.name, Skill.id).filter(Skill.name.in_(names)))
+    missing = [name for name in names if name not in ids]
+    if missing and create:
+        try:
+            with begin_savepoint():
+                db.session.execute(insert(Skill), [{'name': name} for name in missing])
+        except IntegrityError:
+            # Another worker added some of them first: insert the rest one by one
+            for name in missing:
+                try:
+                    with begin_savepoint():
+                        db.session.execute(insert(Skill), [{'name': name}])
+                except IntegrityError:
+                    pass
+        ids.update(db.session.query(Skill.name, Skill.id).filter(Skill.name.in_(missing)))
+    return ids
+
+
+def job_skill_weights(job):
+    """{normalized name: weight} for a job; a skill listed under several categories counts once per listing"""
+    profile = job_profile(job)
+    weights = {}
+    for skill, weight in zip(profile['skills_lower'], profile['weights']):
+        skill = skill.strip()
+        if skill and len(skill) <= MAX_SKILL_LENGTH:
+            weights[skill] = weights.get(skill, 0.0) + weight
+    return weights
+
+
+def sync_job_skills(job):
+    """Replace a job's JobSkill rows from its profile; the caller commits"""
+    weights = job_skill_weights(job)
+    ids = skill_ids(list(weights))
+    db.session.execute(delete(JobSkill).where(JobSkill.job_id == job.id))
+    if ids:
+        db.session.execute(insert(JobSkill), [
+            {'job_id': job.id, 'skill_id': ids[name], 'weight': weight} for name, weight in weights.items()
+        ])
+    return len(ids)
+
+
+def rebuild_skill_index(batch_size=1000):
+    """Rebuild every candidate posting and job skill row; returns the posting count"""
+    CandidateSkill.query.delete()
+
+    total = 0
+    batch = []
+    query = db.session.query(Candidate.id, Candidate.extracted_skills).order_by(Candidate.id)
+    for candidate_id, skills in query.yield_per(batch_size):
+        batch.append((candidate_id, normalize_skills(skills)))
+        if len(batch) >= batch_size:
+            total += insert_postings(batch)
+            batch = []
+    if batch:
+        total += insert_postings(batch)
+
+    for job in JobDescription.query.all():
+        sync_job_skills(job)
+
+    db.session.commit()
+    logging.info(f"Skill index rebuilt with {total} postings")
+    return total
+
+
+def candidate_postings(candidate_skills):
+    """CandidateSkill rows for (candidate_id, normalized skills) pairs"""
+    ids = skill_ids({skill for _, skills in candidate_skills for skill in skills})
+    return [
+        {'skill_id': ids[skill], 'candidate_id': candidate_id}
+        for candidate_id, skills in candidate_skills for skill in skills
+    ]
+
+
+def insert_postings(candidate_skills):
+    """Insert the postings of (candidate_id, normalized skills) pairs; returns the row count"""
+    rows = candidate_postings(candidate_skills)
+    if rows:
+        db.session.execute(insert(CandidateSkill), rows)
+    return len(rows)
+
+
+def discover_candidates(job, matching_engine, limit=20, depth=200, include_current=False):
+    """Top existing candidates for a job, retrieved through the skill index
+
+    Candidates are first ranked in SQL by the summed JobSkill weight of the
+    job's skills they hold exactly, joining only those skills' postings; the
+    best ``depth`` of them are then ranked with ``top_k``. Returns
+    (candidate, match_result) pairs, best first.
+    """
+    # Jobs missing their skill rows are synced within the caller's transaction
+    if not db.session.query(JobSkill.query.filter_by(job_id=job.id).exists()).scalar():
+        if not sync_job_skills(job):
+            return []
+
+    retrieval = db.session.query(
+        CandidateSkill.candidate_id,
+        func.sum(JobSkill.weight).label('matched_weight')
+    ).join(
+        JobSkill, JobSkill.skill_id == CandidateSkill.skill_id
+    ).filter(
+        JobSkill.job_id == job.id
+    ).group_by(CandidateSkill.candidate_id)
+
+    if not include_current:
+        retrieval = retrieval.join(Candidate, Candidate.id == CandidateSkill.candidate_id).filter(
+            db.or_(Candidate.job_id.is_(None), Candidate.job_id != job.id)
+        )
+
+    candidate_ids = [candidate_id for candidate_id, _ in retrieval.order_by(
+        func.sum(JobSkill.weight).desc(), CandidateSkill.candidate_id
+    ).limit(depth)]
+    if not candidate_ids:
+        return []
+
+    candidates = ranking_candidates(Candidate.id.in_(candidate_ids))
+    return matching_engine.top_k(
+        candidates, job, limit,
+        text_loader=load_raw_texts,
+        semantic_scores=stored_semantic_scores(job.id, candidate_ids)
+    )
+
+
+def ranking_candidates(*criterion):
+    """Candidate rows with only the columns ``top_k`` and a ranking entry read
+
+    Work history, file paths and resume text stay unloaded; ``load_raw_texts``
+    fetches the text of the few candidates that reach semantic scoring.
+    """
+    return db.session.query(
+        Candidate.id, Candidate.name, Candidate.email, Candidate.job_id,
+        Candidate.extracted_skills, Candidate.experience_years, Candidate.education
+    ).filter(*criterion).all()
+
+
+def stored_semantic_scores(job_id, candidate_ids=None):
+    """{candidate_id: semantic score} from the job's stored match scores"""
+    query = db.session.query(MatchScore.candidate_id, MatchScore.semantic_score).filter(
+        MatchScore.job_id == job_id,
+        MatchScore.semantic_score.isnot(None)
+    )
+    if candidate_ids is not None:
+        query = query.filter(MatchScore.candidate_id.in_(candidate_ids))
+    return dict(query)
+
+
+def load_raw_texts(candidate_ids):
+    """{candidate_id: raw_text} for the given candidates, in one query"""
+    rows = db.session.query(
+        CandidateText.candidate_id, CandidateText.codec, CandidateText.content
+    ).filter(CandidateText.candidate_id.in_(candidate_ids))
+    return {candidate_id: decompress_text(codec, content) for candidate_id, codec, content in rows}
@@ -0,0 +1,159 @@
+"""
+Skill taxonomy loading and single-pass skill matching
+Builds an Aho-Corasick automaton over every skill name and alias so a resume
+is scanned once regardless of how large the taxonomy grows.
+"""
+
+import os
+import re
+import json
+import logging
+from collections import deque
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skill_taxonomy.json')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick matcher that maps skill phrases and aliases to canonical names"""
+
+    def __init__(self, patterns):
+        """Build the automaton from a {phrase: canonical_skill} mapping"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for phrase, canonical in patterns.items():
+            phrase = _WHITESPACE_RE.sub(' ', phrase.lower().strip())
+            if phrase:
+                self._add(phrase, canonical)
+
+        self._build_failure_links()
+
+    def _add(self, phrase, canonical):
+        node = 0
+        for char in phrase:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        # Word boundaries only apply where the phrase itself starts/ends on a word character
+        self._output[node].append((
+            len(phrase),
+            canonical,
+            _is_word_char(phrase[0]),
+            _is_word_char(phrase[-1])
+        ))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text):
+        """Return canonical skills found in text, in order of first occurrence"""
+        text = _WHITESPACE_RE.sub(' ', text.lower())
+        text_length = len(text)
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        matches = []
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not output[node]:
+                continue
+
+            for length, canonical, bounded_start, bounded_end in output[node]:
+                start = end - length + 1
+                if bounded_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if bounded_end and end + 1 < text_length and _is_word_char(text[end + 1]):
+                    continue
+                matches.append((start, end, canonical))
+
+        # Leftmost-longest: "node.js" should not also report "js"
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        found = {}
+        covered_until = -1
+        for start, end, canonical in matches:
+            if start <= covered_until:
+                continue
+            covered_until = end
+            found.setdefault(canonical, start)
+
+        return list(found)
+
+
+class SkillTaxonomy:
+    """Versioned skill taxonomy with a compiled matcher"""
+
+    def __init__(self, version, technical_skills, soft_skills, aliases=None, source_path=None):
+        self.version = version
+        self.technical_skills = technical_skills
+        self.soft_skills = soft_skills
+        self.aliases = aliases or {}
+        self.source_path = source_path
+
+        self.all_technical_skills = []
+        for category in technical_skills.values():
+            self.all_technical_skills.extend(category)
+
+        # Lowercased skill -> 'technical' / 'soft' for categorisation
+        self.skill_categories = {}
+        for skill in self.soft_skills:
+            self.skill_categories[skill.lower()] = 'soft'
+        for skill in self.all_technical_skills:
+            self.skill_categories[skill.lower()] = 'technical'
+
+        patterns = {skill: skill for skill in self.soft_skills}
+        patterns.update({skill: skill for skill in self.all_technical_skills})
+        for alias, canonical in self.aliases.items():
+            patterns.setdefault(alias, canonical)
+        self.matcher = SkillMatcher(patterns)
+
+    @classmethod
+    def load(cls, path=None):
+        """Load a taxonomy from a JSON data file"""
+        path = path or os.environ.get('SKILL_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        taxonomy = cls(
+            version=str(data.get('version', 'unknown')),
+            technical_skills=data.get('technical', {}),
+            soft_skills=data.get('soft', []),
+            aliases=data.get('aliases', {}),
+            source_path=path
+        )
+        logging.info(f"Loaded skill taxonomy version {taxonomy.version} "
+                     f"({len(taxonomy.skill_categories)} skills, {len(taxonomy.aliases)} aliases) from {path}")
+        return taxonomy
+
+    def find_skills(self, text):
+        """Return canonical skill names found in text"""
+        return self.matcher.find_all(text)
+
+    def category_of(self, skill):
+        """Return 'technical', 'soft' or None for a skill name"""
+        return self.skill_categories.get(skill.lower())
@@ -0,0 +1,117 @@
+"""
+Skill embedding store for partial skill matching
+Each distinct skill string is embedded once, cached with LRU eviction, and
+pairwise similarities are computed with a single matrix multiply. Substring
+containment between a job's skills and candidate skills is cached per job
+skill list the same way.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+import numpy as np
+
+
+class SkillVectorStore:
+    """Bounded cache of unit-normalised skill vectors"""
+
+    def __init__(self, nlp, max_size=50000):
+        self.nlp = nlp
+        self.max_size = max_size
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+        self._dimension = None
+
+    def _embed_missing(self, skills):
+        """Embed skills that are not cached yet, in one nlp.pipe pass"""
+        with self._lock:
+            missing = [skill for skill in dict.fromkeys(skills) if skill not in self._vectors]
+        if not missing:
+            return
+
+        embedded = {}
+        for skill, doc in zip(missing, self.nlp.pipe(missing)):
+            vector = np.asarray(doc.vector, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            # Zero vectors stay zero so they never count as similar to anything
+            embedded[skill] = vector / norm if norm else vector
+
+        with self._lock:
+            for skill, vector in embedded.items():
+                self._vectors[skill] = vector
+                self._vectors.move_to_end(skill)
+                if self._dimension is None:
+                    self._dimension = vector.shape[0]
+            while len(self._vectors) > self.max_size:
+                self._vectors.popitem(last=False)
+
+    def matrix(self, skills):
+        """Return a (len(skills), dim) matrix of unit vectors"""
+        self._embed_missing(skills)
+        rows = []
+        with self._lock:
+            for skill in skills:
+                vector = self._vectors.get(skill)
+                if vector is None:
+                    # Evicted between embedding and lookup by a concurrent caller
+                    vector = np.zeros(self._dimension or 0, dtype=np.float32)
+                else:
+                    self._vectors.move_to_end(skill)
+                rows.append(vector)
+        if not rows:
+            return np.zeros((0, self._dimension or 0), dtype=np.float32)
+        return np.vstack(rows)
+
+    def similarity_matrix(self, skills_a, skills_b):
+        """Cosine similarity for every pair in skills_a x skills_b"""
+        if not skills_a or not skills_b:
+            return np.zeros((len(skills_a), len(skills_b)), dtype=np.float32)
+        try:
+            return self.matrix(skills_a) @ self.matrix(skills_b).T
+        except Exception as e:
+            logging.error(f"Error computing skill similarity matrix: {str(e)}")
+            return np.zeros((len(skills_a), len(skills_b)), dtype=np.float32)
+
+    def similar_mask(self, skills_a, skills_b, threshold):
+        """Boolean matrix of pairs whose similarity exceeds threshold"""
+        return self.similarity_matrix(skills_a, skills_b) > threshold
+
+    def similarity(self, skill_a, skill_b):
+        """Cosine similarity between two skills"""
+        return float(self.similarity_matrix([skill_a], [skill_b])[0, 0])
+
+
+class SkillContainmentCache:
+    """Which candidate skills contain, or are contained in, each skill of a job
+
+    Relations are kept per job skill list, with LRU eviction of whole lists,
+    so each distinct candidate skill is compared with a job's skills once
+    instead of in every batch scored against the job.
+    """
+
+    def __init__(self, max_jobs=64):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mask(self, job_skills, candidate_skills):
+        """Boolean (len(job_skills), len(candidate_skills)) containment matrix of lowercased skills"""
+        key = tuple(job_skills)
+        with self._lock:
+            columns = self._jobs.get(key)
+            if columns is None:
+                columns = self._jobs[key] = {}
+                while len(self._jobs) > self.max_jobs:
+                    self._jobs.popitem(last=False)
+            self._jobs.move_to_end(key)
+
+        missing = [skill for skill in dict.fromkeys(candidate_skills) if skill not in columns]
+        for skill in missing:
+            # Plain dict assignments, safe to race: every thread computes the same column
+            columns[skill] = np.array(
+                [job_skill in skill or skill in job_skill for job_skill in job_skills], dtype=bool
+            )
+
+        if not candidate_skills:
+            return np.zeros((len(job_skills), 0), dtype=bool)
+        return np.stack([columns[skill] for skill in candidate_skills], axis=1)
@@ -0,0 +1,22 @@
+"""Shared test setup: a throwaway SQLite database and no model loading at import"""
+
+import os
+import tempfile
+
+import pytest
+
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ['MODEL_LOADING'] = 'lazy'
+
+
+@pytest.fixture
+def app_db():
+    """The app's db inside an app context, emptied after the test"""
+    from app import app, db
+
+    with app.app_context():
+        yield db
+        db.session.rollback()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
@@ -0,0 +1,72 @@
+"""Archive members are streamed within the safety limits"""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from archive_ingest import ArchiveError, ArchiveLimits, iter_archive_members
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _members(data, name, limits):
+    return list(iter_archive_members(io.BytesIO(data), name, len(data), limits))
+
+
+def test_high_ratio_zip_member_is_skipped():
+    data = _zip({'bomb.txt': b'0' * 1_000_000, 'resume.txt': b'Jane Doe, Python developer'})
+
+    members = _members(data, 'resumes.zip', ArchiveLimits(max_ratio=100))
+
+    assert members == [
+        ('bomb.txt', None, "Suspicious compression ratio"),
+        ('resume.txt', b'Jane Doe, Python developer', None)
+    ]
+
+
+def test_oversized_members_and_non_resumes_are_skipped():
+    data = _zip({
+        'big.txt': b'x' * 2048,
+        'notes.exe': b'binary',
+        '__MACOSX/._resume.txt': b'fork',
+        'cv/resume.txt': b'John Smith'
+    })
+
+    members = _members(data, 'resumes.zip', ArchiveLimits(max_member_size=1024))
+
+    assert members == [
+        ('big.txt', None, "File exceeds the per-file size limit"),
+        ('cv/resume.txt', b'John Smith', None)
+    ]
+
+
+def test_member_count_limit_stops_the_archive():
+    data = _zip({f"resume_{index}.txt": b'Candidate' for index in range(4)})
+
+    with pytest.raises(ArchiveError, match="more than 3 resumes"):
+        _members(data, 'resumes.zip', ArchiveLimits(max_members=3))
+
+
+def test_tar_members_are_streamed():
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for name, content in (('a.txt', b'Alice'), ('b.txt', b'Bob')):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    data = buffer.getvalue()
+
+    assert _members(data, 'resumes.tar.gz', ArchiveLimits()) == [('a.txt', b'Alice', None), ('b.txt', b'Bob', None)]
+
+
+def test_invalid_zip_raises():
+    with pytest.raises(ArchiveError):
+        _members(b'not a zip', 'resumes.zip', ArchiveLimits())
@@ -0,0 +1,74 @@
+"""Ingested candidates are saved in the caller's transaction"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def _task(index):
+    return {
+        'filename': f"resume_{index}.pdf",
+        'file_path': '',
+        'raw_text': f"Candidate {index} knows Python",
+        'candidate_data': {'name': f"Candidate {index}", 'skills': ['Python', 'SQL']}
+    }
+
+
+def test_failed_scoring_leaves_no_candidates(app_db, monkeypatch):
+    import ingest_queue
+    from models import Candidate, CandidateSkill, CandidateText, IngestItem, IngestJob, JobDescription
+
+    job = JobDescription(title='Backend', description='Python developer')
+    app_db.session.add(job)
+    app_db.session.commit()
+    ingest_job = IngestJob(job_id=job.id, status='running', total_files=2)
+    app_db.session.add(ingest_job)
+    app_db.session.commit()
+    items = [IngestItem(ingest_job_id=ingest_job.id, filename=f"resume_{index}.pdf", file_path='') for index in range(2)]
+    app_db.session.add_all(items)
+    app_db.session.commit()
+
+    def failing_score_saved(tasks, job, matching_engine):
+        raise RuntimeError('scoring failed')
+
+    monkeypatch.setattr(ingest_queue, 'score_saved', failing_score_saved)
+    queue = ingest_queue.IngestQueue(SimpleNamespace(matching_engine=None))
+    with pytest.raises(RuntimeError):
+        queue._save(ingest_job, job, items, [_task(0), _task(1)])
+    app_db.session.rollback()
+
+    assert Candidate.query.count() == 0
+    assert CandidateText.query.count() == 0
+    assert CandidateSkill.query.count() == 0
+
+
+def test_scoring_error_does_not_fail_the_chunk(app_db):
+    from ingest_queue import IngestQueue
+    from models import IngestItem, IngestJob, JobDescription, MatchScore
+
+    job = JobDescription(title='Backend', description='Python developer')
+    app_db.session.add(job)
+    app_db.session.commit()
+    ingest_job = IngestJob(job_id=job.id, status='running', total_files=2)
+    app_db.session.add(ingest_job)
+    app_db.session.commit()
+    items = [IngestItem(ingest_job_id=ingest_job.id, filename=f"resume_{index}.pdf", file_path='') for index in range(2)]
+    app_db.session.add_all(items)
+    app_db.session.commit()
+
+    class BatchFailingEngine:
+        def score_batch(self, candidates, job):
+            raise RuntimeError('batch scoring failed')
+
+        def calculate_match_score(self, candidate, job):
+            return {
+                'overall_score': 50.0, 'skill_score': 50.0, 'experience_score': 50.0, 'education_score': 50.0,
+                'semantic_score': 10.0, 'breakdown': {'semantic_score': 10.0}, 'skill_gaps': [],
+                'justification': 'Moderate skill match'
+            }
+
+    queue = IngestQueue(SimpleNamespace(matching_engine=BatchFailingEngine()))
+    assert queue._save(ingest_job, job, items, [_task(0), _task(1)]) == (2, 0)
+
+    assert [score.overall_score for score in MatchScore.query.order_by(MatchScore.id)] == [50.0, 50.0]
+    assert {item.status for item in IngestItem.query} == {'processed'}
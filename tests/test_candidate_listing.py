@@ -0,0 +1,68 @@
+"""Keyset pagination of a job's ranked candidates"""
+
+import pytest
+
+
+@pytest.fixture
+def ranked_job(app_db):
+    """A job with seven scored candidates, two of them tied on score"""
+    from models import Candidate, JobDescription, MatchScore
+    from skill_index import insert_postings, normalize_skills
+
+    job = JobDescription(title='Backend', description='Python developer')
+    app_db.session.add(job)
+    app_db.session.flush()
+    # The tie straddles the first page boundary
+    scores = [91.0, 85.5, 70.0, 70.0, 64.2, 40.0, 12.5]
+    candidates = []
+    for index, score in enumerate(scores):
+        candidate = Candidate(
+            name=f"Candidate {index}", filename=f"resume_{index}.pdf", file_path='', job_id=job.id,
+            extracted_skills=['Python', 'SQL'] if index % 2 else ['Python']
+        )
+        app_db.session.add(candidate)
+        app_db.session.flush()
+        app_db.session.add(MatchScore(candidate_id=candidate.id, job_id=job.id, overall_score=score))
+        candidates.append(candidate)
+    insert_postings([(candidate.id, normalize_skills(candidate.extracted_skills)) for candidate in candidates])
+    app_db.session.commit()
+    return job
+
+
+def _walk(job_id, **filters):
+    from candidate_listing import candidate_page
+
+    pages = []
+    cursor = None
+    while True:
+        page = candidate_page(job_id, after=cursor, limit=3, **filters)
+        pages.append(page)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_pages_do_not_overlap(ranked_job):
+    pages = _walk(ranked_job.id)
+
+    ids = [match.id for page in pages for _, match in page.rows]
+    scores = [match.overall_score for page in pages for _, match in page.rows]
+    assert [len(page.rows) for page in pages] == [3, 3, 1]
+    assert [page.offset for page in pages] == [0, 3, 6]
+    assert len(set(ids)) == len(ids) == 7
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_filters_apply_on_every_page(ranked_job):
+    pages = _walk(ranked_job.id, min_score=20, skills=['sql'])
+
+    names = [candidate.name for page in pages for candidate, _ in page.rows]
+    assert names == ['Candidate 1', 'Candidate 3', 'Candidate 5']
+    assert _walk(ranked_job.id, skills=['Rust'])[0].rows == []
+
+
+def test_malformed_cursor_is_rejected(ranked_job):
+    from candidate_listing import InvalidCursor, candidate_page
+
+    with pytest.raises(InvalidCursor):
+        candidate_page(ranked_job.id, after='not-a-cursor')
@@ -0,0 +1,79 @@
+"""PDF extraction stops doing work once the character cap is reached"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import PyPDF2
+
+from document_parser import DocumentParser
+
+
+def _pdf(pages):
+    """Minimal PDF with one line of text per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td (Page {page} Python developer) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF".encode()
+    return data
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_pages_match_across_modes():
+    data = _pdf(12)
+    serial = DocumentParser(pdf_workers=1).extract_text(data, 'resume.pdf')
+    parser = DocumentParser(pdf_workers=2, pdf_chunk_pages=2)
+    parser._pdf_pool = _CountingExecutor()
+    with parser:
+        assert parser.extract_text(data, 'resume.pdf') == serial
+    assert serial.count('Python developer') == 12
+
+
+def test_serial_extraction_stops_at_char_cap(monkeypatch):
+    extracted = []
+    extract_text = PyPDF2.PageObject.extract_text
+
+    def counting_extract_text(page, *args, **kwargs):
+        extracted.append(page)
+        return extract_text(page, *args, **kwargs)
+
+    monkeypatch.setattr(PyPDF2.PageObject, 'extract_text', counting_extract_text)
+    text = DocumentParser(pdf_workers=1, max_chars=40).extract_text(_pdf(20), 'resume.pdf')
+
+    assert text == 'Page 0 Python developer\nPage 1 Python dev'
+    assert len(extracted) == 2
+
+
+def test_parallel_extraction_stops_submitting_at_char_cap():
+    parser = DocumentParser(pdf_workers=2, pdf_chunk_pages=2, max_chars=40)
+    executor = parser._pdf_pool = _CountingExecutor()
+    with parser:
+        text = parser.extract_text(_pdf(20), 'resume.pdf')
+
+    assert text == 'Page 0 Python developer\nPage 1 Python dev'
+    # The first chunk fills the cap; at most one more per worker was in flight
+    assert executor.submitted <= 1 + parser.pdf_workers
@@ -0,0 +1,33 @@
+"""Ingest progress stream"""
+
+
+def _ingest_job(db, status):
+    from models import IngestJob, JobDescription
+
+    job = JobDescription(title='Backend', description='Python developer')
+    db.session.add(job)
+    db.session.commit()
+    ingest_job = IngestJob(job_id=job.id, status=status, total_files=1)
+    db.session.add(ingest_job)
+    db.session.commit()
+    return ingest_job.id
+
+
+def test_stream_ends_after_max_seconds_and_asks_for_a_reconnect(app_db):
+    from ingest_queue import stream_progress
+
+    ingest_id = _ingest_job(app_db, 'running')
+    events = list(stream_progress(ingest_id, poll_interval=0.01, max_seconds=0.05, retry_ms=1500))
+
+    assert events[0] == "retry: 1500\n\n"
+    assert events[1].startswith('data: ')
+    assert not any(event.startswith('event: done') for event in events)
+
+
+def test_stream_sends_done_for_a_completed_ingest(app_db):
+    from ingest_queue import stream_progress
+
+    ingest_id = _ingest_job(app_db, 'completed')
+    events = list(stream_progress(ingest_id, poll_interval=0.01, max_seconds=5))
+
+    assert events[-1].startswith('event: done\n')
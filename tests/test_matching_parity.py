@@ -0,0 +1,111 @@
+"""Batch scoring must agree with scoring candidates one at a time"""
+
+import random
+import zlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matching_engine import MatchingEngine
+
+JOB_SKILLS = {
+    'languages': ['Python', 'Go', 'SQL'],
+    'frameworks': ['Django', 'React', 'REST API'],
+    'platforms': ['AWS', 'Kubernetes', 'PostgreSQL'],
+    'soft': ['Communication', 'Leadership']
+}
+
+CANDIDATE_SKILLS = [
+    'python', 'Python 3', 'go', 'golang', 'sql', 'MySQL', 'postgres', 'PostgreSQL', 'django',
+    'Django REST', 'react', 'React Native', 'rest', 'api', 'aws', 'AWS Lambda', 'k8s',
+    'kubernetes', 'docker', 'communication', 'leadership', 'team leadership', 'java', 'c', ''
+]
+
+
+class _HashedTrigramNLP:
+    """Deterministic stand-in for spaCy: skills sharing trigrams get similar vectors"""
+
+    def pipe(self, texts):
+        for text in texts:
+            vector = np.zeros(64, dtype=np.float32)
+            padded = f"  {text.lower()} "
+            for start in range(len(padded) - 2):
+                vector[zlib.crc32(padded[start:start + 3].encode()) % 64] += 1
+            yield SimpleNamespace(vector=vector)
+
+
+@pytest.fixture
+def engine():
+    return MatchingEngine(SimpleNamespace(nlp=_HashedTrigramNLP()))
+
+
+def _job(skill_weights=None):
+    return SimpleNamespace(
+        id=None,
+        profile=None,
+        description='Backend Engineer. 4+ years of experience. Bachelor degree required.',
+        skills_required=JOB_SKILLS,
+        skill_weights=skill_weights
+    )
+
+
+def _candidates(count, seed):
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            id=index,
+            extracted_skills=rng.sample(CANDIDATE_SKILLS, rng.randint(0, 8)),
+            experience_years=rng.choice([None, 0, 2, 4, 9]),
+            education=rng.choice([[], ['Bachelor of Science'], ['Master of Engineering'], ['High school']]),
+            raw_text=''
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize('skill_weights', [None, {'Python': 3.0, 'AWS': 0.5, 'Leadership': 0.0}])
+def test_score_batch_matches_single_scoring(engine, skill_weights, caplog):
+    job = _job(skill_weights)
+    candidates = _candidates(200, seed=3)
+
+    semantic_scores = {candidate.id: float(candidate.id % 11) * 9 for candidate in candidates}
+
+    batch = engine.score_batch(candidates, job, semantic_scores=semantic_scores)
+    # An error would make score_batch fall back to single scoring and compare it with itself
+    assert not [record for record in caplog.records if record.levelname == 'ERROR']
+    assert {0.0, 0.8, 1.0} <= {credit for result in batch for credit in result['breakdown']['skill_credits']}
+    for candidate, batch_result in zip(candidates, batch):
+        single = engine.calculate_match_score(candidate, job, semantic_score=semantic_scores[candidate.id])
+        for key in ('skill_credits', 'matched_skills', 'semantic_score'):
+            assert batch_result['breakdown'][key] == single['breakdown'][key], key
+        assert batch_result['skill_gaps'] == single['skill_gaps']
+        for key in ('overall_score', 'skill_score', 'experience_score', 'education_score', 'semantic_score'):
+            assert batch_result[key] == pytest.approx(single[key], abs=0.01), key
+
+
+def test_containment_cache_survives_new_vocabulary(engine):
+    job = _job()
+    # Later batches reuse cached columns and add columns for skills not seen before
+    for seed in range(4):
+        candidates = _candidates(25, seed=seed)
+        batch = engine.score_batch(candidates, job, semantic_scores={})
+        single = [engine.calculate_match_score(candidate, job, semantic_score=0) for candidate in candidates]
+        assert [result['breakdown']['skill_credits'] for result in batch] == \
+            [result['breakdown']['skill_credits'] for result in single]
+
+
+def test_top_k_reuses_stored_semantic_scores(engine):
+    job = _job()
+    candidates = _candidates(60, seed=5)
+    stored = {candidate.id: float(candidate.id % 7) * 10 for candidate in candidates}
+
+    ranked = engine.top_k(candidates, job, 10, semantic_scores=stored)
+    batch = {candidate.id: result for candidate, result in zip(candidates, engine.score_batch(candidates, job, semantic_scores=stored))}
+
+    assert len(ranked) == 10
+    for candidate, result in ranked:
+        assert result['breakdown']['semantic_score'] == stored[candidate.id]
+        assert result['overall_score'] == batch[candidate.id]['overall_score']
+    best = sorted(batch.values(), key=lambda result: -result['overall_score'])[:10]
+    assert [result['overall_score'] for _, result in ranked] == [result['overall_score'] for result in best]
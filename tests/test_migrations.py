@@ -0,0 +1,81 @@
+"""Databases created by the baseline schema are upgraded in place"""
+
+import json
+
+import pytest
+from flask import Flask
+from sqlalchemy import inspect, text
+
+BASELINE_SCHEMA = [
+    """CREATE TABLE job_description (
+        id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, description TEXT NOT NULL,
+        requirements JSON, skills_required JSON, skill_weights JSON, created_at DATETIME
+    )""",
+    """CREATE TABLE candidate (
+        id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL, email VARCHAR(120), phone VARCHAR(20),
+        filename VARCHAR(255) NOT NULL, file_path VARCHAR(500) NOT NULL, raw_text TEXT,
+        extracted_skills JSON, experience_years INTEGER, education JSON, work_experience JSON,
+        created_at DATETIME, job_id INTEGER REFERENCES job_description (id)
+    )""",
+    """CREATE TABLE match_score (
+        id INTEGER PRIMARY KEY, candidate_id INTEGER NOT NULL REFERENCES candidate (id),
+        job_id INTEGER NOT NULL REFERENCES job_description (id), overall_score FLOAT NOT NULL,
+        skill_match_score FLOAT, experience_score FLOAT, education_score FLOAT,
+        detailed_breakdown JSON, skill_gaps JSON, match_justification TEXT, created_at DATETIME
+    )"""
+]
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    """The app's db bound to a fresh SQLite file holding the baseline schema and some rows"""
+    from app import db
+
+    baseline_app = Flask(__name__)
+    baseline_app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'baseline.db'}"
+    db.init_app(baseline_app)
+    with baseline_app.app_context():
+        with db.engine.begin() as connection:
+            for statement in BASELINE_SCHEMA:
+                connection.execute(text(statement))
+            connection.execute(text(
+                "INSERT INTO job_description (id, title, description, skills_required) VALUES (1, 'Backend', 'Python developer', :skills)"
+            ), {'skills': json.dumps({'languages': ['Python', 'SQL']})})
+            for candidate_id in (1, 2):
+                connection.execute(text(
+                    "INSERT INTO candidate (id, name, filename, file_path, raw_text, extracted_skills, job_id) "
+                    "VALUES (:id, :name, 'resume.pdf', '', :raw_text, :skills, 1)"
+                ), {'id': candidate_id, 'name': f"Candidate {candidate_id}",
+                    'raw_text': f"Candidate {candidate_id} resume " * 50, 'skills': json.dumps(['Python', 'SQL'])})
+            # Candidate 1 was scored twice; only the newest score survives
+            for score_id, candidate_id, overall in ((1, 1, 40.0), (2, 2, 55.0), (3, 1, 60.0)):
+                connection.execute(text(
+                    "INSERT INTO match_score (id, candidate_id, job_id, overall_score, detailed_breakdown) "
+                    "VALUES (:id, :candidate_id, 1, :overall, :breakdown)"
+                ), {'id': score_id, 'candidate_id': candidate_id, 'overall': overall,
+                    'breakdown': json.dumps({'semantic_score': overall / 2})})
+        # As on start-up: missing tables first, then the upgrade
+        db.create_all()
+        yield db
+        db.session.remove()
+
+
+def test_baseline_schema_is_upgraded(baseline_db):
+    from migrations import upgrade_schema
+    from models import Candidate, CandidateSkill, JobSkill, MatchScore
+
+    applied = upgrade_schema()
+
+    assert "moved 2 resume texts to candidate_text" in applied
+    assert "removed 1 duplicate match scores" in applied
+    assert 'raw_text' not in {column['name'] for column in inspect(baseline_db.engine).get_columns('candidate')}
+    assert baseline_db.session.get(Candidate, 1).raw_text == "Candidate 1 resume " * 50
+    assert {score.id: score.semantic_score for score in MatchScore.query} == {2: 27.5, 3: 30.0}
+    assert CandidateSkill.query.count() == 4
+    assert JobSkill.query.filter_by(job_id=1).count() == 2
+    assert 'uq_match_score_candidate_job' in {
+        index['name'] for index in inspect(baseline_db.engine).get_indexes('match_score')
+    }
+
+    # Every step checks the live schema, so a second run has nothing to do
+    assert upgrade_schema() == []
@@ -0,0 +1,42 @@
+"""A failed model load is retried after a backoff"""
+
+import sys
+import time
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from model_loader import ModelLoader
+
+
+@pytest.fixture
+def flaky_nlp_processor(monkeypatch):
+    """nlp_processor module whose NLPProcessor fails on the first load"""
+    attempts = []
+
+    def NLPProcessor():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise OSError("model download failed")
+        return SimpleNamespace(nlp=None)
+
+    module = ModuleType('nlp_processor')
+    module.NLPProcessor = NLPProcessor
+    monkeypatch.setitem(sys.modules, 'nlp_processor', module)
+    return attempts
+
+
+def test_failed_load_is_retried_after_backoff(flaky_nlp_processor):
+    loader = ModelLoader(warm_up=False, retry_delay=0.2)
+
+    with pytest.raises(RuntimeError, match="model download failed"):
+        loader.wait()
+    # Inside the backoff the failure is reported without loading again
+    with pytest.raises(RuntimeError):
+        loader.wait()
+    assert len(flaky_nlp_processor) == 1
+
+    time.sleep(0.25)
+    assert loader.matching_engine is not None
+    assert loader.status()['state'] == 'ready'
+    assert len(flaky_nlp_processor) == 2
@@ -0,0 +1,47 @@
+"""Corpus document frequencies of the semantic index"""
+
+import numpy as np
+
+from semantic_index import SemanticIndex
+
+JOB_TEXT = 'Python developer building Django services on PostgreSQL'
+RESUMES = {
+    1: 'Senior Python engineer, Django and PostgreSQL',
+    2: 'Java developer with Spring experience',
+    3: 'Data analyst using Python and SQL'
+}
+
+
+def _document_frequencies(index):
+    return index.corpus.n_docs, index.corpus.doc_freq.copy()
+
+
+def test_rebuilt_job_counts_documents_once():
+    index = SemanticIndex(max_jobs=1)
+    index.rank(1, JOB_TEXT, RESUMES.items())
+    before = _document_frequencies(index)
+    scores = index.rank(1, JOB_TEXT)
+
+    # Evicting job 1 takes its documents out; rebuilding it puts them back once
+    index.rank(2, 'Java developer', [(2, RESUMES[2])])
+    index.rank(1, JOB_TEXT, RESUMES.items())
+
+    n_docs, doc_freq = _document_frequencies(index)
+    assert n_docs == before[0]
+    assert np.array_equal(doc_freq, before[1])
+    assert index.rank(1, JOB_TEXT) == scores
+
+
+def test_counts_only_cached_documents():
+    index = SemanticIndex(max_jobs=2)
+    index.rank(1, JOB_TEXT, RESUMES.items())
+    # Candidate 2 is shared by both jobs and counted once
+    index.rank(2, 'Java developer', [(2, RESUMES[2])])
+    assert index.corpus.n_docs == 2 + len(RESUMES)
+
+    index.forget_job(1)
+    assert index.corpus.n_docs == 2
+    index.forget_job(2)
+    assert index.corpus.n_docs == 0
+    assert not index.corpus.doc_freq.any()
+    assert not index._candidate_refs
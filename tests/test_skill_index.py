@@ -0,0 +1,22 @@
+"""Skill dictionary and postings"""
+
+
+def test_new_skills_roll_back_with_the_caller(app_db):
+    from models import Skill
+    from skill_index import skill_ids
+
+    ids = skill_ids(['Python', ' python ', 'SQL'])
+    assert sorted(ids) == ['python', 'sql']
+    app_db.session.rollback()
+
+    assert Skill.query.count() == 0
+
+
+def test_existing_skills_are_reused(app_db):
+    from skill_index import skill_ids
+
+    first = skill_ids(['Python'])
+    app_db.session.commit()
+
+    assert skill_ids(['PYTHON', 'Go']) == {'python': first['python'], 'go': skill_ids(['go'])['go']}
+    assert skill_ids(['Rust'], create=False) == {}
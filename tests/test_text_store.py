@@ -0,0 +1,41 @@
+"""Resume text compression"""
+
+import pytest
+
+from text_store import compress_text, decompress_text, text_row
+
+RESUME = "Jane Doe — Python developer, Zürich\n" + "Built REST APIs with Django and PostgreSQL. " * 40
+
+
+@pytest.mark.parametrize('codec', ['zlib', 'zstd'])
+def test_text_round_trips(codec):
+    if codec == 'zstd':
+        pytest.importorskip('zstandard')
+
+    stored_codec, content = compress_text(RESUME, codec)
+
+    assert stored_codec == codec
+    assert len(content) < len(RESUME.encode('utf-8'))
+    assert decompress_text(stored_codec, content) == RESUME
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        compress_text(RESUME, 'lz4')
+    with pytest.raises(ValueError):
+        decompress_text('lz4', b'')
+
+
+def test_candidate_text_loads_through_the_model(app_db):
+    from models import Candidate, CandidateText
+
+    candidate = Candidate(name='Jane Doe', filename='jane.pdf', file_path='', raw_text=RESUME)
+    app_db.session.add(candidate)
+    app_db.session.commit()
+    candidate_id = candidate.id
+    app_db.session.expunge_all()
+
+    assert app_db.session.get(Candidate, candidate_id).raw_text == RESUME
+    row = text_row(candidate_id, RESUME)
+    assert decompress_text(row['codec'], row['content']) == RESUME
+    assert app_db.session.get(CandidateText, candidate_id).codec == row['codec']
@@ -0,0 +1,70 @@
+"""
+Compressed storage for resume text
+Resume text is kept in the CandidateText side table rather than on the
+candidate row, compressed with zlib (or zstd when RAW_TEXT_CODEC=zstd and the
+zstandard package is installed; without it, new text falls back to zlib).
+Each row records its codec, so the setting can change without rewriting
+stored text.
+"""
+
+import os
+import zlib
+import logging
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        logging.error("zstandard package not available. Please install it with: pip install zstandard")
+        raise
+    return zstandard
+
+
+def _default_codec():
+    """Codec for new text, checked once so a missing package cannot fail every write"""
+    codec = os.environ.get('RAW_TEXT_CODEC', 'zlib').lower()
+    if codec not in ('zlib', 'zstd'):
+        logging.warning(f"Unknown RAW_TEXT_CODEC {codec}, using zlib")
+        return 'zlib'
+    if codec == 'zstd':
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logging.warning("RAW_TEXT_CODEC=zstd needs the zstandard package, using zlib")
+            return 'zlib'
+    return codec
+
+
+DEFAULT_CODEC = _default_codec()
+
+
+def compress_text(text, codec=None):
+    """(codec, compressed bytes) for a resume text"""
+    codec = codec or DEFAULT_CODEC
+    data = text.encode('utf-8')
+    if codec == 'zstd':
+        return codec, _zstandard().ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == 'zlib':
+        return codec, zlib.compress(data, ZLIB_LEVEL)
+    raise ValueError(f"Unknown raw text codec: {codec}")
+
+
+def decompress_text(codec, data):
+    """Resume text from bytes stored with ``codec``"""
+    if codec == 'zstd':
+        data = _zstandard().ZstdDecompressor().decompress(data)
+    elif codec == 'zlib':
+        data = zlib.decompress(data)
+    else:
+        raise ValueError(f"Unknown raw text codec: {codec}")
+    return data.decode('utf-8')
+
+
+def text_row(candidate_id, text):
+    """CandidateText column values for bulk inserts"""
+    codec, content = compress_text(text)
+    return {'candidate_id': candidate_id, 'codec': codec, 'content': content}
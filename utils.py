@@ -1,8 +1,14 @@
+import io
 import os
 import csv
-import tempfile
+import json
+import uuid
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Background writer for keeping original upload files
+_upload_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='upload-writer')
 
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension"""
@@ -24,54 +30,200 @@ def secure_filename_custom(filename):
     
     return f"{name}_{timestamp}{ext}"
 
-def export_candidates_csv(candidates_data, job_title):
-    """Export candidates data to CSV file"""
+def _write_upload(file_path, data):
     try:
-        # Create temporary file
-        temp_dir = tempfile.gettempdir()
-        filename = f"candidates_{job_title.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        csv_path = os.path.join(temp_dir, filename)
-        
-        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Rank', 'Name', 'Email', 'Mobile Number', 'Overall Score',
-                'Skill Score', 'Experience Score', 'Education Score',
-                'Experience Years', 'Key Skills', 'Skill Gaps',
-                'Match Justification', 'Resume File'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for rank, (candidate, match_score) in enumerate(candidates_data, 1):
-                # Extract key skills (top 5)
-                key_skills = ', '.join(candidate.extracted_skills[:5] if candidate.extracted_skills else [])
-                
-                # Extract skill gaps
-                skill_gaps = ', '.join(match_score.skill_gaps[:5] if match_score.skill_gaps else [])
-                
-                writer.writerow({
-                    'Rank': rank,
-                    'Name': candidate.name or 'Unknown',
-                    'Email': candidate.email or 'N/A',
-                    'Mobile Number': candidate.phone or 'N/A',
-                    'Overall Score': f"{match_score.overall_score:.1f}%",
-                    'Skill Score': f"{match_score.skill_match_score:.1f}%",
-                    'Experience Score': f"{match_score.experience_score:.1f}%",
-                    'Education Score': f"{match_score.education_score:.1f}%",
-                    'Experience Years': candidate.experience_years or 0,
-                    'Key Skills': key_skills,
-                    'Skill Gaps': skill_gaps,
-                    'Match Justification': match_score.match_justification[:200] + '...' if len(match_score.match_justification) > 200 else match_score.match_justification,
-                    'Resume File': candidate.filename
-                })
-        
-        logging.info(f"CSV export created: {csv_path}")
-        return csv_path
-        
+        with open(file_path, 'wb') as f:
+            f.write(data)
     except Exception as e:
-        logging.error(f"Error creating CSV export: {str(e)}")
+        logging.error(f"Error saving upload {file_path}: {str(e)}")
+
+def save_upload_async(file_path, data):
+    """Persist an uploaded file's bytes off the request path"""
+    return _upload_writer.submit(_write_upload, file_path, data)
+
+def upload_path(upload_folder, filename):
+    """Unique path for keeping an upload, so files with the same name don't overwrite each other"""
+    return os.path.join(upload_folder, f"{uuid.uuid4().hex}_{filename}")
+
+EXPORT_FIELDNAMES = [
+    'Rank', 'Name', 'Email', 'Mobile Number', 'Overall Score',
+    'Skill Score', 'Experience Score', 'Education Score',
+    'Experience Years', 'Key Skills', 'Skill Gaps',
+    'Match Justification', 'Resume File'
+]
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet')
+}
+
+
+def _export_csv_row(rank, row):
+    """Human-readable CSV row for one exported (candidate, match score) row"""
+    # Extract key skills (top 5)
+    key_skills = ', '.join(row.extracted_skills[:5] if row.extracted_skills else [])
+    
+    # Extract skill gaps
+    skill_gaps = ', '.join(row.skill_gaps[:5] if row.skill_gaps else [])
+    
+    justification = row.match_justification or ''
+    return [
+        rank,
+        row.name or 'Unknown',
+        row.email or 'N/A',
+        row.phone or 'N/A',
+        f"{row.overall_score:.1f}%",
+        f"{row.skill_match_score or 0:.1f}%",
+        f"{row.experience_score or 0:.1f}%",
+        f"{row.education_score or 0:.1f}%",
+        row.experience_years or 0,
+        key_skills,
+        skill_gaps,
+        justification[:200] + '...' if len(justification) > 200 else justification,
+        row.filename
+    ]
+
+
+def _export_record(rank, row):
+    """Typed record for one exported row, for the analytics formats"""
+    return {
+        'rank': rank,
+        'candidate_id': row.candidate_id,
+        'name': row.name,
+        'email': row.email,
+        'phone': row.phone,
+        'experience_years': row.experience_years,
+        'overall_score': row.overall_score,
+        'skill_score': row.skill_match_score,
+        'experience_score': row.experience_score,
+        'education_score': row.education_score,
+        'skills': list(row.extracted_skills or []),
+        'skill_gaps': list(row.skill_gaps or []),
+        'match_justification': row.match_justification,
+        'resume_file': row.filename
+    }
+
+
+def stream_candidates_csv(rows, chunk_rows=500):
+    """Yield CSV text for exported rows, a chunk of rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDNAMES)
+    
+    for rank, row in enumerate(rows, 1):
+        writer.writerow(_export_csv_row(rank, row))
+        if rank % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue()
+
+
+def stream_candidates_jsonl(rows, chunk_rows=500):
+    """Yield JSON Lines for exported rows, a chunk of rows at a time"""
+    lines = []
+    for rank, row in enumerate(rows, 1):
+        lines.append(json.dumps(_export_record(rank, row)))
+        if len(lines) >= chunk_rows:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+class _ParquetStreamSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to a generator
+
+    ParquetWriter records absolute offsets in the footer, so tell() has to
+    keep counting even though the bytes are drained after every row group.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_candidates_parquet(rows, row_group_size=5000):
+    """Yield a Parquet file for exported rows, one row group at a time"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        logging.error("pyarrow package not available. Please install it with: pip install pyarrow")
         raise
+    
+    schema = pa.schema([
+        ('rank', pa.int64()),
+        ('candidate_id', pa.int64()),
+        ('name', pa.string()),
+        ('email', pa.string()),
+        ('phone', pa.string()),
+        ('experience_years', pa.int64()),
+        ('overall_score', pa.float64()),
+        ('skill_score', pa.float64()),
+        ('experience_score', pa.float64()),
+        ('education_score', pa.float64()),
+        ('skills', pa.list_(pa.string())),
+        ('skill_gaps', pa.list_(pa.string())),
+        ('match_justification', pa.string()),
+        ('resume_file', pa.string())
+    ])
+    
+    sink = _ParquetStreamSink()
+    writer = pq.ParquetWriter(sink, schema, compression='snappy')
+    records = []
+    for rank, row in enumerate(rows, 1):
+        records.append(_export_record(rank, row))
+        if len(records) >= row_group_size:
+            writer.write_table(pa.Table.from_pylist(records, schema=schema))
+            records = []
+            yield sink.drain()
+    
+    if records:
+        writer.write_table(pa.Table.from_pylist(records, schema=schema))
+    writer.close()
+    yield sink.drain()
+
+
+def stream_candidates_export(rows, export_format):
+    """Chunks of an export in the given format (see EXPORT_FORMATS)"""
+    if export_format == 'parquet':
+        return stream_candidates_parquet(rows)
+    if export_format == 'jsonl':
+        return stream_candidates_jsonl(rows)
+    return stream_candidates_csv(rows)
+
+
+def attachment_disposition(filename):
+    """Content-Disposition for a download: ASCII-safe filename plus the RFC 5987 UTF-8 name"""
+    from urllib.parse import quote
+    from werkzeug.http import dump_options_header
+    from werkzeug.utils import secure_filename
+
+    return dump_options_header('attachment', {
+        'filename': secure_filename(filename) or 'download',
+        'filename*': f"UTF-8''{quote(filename, safe='')}"
+    })
 
 def format_score_badge(score):
     """Return Bootstrap badge class based on score"""